@@ -0,0 +1,93 @@
+# coding: utf-8
+""" Benchmark of journal crawlers over the recorded pages in ``tests/fixtures/journals`` (without network).
+
+For each recorded page, it runs the parsing part of the crawler and reports the elapsed time and the peak memory:
+
+- ``.html`` : :meth:`get_contents_soup(soup=...) <gummy.journals.GummyAbstJournal.get_contents_soup>`
+- ``.pdf``  : :meth:`get_pdf_source <gummy.journals.GummyAbstJournal.get_pdf_source>` and :meth:`get_contents_from_pdf_pages <gummy.journals.GummyAbstJournal.get_contents_from_pdf_pages>` (what :meth:`get_contents_pdf <gummy.journals.GummyAbstJournal.get_contents_pdf>` does after downloading.)
+- ``.tex``  : :meth:`get_tex_source_sections <gummy.journals.GummyAbstJournal.get_tex_source_sections>` and :meth:`get_contents_from_tex_sections <gummy.journals.GummyAbstJournal.get_contents_from_tex_sections>` (what :meth:`get_contents_tex <gummy.journals.GummyAbstJournal.get_contents_tex>` does after downloading.)
+
+.. code-block:: shell
+
+    $ python benchmarks/bench_journals.py --json results.json
+    $ # After changing journals.py
+    $ python benchmarks/bench_journals.py --baseline results.json --tolerance 0.2
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from gummy import journals
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+from data import JOURNAL_FIXTURES_DIR, crawl_fixture, load_journal_fixtures, offline
+
+
+def bench_fixture(
+    crawler: journals.GummyAbstJournal, path: str, url: Optional[str] = None, repeat: int = 3
+) -> Dict[str, float]:
+    """Best elapsed time [s] and peak memory [MiB] of :func:`crawl_fixture` ."""
+    elapsed, num_contents = float("inf"), 0
+    for _ in range(repeat):
+        s = time.perf_counter()
+        _, contents = crawl_fixture(crawler, path=path, url=url)
+        elapsed = min(elapsed, time.perf_counter() - s)
+        num_contents = len(contents)
+    # Peak memory is measured separately, because tracemalloc slows down the crawling.
+    tracemalloc.start()
+    crawl_fixture(crawler, path=path, url=url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"time": elapsed, "peak_mem": peak / 2**20, "num_contents": num_contents}
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_journals", add_help=True)
+    parser.add_argument("-J", "--journals", type=str, nargs="*", default=None, help="Journals to benchmark.")
+    parser.add_argument("--fixtures-dir", type=str, default=JOURNAL_FIXTURES_DIR, help="Where pages are recorded.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions.")
+    parser.add_argument("--json", type=str, default=None, help="Path to save results.")
+    parser.add_argument("--baseline", type=str, default=None, help="Path to results to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown against the baseline.")
+    args = parser.parse_args(argv)
+
+    fixtures = load_journal_fixtures(args.fixtures_dir)
+    if args.journals is not None:
+        fixtures = {k: v for k, v in fixtures.items() if k in [j.lower() for j in args.journals]}
+    if len(fixtures) == 0:
+        print(f"No recorded pages in {args.fixtures_dir}. Record them with benchmarks/record_journal_fixtures.py")
+        return 0
+    baseline: Dict[str, Dict[str, float]] = {}
+    if args.baseline is not None:
+        with open(args.baseline, mode="r") as f:
+            baseline = json.load(f)
+
+    results: Dict[str, Dict[str, float]] = {}
+    regressions: List[Tuple[str, float, float]] = []
+    with offline(images_dir=os.path.join(args.fixtures_dir, "images")):
+        for journal_type, pages in fixtures.items():
+            crawler = journals.get(journal_type, verbose=False)
+            for path, url in pages:
+                key = os.path.relpath(path, args.fixtures_dir)
+                results[key] = result = bench_fixture(crawler, path=path, url=url, repeat=args.repeat)
+                line = f"{key:<50} {result['time']:8.3f}[s] {result['peak_mem']:8.1f}[MiB] {result['num_contents']:5d} contents"
+                if key in baseline:
+                    ratio = result["time"] / max(baseline[key]["time"], 1e-9)
+                    line += f" (x{ratio:.2f})"
+                    if ratio > 1 + args.tolerance:
+                        regressions.append((key, baseline[key]["time"], result["time"]))
+                print(line)
+    if args.json is not None:
+        with open(args.json, mode="w") as f:
+            json.dump(results, f, indent=2)
+    for key, before, after in regressions:
+        print(f"Regression: {key} {before:.3f}[s] -> {after:.3f}[s]")
+    return int(len(regressions) > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# coding: utf-8
+""" Benchmark of parser backends for :func:`html2soup <gummy.utils.soup_utils.html2soup>` over saved journal pages.
+
+It measures the parse time of each parser, and the time of ``decompose_soup_tags`` and ``get_sections_from_soup`` of
+the crawler on the parsed soup. If ``selectolax`` is installed, the parse time of its tree (which is not compatible
+with ``BeautifulSoup`` ) is also shown as a reference of a native parser.
+
+.. code-block:: shell
+
+    $ python benchmarks/bench_parsers.py                                  # A generated review article.
+    $ python benchmarks/bench_parsers.py --html nature.html --journal nature
+    $ python benchmarks/bench_parsers.py --html saved_pages/*.html
+"""
+import argparse
+import os
+import time
+from typing import Callable, Optional, Tuple
+
+from gummy import journals
+from gummy.utils import html2soup
+from gummy.utils.soup_utils import SUPPORTED_SOUP_PARSERS
+
+from bench_soup_utils import make_review_article
+
+
+def best_time(func: Callable, repeat: int) -> Tuple[float, object]:
+    """Best elapsed time [s] of ``func()`` and its return value."""
+    best, ret = float("inf"), None
+    for _ in range(repeat):
+        s = time.perf_counter()
+        ret = func()
+        best = min(best, time.perf_counter() - s)
+    return (best, ret)
+
+
+def bench_native(html: bytes, repeat: int) -> Optional[float]:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        return None
+    return best_time(lambda: HTMLParser(html), repeat=repeat)[0]
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(prog="bench_parsers", add_help=True)
+    parser.add_argument("--html", type=str, nargs="*", default=[], help="Paths to saved journal pages.")
+    parser.add_argument("--journal", type=str, default=None, help="Journal crawler used for the pages.")
+    parser.add_argument("--parsers", type=str, nargs="*", default=SUPPORTED_SOUP_PARSERS, help="Parsers to compare.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions.")
+    args = parser.parse_args(argv)
+
+    pages = []
+    for path in args.html:
+        with open(path, mode="rb") as f:
+            pages.append((os.path.basename(path), f.read()))
+    if len(pages) == 0:
+        pages.append(("generated review article", make_review_article(num_sections=100).encode("utf-8")))
+    crawler = None if args.journal is None else journals.get(args.journal, verbose=False)
+
+    for name, html in pages:
+        print(f"{name} ({len(html)/1e6:.2f} MB)")
+        for soup_parser in args.parsers:
+            t_parse, soup = best_time(lambda: html2soup(html=html, parser=soup_parser), repeat=args.repeat)
+            line = f"  {soup_parser:<12}: parse {t_parse:.3f}[s], {len(soup.find_all(True))} tags"
+            if crawler is not None:
+                s = time.perf_counter()
+                soup = crawler.decompose_soup_tags(soup=soup)
+                num_sections = len(crawler.get_sections_from_soup(soup))
+                line += f", crawl {time.perf_counter()-s:.3f}[s], {num_sections} sections"
+            print(line)
+        t_native = bench_native(html, repeat=args.repeat)
+        if t_native is not None:
+            print(f"  {'selectolax':<12}: parse {t_native:.3f}[s] (not BeautifulSoup)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# coding: utf-8
+""" Benchmark of :func:`split_section <gummy.utils.soup_utils.split_section>` and
+:func:`group_soup_with_head <gummy.utils.soup_utils.group_soup_with_head>` against the former implementations,
+which serialized the soup and parsed every slice again.
+
+.. code-block:: shell
+
+    $ python benchmarks/bench_soup_utils.py
+    $ python benchmarks/bench_soup_utils.py --html path/to/review1.html path/to/review2.html
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable
+
+from bs4 import BeautifulSoup
+
+from gummy.utils import group_soup_with_head, split_section
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+from data import legacy_group_soup_with_head, legacy_split_section
+
+
+def make_review_article(num_sections: int = 60, seed: int = 0) -> str:
+    """Make a html which looks like a large review article (many sections, paragraphs, and figures)."""
+    rnd = random.Random(seed)
+    words = "the of cell protein gene expression regulates signaling pathway in mice human tissue".split()
+    html = ['<html><body><article><div class="article-body">']
+    for i in range(num_sections):
+        html.append(f'<section id="sec{i}"><h2>{i+1}. Section</h2>')
+        for j in range(rnd.randint(6, 14)):
+            if rnd.random() < 0.2:
+                html.append(
+                    f'<figure><div class="fig"><img src="/fig/{i}-{j}.png" alt="Fig"/></div>'
+                    f"<figcaption>Figure {i}-{j}. {' '.join(rnd.choices(words, k=30))}</figcaption></figure>"
+                )
+            elif rnd.random() < 0.1:
+                html.append(f"<h3>{i+1}.{j} Subsection</h3>")
+            else:
+                html.append(f"<p>{' '.join(rnd.choices(words, k=rnd.randint(60, 200)))} <sup>{j}</sup></p>")
+        html.append("</section>")
+    html.append("</div></article></body></html>")
+    return "".join(html)
+
+
+def timeit(func: Callable, html: str, repeat: int, **kwargs) -> float:
+    """Best elapsed time [s] of ``func`` (The time for parsing ``html`` is excluded.)"""
+    best = float("inf")
+    for _ in range(repeat):
+        soup = BeautifulSoup(html, features="lxml")
+        s = time.perf_counter()
+        func(soup, **kwargs)
+        best = min(best, time.perf_counter() - s)
+    return best
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(prog="bench_soup_utils", add_help=True)
+    parser.add_argument("--html", type=str, nargs="*", default=[], help="Paths to saved html files.")
+    parser.add_argument("--num-sections", type=int, default=60, help="Number of sections of a generated article.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions.")
+    args = parser.parse_args(argv)
+
+    articles = [(path, open(path, encoding="utf-8").read()) for path in args.html]
+    if len(articles) == 0:
+        articles.append((f"generated ({args.num_sections} sections)", make_review_article(args.num_sections)))
+    isDelimiter = lambda tag: tag.name in ["img", "h3", "figcaption"]
+    for name, html in articles:
+        print(f"{name} ({len(html)/1e6:.2f} MB)")
+        for label, legacy, current, kwargs in [
+            ("split_section", legacy_split_section, split_section, dict(name=isDelimiter)),
+            ("group_soup_with_head", legacy_group_soup_with_head, group_soup_with_head, dict(name="h2")),
+        ]:
+            expected = [str(e) for e in legacy(BeautifulSoup(html, features="lxml"), **kwargs)]
+            actual = [str(e) for e in current(BeautifulSoup(html, features="lxml"), **kwargs)]
+            t_legacy = timeit(legacy, html, repeat=args.repeat, **kwargs)
+            t_current = timeit(current, html, repeat=args.repeat, **kwargs)
+            print(
+                f"  {label:<20}: legacy {t_legacy:.3f}[s], current {t_current:.3f}[s] "
+                f"(x{t_legacy/t_current:.1f}), same output: {expected == actual}"
+            )
+
+
+if __name__ == "__main__":
+    main()
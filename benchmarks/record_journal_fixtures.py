@@ -0,0 +1,113 @@
+# coding: utf-8
+""" Record journal pages in ``tests/fixtures/journals`` for :mod:`bench_journals` and ``tests/test_journal_fixtures.py``
+
+Pages are taken from ``JournalData`` in ``tests/data.py`` , and saved according to the crawling type of each crawler:
+
+- ``soup`` : The page source as ``<journal>/<n>.html`` , and its images in the shared image cache ``images/`` .
+- ``pdf``  : The PDF file as ``<journal>/<n>.pdf`` .
+- ``tex``  : The main TeX source (whose inputs are inlined) as ``<journal>/<n>.tex`` .
+
+The url of each page is written in ``<journal>/urls.json`` .
+
+.. code-block:: shell
+
+    $ python benchmarks/record_journal_fixtures.py -J nature arxiv
+    $ python benchmarks/record_journal_fixtures.py -J nature --driver  # Use Selenium for pages rendered by javascript.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+from typing import Dict, Optional
+
+from gummy import journals
+from gummy.utils import (
+    assemble_tex_project,
+    canonicalize,
+    download_file,
+    download_utils,
+    get_driver,
+    get_session,
+    is_compressed,
+)
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+from data import JOURNAL_FIXTURES_DIR, JournalData
+
+
+def record_page(crawler: journals.GummyAbstJournal, url: str, path: str, crawl_type: str, driver=None) -> Optional[str]:
+    """Record the page of ``url`` as ``path + ext`` , and return the saved path."""
+    if crawl_type == "soup":
+        cano_url = canonicalize(url=crawler.get_soup_url(url), driver=driver)
+        if driver is None:
+            html = get_session().get(url=cano_url).content
+        else:
+            driver.get(cano_url)
+            crawler.make_elements_visible(driver)
+            html = driver.page_source.encode("utf-8")
+        with open(path + ".html", mode="wb") as f:
+            f.write(html)
+        # Images are recorded in the image cache (``download_utils.IMAGE_CACHE_DIR``)
+        crawler.crawling_logs = {}
+        crawler.get_contents_soup(url=cano_url, driver=None)
+        return path + ".html"
+    dirname = os.path.dirname(path)
+    if crawl_type == "pdf":
+        downloaded = download_file(url=crawler.get_pdf_url(url), dirname=dirname)
+        ext = ".pdf"
+    else:
+        downloaded = download_file(url=crawler.get_tex_url(url), dirname=dirname)
+        ext = ".tex"
+        if is_compressed("." + downloaded.split(".")[-1]):
+            # Record the main file whose inputs are inlined.
+            tex = assemble_tex_project(downloaded)
+            os.remove(downloaded)
+            with open(path + ext, mode="w", encoding="utf-8") as f:
+                f.write(tex)
+            return path + ext
+    shutil.move(downloaded, path + ext)
+    return path + ext
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(prog="record_journal_fixtures", add_help=True)
+    parser.add_argument("-J", "--journals", type=str, nargs="*", default=None, help="Journals to record. (default=all)")
+    parser.add_argument("--crawl-type", type=str, default=None, help="Crawling type. (default=crawler's one)")
+    parser.add_argument("--fixtures-dir", type=str, default=JOURNAL_FIXTURES_DIR, help="Where pages are recorded.")
+    parser.add_argument("--driver", action="store_true", help="Whether to get page sources with Selenium.")
+    args = parser.parse_args(argv)
+
+    journal_types = [j.lower() for j in args.journals] if args.journals is not None else list(JournalData.keys())
+    download_utils.IMAGE_CACHE_DIR = os.path.join(args.fixtures_dir, "images")
+    driver = get_driver() if args.driver else None
+    try:
+        for journal_type in journal_types:
+            crawler = journals.get(journal_type, verbose=False)
+            crawl_type = args.crawl_type or crawler.crawl_type
+            journal_dir = os.path.join(args.fixtures_dir, journal_type)
+            os.makedirs(journal_dir, exist_ok=True)
+            urls_path = os.path.join(journal_dir, "urls.json")
+            urls: Dict[str, str] = {}
+            if os.path.exists(urls_path):
+                with open(urls_path, mode="r") as f:
+                    urls = json.load(f)
+            for i, url in enumerate(JournalData.get(journal_type, [])):
+                try:
+                    path = record_page(
+                        crawler, url=url, path=os.path.join(journal_dir, str(i)), crawl_type=crawl_type, driver=driver
+                    )
+                except Exception as e:
+                    print(f"[{journal_type}] Could not record {url}: {e}")
+                    continue
+                urls[os.path.basename(path)] = url
+                print(f"[{journal_type}] Recorded {url} as {path}")
+            with open(urls_path, mode="w") as f:
+                json.dump(urls, f, indent=2)
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
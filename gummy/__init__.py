@@ -9,5 +9,21 @@ __author_twitter__ = "https://twitter.com/cabernet_rock"
 __author_email__ = "cabernet.rock@gmail.com"
 __url__ = "https://github.com/iwasakishuto/Translation-Gummy"
 
-from . import gateways, journals, models, translators
-from .models import TranslationGummy
+import importlib
+from typing import Any, List
+
+# Submodules are imported when they are accessed for the first time, so that ``import gummy`` (or ``gummy.utils``)
+# does not pay for all journal crawlers, translators, and gateways.
+_SUBMODULES: List[str] = ["gateways", "journals", "models", "translators"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name == "TranslationGummy":
+        return importlib.import_module(".models", __name__).TranslationGummy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals().keys()) + _SUBMODULES + ["TranslationGummy"])
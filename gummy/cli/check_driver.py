@@ -8,20 +8,22 @@ import imp
 import sys
 
 from ..utils.coloring_utils import toGREEN
-from ..utils.driver_utils import DRIVER_TYPE, SUPPORTED_DRIVER_TYPES, get_driver
+from ..utils.driver_utils import SUPPORTED_DRIVER_TYPES, get_driver, get_driver_type
 
 
 def check_driver(argv=sys.argv[1:]):
     """Translate journals.
 
     Args:
-        driver-type (str) : The type of driver you want to find out.
+        driver-type (str) : The type of driver you want to find out. (default= :meth:`get_driver_type() <gummy.utils.driver_utils.get_driver_type>` )
+        --refresh (bool)  : Whether to probe all supported drivers again and update the memoized driver type.
 
     Note:
         When you run from the command line, execute as follows::
 
         $ gummy-driver -T local
         $ gummy-driver -T remote
+        $ gummy-driver --refresh
 
     """
     parser = argparse.ArgumentParser(prog="gummy-driver", add_help=True)
@@ -29,11 +31,18 @@ def check_driver(argv=sys.argv[1:]):
         "-T",
         "--driver-type",
         type=str,
-        default=DRIVER_TYPE,
+        default=None,
         choices=SUPPORTED_DRIVER_TYPES,
         help="URL of a page you want to create a pdf.",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Whether to probe all supported drivers again and update the memoized one.",
+    )
     args = parser.parse_args(argv)
 
+    if args.refresh:
+        get_driver_type(refresh=True)
     driver = get_driver(driver_type=args.driver_type)
     print(toGREEN("If you see this message, it's OK :)"))
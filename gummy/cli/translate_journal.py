@@ -14,6 +14,7 @@ from ..models import TranslationGummy
 from ..utils._path import TEMPLATES_DIR
 from ..utils.driver_utils import get_chrome_options
 from ..utils.generic_utils import DictParamProcessor, ListParamProcessorCreate
+from ..utils.soup_utils import SUPPORTED_SOUP_PARSERS, set_soup_parser
 
 
 def translate_journal(argv=sys.argv[1:]):
@@ -32,6 +33,10 @@ def translate_journal(argv=sys.argv[1:]):
         --save-html (bool)          : Whether you want to save an intermediate html file. (default= ``False`` )
         --quiet (bool)              : Whether you want to be quiet or not. (default= ``False`` )
         --translator-verbose (bool) : Whether you want to print translator's output or not. (default= ``False`` )
+        --num-drivers (int)         : Number of drivers used to translate contents in parallel. (default= ``1`` )
+        --num-tabs (int)            : Number of tabs in which each driver translates chunks concurrently. (default= ``1`` )
+        --soup-parser (str)         : A parser for page sources, ``"html.parser"`` , ``"lxml"`` or ``"html5lib"`` . (default= ``None`` )
+        --pdf-jobs (int)            : Number of processes to analyze PDF pages. If ``-1``, use all cores. (default= ``1`` )
         -GP/--gateway-params (dict) : Specify the value required to pass through the gateway. You can specify by ``-GP username=USERNAME -GP password=PASSWORD`` (default= ``{}`` )
         --highlight (bool)          : Whetehr you want to highlight the PDF or not. (default=False)")
         --ignore_length (int)       : If the number of English characters is smaller than ``ignore_length`` , do not highlight.
@@ -82,6 +87,22 @@ def translate_journal(argv=sys.argv[1:]):
         help="Whether you want translator to be quiet or not. (default=False)",
     )
     parser.add_argument("--bulk", action="store_true", help="Whether to prioritize speed or readability.")
+    parser.add_argument(
+        "--num-drivers", type=int, default=1, help="Number of drivers used to translate contents in parallel."
+    )
+    parser.add_argument(
+        "--num-tabs", type=int, default=1, help="Number of tabs in which each driver translates chunks concurrently."
+    )
+    parser.add_argument(
+        "--soup-parser",
+        type=str,
+        default=None,
+        choices=SUPPORTED_SOUP_PARSERS,
+        help="Global parser for page sources. Journals which specify their own parser keep using it.",
+    )
+    parser.add_argument(
+        "--pdf-jobs", type=int, default=1, help="Number of processes to analyze PDF pages. If -1, use all cores."
+    )
     # Gateway kwargs
     parser.add_argument(
         "-GP",
@@ -124,10 +145,16 @@ def translate_journal(argv=sys.argv[1:]):
     delete_html = not args.save_html
     verbose = not args.quiet
     translator_verbose = not args.quiet_translator
+    num_drivers = args.num_drivers
+    num_tabs = args.num_tabs
+    soup_parser = args.soup_parser
+    pdf_n_jobs = args.pdf_jobs
     gateway_params = args.gateway_params
     highlight = args.highlight
     ignore_length = args.ignore_length
     highlight_color = args.highlight_color
+    if soup_parser is not None:
+        set_soup_parser(soup_parser)
     if tpl_path is None:
         searchpath = TEMPLATES_DIR
         template = "paper.html"
@@ -135,7 +162,7 @@ def translate_journal(argv=sys.argv[1:]):
         *searchpath, template = tpl_path.split("/")
         searchpath = "/".join(searchpath) or "."
 
-    model = TranslationGummy(
+    with TranslationGummy(
         chrome_options=chrome_options,
         undetected=undetected,
         gateway=gateway,
@@ -145,30 +172,33 @@ def translate_journal(argv=sys.argv[1:]):
         to_lang=to_lang,
         verbose=verbose,
         translator_verbose=translator_verbose,
-    )
-    if highlight:
-        pdf_path = model.highlight(
-            url=url,
-            path=pdf_path,
-            out_dir=out_dir,
-            journal_type=journal_type,
-            gateway=gateway,
-            ignore_length=ignore_length,
-            highlight_color=highlight_color,
-            **gateway_params,
-        )
-    else:
-        pdf_path = model.toPDF(
-            url=url,
-            path=pdf_path,
-            out_dir=out_dir,
-            correspond=correspond,
-            journal_type=journal_type,
-            crawl_type=crawl_type,
-            gateway=gateway,
-            searchpath=searchpath,
-            template=template,
-            delete_html=delete_html,
-            **gateway_params,
-        )
+        num_drivers=num_drivers,
+        num_tabs=num_tabs,
+        pdf_n_jobs=pdf_n_jobs,
+    ) as model:
+        if highlight:
+            pdf_path = model.highlight(
+                url=url,
+                path=pdf_path,
+                out_dir=out_dir,
+                journal_type=journal_type,
+                gateway=gateway,
+                ignore_length=ignore_length,
+                highlight_color=highlight_color,
+                **gateway_params,
+            )
+        else:
+            pdf_path = model.toPDF(
+                url=url,
+                path=pdf_path,
+                out_dir=out_dir,
+                correspond=correspond,
+                journal_type=journal_type,
+                crawl_type=crawl_type,
+                gateway=gateway,
+                searchpath=searchpath,
+                template=template,
+                delete_html=delete_html,
+                **gateway_params,
+            )
     return pdf_path
@@ -59,7 +59,7 @@ def translate_text(argv=sys.argv[1:]):
     verbose = not args.quiet
     translator_verbose = not args.quiet_translator
 
-    model = TranslationGummy(
+    with TranslationGummy(
         chrome_options=chrome_options,
         gateway="useless",
         translator=translator,
@@ -68,6 +68,6 @@ def translate_text(argv=sys.argv[1:]):
         to_lang=to_lang,
         verbose=verbose,
         translator_verbose=translator_verbose,
-    )
-    japanese = model.translate(query=query)
+    ) as model:
+        japanese = model.translate(query=query)
     return japanese
@@ -23,19 +23,17 @@ You can easily get (import) ``Journal Crawler Class`` by the following ways.
 .. |twitter badge| image:: https://img.shields.io/badge/twitter-Requests-1da1f2?style=flat-square&logo=twitter
    :target: https://www.twitter.com/messages/compose?recipient_id=1042783905697288193&text=Please%20support%20this%20journal%3A%20
 """
+import copy
 import os
 import re
 import urllib
 from abc import ABCMeta
 from dataclasses import dataclass
 from posixpath import split
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypedDict, Union
 
-import requests
 from bs4 import BeautifulSoup
 from bs4.element import Tag
-from pdfminer.layout import LTItem
-from pylatexenc.latex2text import LatexNodes2Text
 from requests.exceptions import RequestException
 from selenium.webdriver.remote.webdriver import WebDriver
 
@@ -43,23 +41,38 @@ from . import gateways
 from .utils._exceptions import JournalTypeIndistinguishableError
 from .utils._path import GUMMY_DIR
 from .utils._type import T_PAPER_CONTENT, T_PAPER_TITLE_CONTENTS
+from .utils.cache_utils import PDFLayoutCache
 from .utils.coloring_utils import toACCENT, toBLUE, toGREEN, toRED
-from .utils.compress_utils import extract_from_compressed, is_compressed
-from .utils.download_utils import download_file, src2base64
+from .utils.download_utils import download_file, get_img_url, match2path, prefetch_images, src2base64
 from .utils.driver_utils import scrollDown, try_find_element_click, wait_until_all_elements
-from .utils.generic_utils import flatten_dual, handleKeyError, mk_class_get, now_str, str_strip, verbose2print
-from .utils.journal_utils import canonicalize, whichJournal
+from .utils.generic_utils import (
+    LazyClassRegistry,
+    flatten_dual,
+    handleKeyError,
+    mk_class_get,
+    now_str,
+    str_strip,
+    verbose2print,
+)
+from .utils.http_utils import get_session
+from .utils.journal_utils import canonicalize, pop_canonical_body, whichJournal
 from .utils.outfmt_utils import sanitize_filename
-from .utils.pdf_utils import get_pdf_contents
+from .utils.pdf_utils import PDFImageRef, get_pdf_num_pages, iter_pdf_contents
 from .utils.soup_utils import (
+    decompose_soup_tags,
     find_target_id,
     find_target_text,
     group_soup_with_head,
+    html2soup,
     kwargs2tag,
     replace_soup_tag,
     split_section,
     str2soup,
 )
+from .utils.tex_utils import assemble_tex_project, split_tex_sections, tex_sections_to_text
+
+if TYPE_CHECKING:
+    from pdfminer.layout import LTItem
 
 SUPPORTED_CRAWL_TYPES: List[str] = ["soup", "tex", "pdf"]
 
@@ -84,9 +97,12 @@ class GummyAbstJournal(metaclass=ABCMeta):
         - :meth:`organize_soup_section(self, section, head="", head_is_not_added=True) <gummy.journals.GummyAbstJournal.organize_soup_section>`
     - if ``crawl_type`` == ``"pdf"``:
         - :meth:`get_contents_pdf(self, url, driver=None) <gummy.journals.GummyAbstJournal.get_contents_pdf>`
+        - :meth:`iter_contents_pdf(self, url, driver=None) <gummy.journals.GummyAbstJournal.iter_contents_pdf>`
         - :meth:`get_pdf_source(self, url, driver=None) <gummy.journals.GummyAbstJournal.get_pdf_source>`
+        - :meth:`iter_pdf_source(self, url, driver=None) <gummy.journals.GummyAbstJournal.iter_pdf_source>`
         - :meth:`get_title_from_pdf(self, pdf_gen) <gummy.journals.GummyAbstJournal.get_title_from_pdf>`
         - :meth:`get_contents_from_pdf_pages(self, pdf_pages) <gummy.journals.GummyAbstJournal.get_contents_from_pdf_pages>`
+        - :meth:`get_contents_from_pdf_page(self, page_texts, page_no) <gummy.journals.GummyAbstJournal.get_contents_from_pdf_page>`
 
     Args:
         crawl_type (str)            : Crawling type, if you not specify, use recommended crawling type.
@@ -100,8 +116,21 @@ class GummyAbstJournal(metaclass=ABCMeta):
 
     Attributes:
         crawling_logs (dict)        : Crawling logs.
+        max_image_workers (int)     : Maximum number of images downloaded at the same time. (default= ``8`` )
+        soup_parser (str)           : A parser for the page source. If ``None``, use the global one. See :func:`set_soup_parser <gummy.utils.soup_utils.set_soup_parser>` (default= ``None`` )
+        pdf_n_jobs (int)            : Number of processes to analyze PDF pages. If ``-1``, use all cores. (default= ``1`` )
+        use_pdf_layout_cache (bool) : Whether to reuse the layout analysis results of the same PDF. See :class:`PDFLayoutCache <gummy.utils.cache_utils.PDFLayoutCache>` (default= ``True`` )
+        pdf_image_mode (str)        : How to handle images in PDF. See :func:`parser_pdf_pages <gummy.utils.pdf_utils.parser_pdf_pages>` (default= ``"ref"`` )
+        tex_n_jobs (int)            : Number of processes to convert TeX sections to plain text. If ``-1``, use all cores. (default= ``1`` )
     """
 
+    max_image_workers: int = 8
+    soup_parser: Optional[str] = None
+    pdf_n_jobs: int = 1
+    use_pdf_layout_cache: bool = True
+    pdf_image_mode: str = "ref"
+    tex_n_jobs: int = 1
+
     def __init__(
         self,
         crawl_type: str = "soup",
@@ -193,6 +222,34 @@ class GummyAbstJournal(metaclass=ABCMeta):
         title, contents = get_contents_func(url=url, driver=driver, **gatewaykwargs)
         return (title, contents)
 
+    def iter_contents(
+        self, url: str, driver: Optional[WebDriver] = None, crawl_type: Optional[str] = None, **gatewaykwargs
+    ) -> Iterator[List[T_PAPER_CONTENT]]:
+        """Iterate contents in chunks. If ``crawl_type`` is ``"pdf"`` , each chunk is a page which is yielded as soon as
+        its layout is analyzed (See :meth:`iter_contents_pdf <gummy.journals.GummyAbstJournal.iter_contents_pdf>` ),
+        otherwise all contents are yielded at once. The title is stored in ``crawling_logs["title"]`` after the last chunk.
+
+        Args:
+            url (str)            : URL of a paper or ``path/to/local.file``.
+            driver (WebDriver)   : Selenium WebDriver.
+            crawl_type (str)     : Crawling type, if you not specify, use recommended crawling type.
+            gatewaykwargs (dict) : Gateway keywargs. See :meth:`passthrough <gummy.gateways.GummyAbstGateWay.passthrough>`.
+
+        Yields:
+            list : A chunk of contents.
+        """
+        self._store_crawling_logs(url=url, start_time=now_str())
+        crawl_type = crawl_type or self.crawl_type
+        handleKeyError(lst=SUPPORTED_CRAWL_TYPES, crawl_type=crawl_type)
+        self.print(f"Crawling Type: {toACCENT(crawl_type)}")
+        if crawl_type == "pdf":
+            yield from self.iter_contents_pdf(url=url, driver=driver)
+        else:
+            get_contents_func = getattr(self, f"get_contents_{crawl_type}")
+            title, contents = get_contents_func(url=url, driver=driver, **gatewaykwargs)
+            self._store_crawling_logs(title=title)
+            yield contents
+
     def _get_contents_from_sections_base(self, sections):
         """Base method for ``get_contents_from_XXX``"""
         contents = []
@@ -231,10 +288,27 @@ class GummyAbstJournal(metaclass=ABCMeta):
             soup = self.decompose_soup_tags(soup=soup)
         title = self.get_title_from_soup(soup)
         soup_sections = self.get_sections_from_soup(soup)
+        self.prefetch_section_images(soup_sections)
         contents = self.get_contents_from_soup_sections(soup_sections)
         self._store_crawling_logs(soup=soup, title=title, soup_sections=soup_sections, contents=contents)
         return (title, contents)
 
+    def prefetch_section_images(self, soup_sections: List[BeautifulSoup]) -> None:
+        """Download all images in ``soup_sections`` concurrently, so that :meth:`organize_soup_section <gummy.journals.GummyAbstJournal.organize_soup_section>`
+        does not have to wait for them one by one. See :meth:`prefetch_images <gummy.utils.download_utils.prefetch_images>` .
+
+        Args:
+            soup_sections (list) : Each element is (bs4.element.Tag)
+        """
+        base = self.crawling_logs.get("cano_url")
+        urls = [
+            get_img_url(src=img, base=base)
+            for section in soup_sections
+            for img in section.find_all(name="img")
+            if any([img.get(attr) for attr in ["src", "data-src", "data-original"]])
+        ]
+        prefetch_images(urls=urls, max_workers=self.max_image_workers, verbose=self.verbose)
+
     def _get_soup_sections(
         self,
         url: Optional[str] = None,
@@ -267,7 +341,7 @@ class GummyAbstJournal(metaclass=ABCMeta):
         self._store_crawling_logs(cano_url=cano_url)
         # If driver is None, we could not use gateway service.
         if driver is None:
-            html = requests.get(url=cano_url).content
+            html = pop_canonical_body(cano_url) or get_session().get(url=cano_url).content
             self.print(f"Get HTML content from {toBLUE(cano_url)}")
         else:
             driver, fmt_url_func = self.gateway.passthrough(
@@ -280,7 +354,7 @@ class GummyAbstJournal(metaclass=ABCMeta):
             self.make_elements_visible(driver)
             html = driver.page_source.encode("utf-8")
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = html2soup(html=html, parser=self.soup_parser)
         soup = self.decompose_soup_tags(soup=soup)
         return soup
 
@@ -303,12 +377,9 @@ class GummyAbstJournal(metaclass=ABCMeta):
             tuple (BeautifulSoup, dict) : soup, a dict showing the number of decomposed tags.
         """
         self.print(f"\nDecompose unnecessary tags.\n{'='*30}")
-        decoCounts = {}
-        for decoKwargs in self.DecomposeSoupTags:
-            decoTags = soup.find_all(**decoKwargs)
-            self.print(f"Decomposed {len(decoTags)} {kwargs2tag(**decoKwargs)} tag{'s' if len(decoTags)!=1 else ''}.")
-            for decoTag in decoTags:
-                decoTag.decompose()
+        decoCounts = decompose_soup_tags(soup=soup, rules=self.DecomposeSoupTags)
+        for decoKwargs, decoCount in zip(self.DecomposeSoupTags, decoCounts):
+            self.print(f"Decomposed {decoCount} {kwargs2tag(**decoKwargs)} tag{'s' if decoCount!=1 else ''}.")
         return soup
 
     def register_decompose_soup_tags(self, **kwargs) -> None:
@@ -458,13 +529,14 @@ class GummyAbstJournal(metaclass=ABCMeta):
         Returns:
             tuple (str, dict) : (title, content)
         """
-        tex = self.get_tex_source(url=self.get_tex_url(url), driver=driver)
+        tex_source_sections = self.get_tex_source_sections(url=self.get_tex_url(url), driver=driver)
+        tex = "".join(tex_source_sections)
         title = self.get_title_from_tex(tex)
         # NOTE: If we can scrape "title" from soup, please prioritize it.
         if self.get_pdf_url(url) != self.get_soup_url(url):
             soup = self.get_soup_source(url=self.get_soup_url(url), driver=None)
             title = self.get_title_from_soup(soup)
-        tex_sections = self.get_sections_from_tex(tex)
+        tex_sections = self.get_sections_from_tex(tex_source_sections)
         contents = self.get_contents_from_tex_sections(tex_sections)
         self._store_crawling_logs(tex=tex, title=title, tex_sections=tex_sections, contents=contents)
         return (title, contents)
@@ -479,20 +551,32 @@ class GummyAbstJournal(metaclass=ABCMeta):
         Returns:
             str : Plain text in tex source.
         """
+        return "".join(self.get_tex_source_sections(url=url, driver=driver))
+
+    def get_tex_source_sections(self, url: str, driver: Optional[WebDriver] = None) -> List[str]:
+        """Download and get tex source from url, as plain text of each ``\\section`` .
+
+        The main file of the project is found, and ``\\input`` / ``\\include`` are inlined
+        (See :func:`assemble_tex_project <gummy.utils.tex_utils.assemble_tex_project>` ). Then, the document is split at
+        ``\\section`` , and the sections are converted to plain text in ``tex_n_jobs`` processes.
+
+        Args:
+            url (str)            : URL of a tex source (or a compressed TeX project) or ``path/to/local.tex``.
+            driver (WebDriver)   : Selenium WebDriver.
+
+        Returns:
+            list : Plain text of each section in tex source.
+        """
         if not os.path.exists(url):
             path = download_file(url=url, dirname=GUMMY_DIR)
-            ext = "." + path.split(".")[-1]
-            if is_compressed(ext):
-                extracted_file_paths = extract_from_compressed(path, ext=".tex", dirname=GUMMY_DIR)
-                path = extracted_file_paths[0]
         else:
             path = url
-        with open(path, mode="r") as ftex:
-            tex = LatexNodes2Text().latex_to_text(ftex.read())
-        for decompose in self.DecomposeTexTags:
-            tex = tex.replace(decompose, "")
-        tex = re.sub("[ 　]+", " ", tex)
-        return tex
+        tex_sections = tex_sections_to_text(split_tex_sections(assemble_tex_project(path)), n_jobs=self.tex_n_jobs)
+        for i, tex in enumerate(tex_sections):
+            for decompose in self.DecomposeTexTags:
+                tex = tex.replace(decompose, "")
+            tex_sections[i] = re.sub("[ 　]+", " ", tex)
+        return tex_sections
 
     def get_title_from_tex(self, tex: str) -> str:
         """Get a title from tex source.
@@ -506,16 +590,16 @@ class GummyAbstJournal(metaclass=ABCMeta):
         title = "title"
         return title
 
-    def get_sections_from_tex(self, tex: str) -> List[str]:
+    def get_sections_from_tex(self, tex: Union[str, List[str]]) -> List[str]:
         """Get sections from tex source.
 
         Args:
-            tex (str) : Plain text in tex source.
+            tex (str, list) : Plain text in tex source, or plain text of each section. (See :meth:`get_tex_source_sections <gummy.journals.GummyAbstJournal.get_tex_source_sections>` )
 
         Returns:
             list: Each element is plain text (str)
         """
-        sections = [tex]
+        sections = [tex] if isinstance(tex, str) else list(tex)
         return sections
 
     def get_contents_from_tex_sections(self, tex_sections: List[str]) -> List[T_PAPER_CONTENT]:
@@ -559,17 +643,44 @@ class GummyAbstJournal(metaclass=ABCMeta):
         Returns:
             tuple (str, dict) : (title, content)
         """
-        pdf_pages = self.get_pdf_source(url=self.get_pdf_url(url), driver=driver)
+        contents = []
+        for page_contents in self.iter_contents_pdf(url=url, driver=driver):
+            contents.extend(page_contents)
+        return (self.crawling_logs["title"], contents)
+
+    def iter_contents_pdf(self, url: str, driver: Optional[WebDriver] = None) -> Iterator[List[T_PAPER_CONTENT]]:
+        """Iterate contents of each page as soon as its layout is analyzed. This is the generator version of
+        :meth:`get_contents_pdf <gummy.journals.GummyAbstJournal.get_contents_pdf>` , and the title, pages and contents
+        are stored in ``crawling_logs`` after the last page.
+
+        Args:
+            url (str)            : URL of a paper or ``path/to/local.pdf``.
+            driver (WebDriver)   : Selenium WebDriver.
+
+        Yields:
+            list : Contents of a page.
+        """
+        pdf_url = self.get_pdf_url(url)
+        if isinstance(pdf_url, str):
+            # Download only once, because the number of pages is counted before the layout analysis.
+            pdf_url = match2path(pdf_url, dirname=GUMMY_DIR)
+        len_pdf_pages = get_pdf_num_pages(pdf_url)
+        digit = len(str(len_pdf_pages))
+        pdf_pages, contents = [], []
+        for i, page_texts in enumerate(self.iter_pdf_source(url=pdf_url, driver=driver)):
+            page_no = f"Page.{i+1:>0{digit}}/{len_pdf_pages}"
+            page_contents = self.get_contents_from_pdf_page(page_texts, page_no=page_no)
+            pdf_pages.append(page_texts)
+            contents.extend(page_contents)
+            yield page_contents
         title = self.get_title_from_pdf(pdf_pages)
         # NOTE: If we can scrape "title" from soup, please prioritize it.
         if self.get_pdf_url(url) != self.get_soup_url(url):
             soup = self.get_soup_source(url=self.get_soup_url(url), driver=None)
             title = self.get_title_from_soup(soup)
-        contents = self.get_contents_from_pdf_pages(pdf_pages)
         self._store_crawling_logs(title=title, pdf_pages=pdf_pages, contents=contents)
-        return (title, contents)
 
-    def get_pdf_source(self, url: str, driver: Optional[WebDriver] = None) -> List[Tuple[str, LTItem]]:
+    def get_pdf_source(self, url: str, driver: Optional[WebDriver] = None) -> List[Tuple[str, "LTItem"]]:
         """Download and get PDF source from url.
 
         Args:
@@ -579,10 +690,22 @@ class GummyAbstJournal(metaclass=ABCMeta):
         Returns:
             list : Each element is a list which contains [text, bbox(x0,y0,x1,y1)]
         """
-        pdf_pages = get_pdf_contents(file=url)
-        return pdf_pages
+        return list(self.iter_pdf_source(url=url, driver=driver))
+
+    def iter_pdf_source(self, url: str, driver: Optional[WebDriver] = None) -> Iterator[List[Tuple[str, "LTItem"]]]:
+        """Download PDF from url, and iterate its pages as soon as each layout is analyzed.
+
+        Args:
+            url (str)            : URL of a PDF file or ``path/to/local.pdf``.
+            driver (WebDriver)   : Selenium WebDriver.
+
+        Yields:
+            list : Contents of a page. Each element is a list which contains [text, bbox(x0,y0,x1,y1)]
+        """
+        cache = PDFLayoutCache() if self.use_pdf_layout_cache else None
+        yield from iter_pdf_contents(file=url, n_jobs=self.pdf_n_jobs, cache=cache, image_mode=self.pdf_image_mode)
 
-    def get_title_from_pdf(self, pdf_pages: List[Tuple[str, LTItem]]) -> str:
+    def get_title_from_pdf(self, pdf_pages: List[Tuple[str, "LTItem"]]) -> str:
         """Get title from PDF source.
 
         Args:
@@ -594,7 +717,7 @@ class GummyAbstJournal(metaclass=ABCMeta):
         title = "title"
         return title
 
-    def get_contents_from_pdf_pages(self, pdf_pages: List[Tuple[str, LTItem]]) -> Tuple[str, T_PAPER_CONTENT]:
+    def get_contents_from_pdf_pages(self, pdf_pages: List[Tuple[str, "LTItem"]]) -> Tuple[str, T_PAPER_CONTENT]:
         """Get contents from each page.
 
         Args:
@@ -608,16 +731,29 @@ class GummyAbstJournal(metaclass=ABCMeta):
         digit = len(str(len_pdf_pages))
         for i, page_texts in enumerate(pdf_pages):
             page_no = f"Page.{i+1:>0{digit}}/{len_pdf_pages}"
-            header = {"head": page_no, "raw": "", "bbox": (0, 0, 1, 1)}
-            contents.append(header)
-            for text, bbox in page_texts:
-                content = {"raw": "", "bbox": bbox}
-                if text.startswith('<img src="data:image/jpeg;base64'):
-                    content["img"] = text
-                else:
-                    content["body"] = dict(raw=text.replace("-\n", "").replace("\n", " "))
-                contents.append(content)
-            self.print(page_no)
+            contents.extend(self.get_contents_from_pdf_page(page_texts, page_no=page_no))
+        return contents
+
+    def get_contents_from_pdf_page(self, page_texts: List[Tuple[str, "LTItem"]], page_no: str) -> List[T_PAPER_CONTENT]:
+        """Get contents from a page.
+
+        Args:
+            page_texts (list) : Each element is a list which contains [text, bbox(x0,y0,x1,y1)]
+            page_no (str)     : Page number shown as a header. (ex. ``"Page.01/12"`` )
+
+        Returns:
+            list : Contents of the page. The first one is the header.
+        """
+        contents = [{"head": page_no, "raw": "", "bbox": (0, 0, 1, 1)}]
+        for text, bbox in page_texts:
+            content = {"raw": "", "bbox": bbox}
+            if isinstance(text, PDFImageRef) or text.startswith('<img src="data:image/jpeg;base64'):
+                # The <img> tag of PDFImageRef is created when it is rendered.
+                content["img"] = dict(src=text)
+            else:
+                content["body"] = dict(raw=text.replace("-\n", "").replace("\n", " "))
+            contents.append(content)
+        self.print(page_no)
         return contents
 
 
@@ -637,12 +773,12 @@ class PDFCrawler(GummyAbstJournal):
     def get_pdf_url(url: str) -> str:
         return url
 
-    def get_contents_pdf(self, url: str, driver: Optional[WebDriver] = None) -> T_PAPER_TITLE_CONTENTS:
-        _, contents = super().get_contents_pdf(url=url, driver=driver)
+    def iter_contents_pdf(self, url: str, driver: Optional[WebDriver] = None) -> Iterator[List[T_PAPER_CONTENT]]:
+        yield from super().iter_contents_pdf(url=url, driver=driver)
         if hasattr(url, "filename"):
             url = getattr(url, "filename")
         title = str(url).split("/")[-1].rstrip(".pdf")
-        return title, contents
+        self._store_crawling_logs(title=title)
 
 
 class NatureCrawler(GummyAbstJournal):
@@ -771,8 +907,13 @@ class arXivCrawler(GummyAbstJournal):
     def get_arXivNo(url: str) -> str:
         return re.sub(pattern=r"^.+\/((?:\d|\.|v)+)(?:\.pdf)?$", repl=r"\1", string=url)
 
-    def get_sections_from_tex(self, tex: str) -> str:
-        sections = tex.replace("§.§", "§").split("§")
+    def get_sections_from_tex(self, tex: Union[str, List[str]]) -> List[str]:
+        sections = [
+            section
+            for tex_section in ([tex] if isinstance(tex, str) else tex)
+            for section in tex_section.replace("§.§", "§").split("§")
+            if len(section.strip()) > 0
+        ]
         return sections
 
     def get_title_from_soup(self, soup: BeautifulSoup) -> str:
@@ -876,6 +1017,7 @@ class PubMedCrawler(GummyAbstJournal):
                     )
         title = self.get_title_from_soup(soup)
         soup_sections = self.get_sections_from_soup(soup)
+        self.prefetch_section_images(soup_sections)
         contents = self.get_contents_from_soup_sections(soup_sections)
         self._store_crawling_logs(soup=soup, title=title, soup_sections=soup_sections, contents=contents)
         return (title, contents)
@@ -1635,6 +1777,7 @@ class UniKeioCrawler(GummyAbstJournal):
                         )
         title = self.get_title_from_soup(soup)
         soup_sections = self.get_sections_from_soup(soup)
+        self.prefetch_section_images(soup_sections)
         contents = self.get_contents_from_soup_sections(soup_sections)
         self._store_crawling_logs(soup=soup, title=title, soup_sections=soup_sections, contents=contents)
         return (title, contents)
@@ -1903,7 +2046,8 @@ class SpandidosCrawler(GummyAbstJournal):
     def get_sections_from_soup(self, soup: BeautifulSoup) -> List[BeautifulSoup]:
         sections = soup.find_all(name="div", attrs={"id": "articleAbstract"})
         try:
-            sections.extend(group_soup_with_head(soup=sections[0].next.next.next, name=("h4", "h5")))
+            # The body is in the abstract section, so it is grouped in a copy to keep the abstract as it is.
+            sections.extend(group_soup_with_head(soup=copy.copy(sections[0].next.next.next), name=("h4", "h5")))
         except AttributeError:
             print("Use only Abstract.")
         except IndexError:
@@ -2871,7 +3015,7 @@ class JKMSCrawler(GummyAbstJournal):
     @staticmethod
     def get_pdf_url(url: str) -> str:
         if not url.endswith(".pdf"):
-            soup = BeautifulSoup(requests.get(url=url).content, "html.parser")
+            soup = html2soup(html=get_session().get(url=url).content)
             PDF_urls = [a.get("href") for a in soup.find_all(name="a") if a.get_text().upper() == "PDF"]
             if len(PDF_urls) > 0:
                 url = PDF_urls[0]
@@ -2916,7 +3060,7 @@ class JKNSCrawler(GummyAbstJournal):
     @staticmethod
     def get_pdf_url(url: str) -> str:
         if not url.endswith(".pdf"):
-            soup = BeautifulSoup(requests.get(url=url).content, "html.parser")
+            soup = html2soup(html=get_session().get(url=url).content)
             PDF_urls = [a.get("onclick") for a in soup.find_all(name="a") if a.get_text().strip() == "PDF Links"]
             if len(PDF_urls) > 0:
                 url = re.sub(
@@ -2967,7 +3111,7 @@ class BioscienceCrawler(GummyAbstJournal):
 
     @staticmethod
     def get_soup_url(url: str) -> str:
-        soup = BeautifulSoup(requests.get(url=url).content, "html.parser")
+        soup = html2soup(html=get_session().get(url=url).content)
         frame_urls = [
             e.get("src")
             for e in soup.find_all(name="frame")
@@ -4142,7 +4286,7 @@ class ChemRxivCrawler(GummyAbstJournal):
 
     @staticmethod
     def get_pdf_url(url: str) -> str:
-        soup = BeautifulSoup(markup=requests.get(ChemRxivCrawler.get_soup_url(url)).content, features="html.parser")
+        soup = html2soup(html=get_session().get(ChemRxivCrawler.get_soup_url(url)).content)
         if soup is not None:
             div = soup.find(name="div", class_="_2FHUU")
             if div is not None:
@@ -4252,80 +4396,85 @@ class AnnualReviewsCrawler(GummyAbstJournal):
         return head
 
 
-all = TranslationGummyJournalCrawlers = {
-    "pdf": PDFCrawler,
-    "arxiv": arXivCrawler,
-    "nature": NatureCrawler,
-    "ncbi": NCBICrawler,
-    "pubmed": PubMedCrawler,
-    "oxfordacademic": OxfordAcademicCrawler,
-    "sciencedirect": ScienceDirectCrawler,
-    "springer": SpringerCrawler,
-    "mdpi": MDPICrawler,
-    "unioklahoma": UniOKLAHOMACrawler,
-    "lungcancer": LungCancerCrawler,
-    "cellpress": CellPressCrawler,
-    "wileyonlinelibrary": WileyOnlineLibraryCrawler,
-    "jbc": JBCCrawler,
-    "biologists": BiologistsCrawler,
-    "biomedcentral": BioMedCentralCrawler,
-    "ieeexplore": IEEEXploreCrawler,
-    "jstage": JSTAGECrawler,
-    "acspublications": ACSPublicationsCrawler,
-    "unikeio": UniKeioCrawler,
-    "plosone": PLOSONECrawler,
-    "frontiers": frontiersCrawler,
-    "rnajournal": RNAjournalCrawler,
-    "intechopen": IntechOpenCrawler,
-    "nrcresearchpress": NRCResearchPressCrawler,
-    "spandidos": SpandidosCrawler,
-    "taylorandfrancisonline": TaylorandFrancisOnlineCrawler,
-    "biorxiv": bioRxivCrawler,
-    "rscpublishing": RSCPublishingCrawler,
-    "jsse": JSSECrawler,
-    "science": ScienceCrawler,
-    "medrxiv": medRxivCrawler,
-    "aclanthology": ACLAnthologyCrawler,
-    "pnas": PNASCrawler,
-    "ams": AMSCrawler,
-    "acm": ACMCrawler,
-    "aps": APSCrawler,
-    "asip": ASIPCrawler,
-    "renalphysiology": RenalPhysiologyCrawler,
-    "genetics": GeneticsCrawler,
-    "genedev": GeneDevCrawler,
-    "jamanetwork": JAMANetworkCrawler,
-    "sagejournals": SAGEjournalsCrawler,
-    "molcellbio": MolCellBioCrawler,
-    "jkms": JKMSCrawler,
-    "jkns": JKNSCrawler,
-    "bioscience": BioscienceCrawler,
-    "radiographics": RadioGraphicsCrawler,
-    "pediatricsurgery": PediatricSurgeryCrawler,
-    "nejm": NEJMCrawler,
-    "lwwjournals": LWWJournalsCrawler,
-    "arvojournals": ARVOJournalsCrawler,
-    "learningmemory": LearningMemoryCrawler,
-    "psychiartist": PsyChiArtistCrawler,
-    "oncotarget": OncotargetCrawler,
-    "clinicalendoscopy": ClinicalEndoscopyCrawler,
-    "embopress": EMBOPressCrawler,
-    "aspb": ASPBCrawler,
-    "biomedgrid": BiomedGridCrawler,
-    "nrr": NRRCrawler,
-    "ymj": YMJCrawler,
-    "thelancet": TheLancetCrawler,
-    "futurescience": FutureScienceCrawler,
-    "scitation": ScitationCrawler,
-    "iopscience": IOPScienceCrawler,
-    "aacrpublications": AACRPublicationsCrawler,
-    "psycnet": PsycNetCrawler,
-    "minervamedica": MinervaMedicaCrawler,
-    "jneurosci": JNeurosciCrawler,
-    "hindawi": HindawiCrawler,
-    "chemrxiv": ChemRxivCrawler,
-    "sciencedaily": ScienceDailyCrawler,
-    "annualreviews": AnnualReviewsCrawler,
-}
+# Crawlers registered as entry points in the "gummy.journals" group are also available. They (and crawlers added as
+# "module:ClassName" strings) are imported only when they are requested.
+all = TranslationGummyJournalCrawlers = LazyClassRegistry(
+    {
+        "pdf": PDFCrawler,
+        "arxiv": arXivCrawler,
+        "nature": NatureCrawler,
+        "ncbi": NCBICrawler,
+        "pubmed": PubMedCrawler,
+        "oxfordacademic": OxfordAcademicCrawler,
+        "sciencedirect": ScienceDirectCrawler,
+        "springer": SpringerCrawler,
+        "mdpi": MDPICrawler,
+        "unioklahoma": UniOKLAHOMACrawler,
+        "lungcancer": LungCancerCrawler,
+        "cellpress": CellPressCrawler,
+        "wileyonlinelibrary": WileyOnlineLibraryCrawler,
+        "jbc": JBCCrawler,
+        "biologists": BiologistsCrawler,
+        "biomedcentral": BioMedCentralCrawler,
+        "ieeexplore": IEEEXploreCrawler,
+        "jstage": JSTAGECrawler,
+        "acspublications": ACSPublicationsCrawler,
+        "unikeio": UniKeioCrawler,
+        "plosone": PLOSONECrawler,
+        "frontiers": frontiersCrawler,
+        "rnajournal": RNAjournalCrawler,
+        "intechopen": IntechOpenCrawler,
+        "nrcresearchpress": NRCResearchPressCrawler,
+        "spandidos": SpandidosCrawler,
+        "taylorandfrancisonline": TaylorandFrancisOnlineCrawler,
+        "biorxiv": bioRxivCrawler,
+        "rscpublishing": RSCPublishingCrawler,
+        "jsse": JSSECrawler,
+        "science": ScienceCrawler,
+        "medrxiv": medRxivCrawler,
+        "aclanthology": ACLAnthologyCrawler,
+        "pnas": PNASCrawler,
+        "ams": AMSCrawler,
+        "acm": ACMCrawler,
+        "aps": APSCrawler,
+        "asip": ASIPCrawler,
+        "renalphysiology": RenalPhysiologyCrawler,
+        "genetics": GeneticsCrawler,
+        "genedev": GeneDevCrawler,
+        "jamanetwork": JAMANetworkCrawler,
+        "sagejournals": SAGEjournalsCrawler,
+        "molcellbio": MolCellBioCrawler,
+        "jkms": JKMSCrawler,
+        "jkns": JKNSCrawler,
+        "bioscience": BioscienceCrawler,
+        "radiographics": RadioGraphicsCrawler,
+        "pediatricsurgery": PediatricSurgeryCrawler,
+        "nejm": NEJMCrawler,
+        "lwwjournals": LWWJournalsCrawler,
+        "arvojournals": ARVOJournalsCrawler,
+        "learningmemory": LearningMemoryCrawler,
+        "psychiartist": PsyChiArtistCrawler,
+        "oncotarget": OncotargetCrawler,
+        "clinicalendoscopy": ClinicalEndoscopyCrawler,
+        "embopress": EMBOPressCrawler,
+        "aspb": ASPBCrawler,
+        "biomedgrid": BiomedGridCrawler,
+        "nrr": NRRCrawler,
+        "ymj": YMJCrawler,
+        "thelancet": TheLancetCrawler,
+        "futurescience": FutureScienceCrawler,
+        "scitation": ScitationCrawler,
+        "iopscience": IOPScienceCrawler,
+        "aacrpublications": AACRPublicationsCrawler,
+        "psycnet": PsycNetCrawler,
+        "minervamedica": MinervaMedicaCrawler,
+        "jneurosci": JNeurosciCrawler,
+        "hindawi": HindawiCrawler,
+        "chemrxiv": ChemRxivCrawler,
+        "sciencedaily": ScienceDailyCrawler,
+        "annualreviews": AnnualReviewsCrawler,
+    },
+    group="gummy.journals",
+)
 
 get = mk_class_get(all_classes=TranslationGummyJournalCrawlers, gummy_abst_class=[GummyAbstJournal], genre="journals")
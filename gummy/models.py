@@ -19,9 +19,10 @@ You can get (import) ``TranslationGummy`` by the following 2 ways.
 """
 
 import os
-from typing import Any, Dict, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from PyPDF2 import PdfFileReader, PdfFileWriter
+from PyPDF2 import PdfFileReader
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver
 
@@ -29,13 +30,13 @@ from gummy.utils.generic_utils import verbose2print
 
 from . import gateways, journals, translators
 from .utils._path import GUMMY_DIR, TEMPLATES_DIR
-from .utils._type import T_PAPER_TITLE_CONTENTS
+from .utils._type import T_PAPER_CONTENT, T_PAPER_TITLE_CONTENTS
 from .utils.coloring_utils import toACCENT, toBLUE
 from .utils.download_utils import match2path
-from .utils.driver_utils import get_driver
+from .utils.driver_utils import DriverPool, get_driver
 from .utils.journal_utils import whichJournal
 from .utils.outfmt_utils import html2pdf, sanitize_filename, tohtml
-from .utils.pdf_utils import addHighlightToPage, createHighlight
+from .utils.pdf_utils import PdfIncrementalWriter, addHighlightsToPage, createHighlight
 
 
 class TranslationGummy:
@@ -57,6 +58,10 @@ class TranslationGummy:
         to_lang (str)                     : Language after translation.
         verbose (bool)                    : Whether you want to print output or not. (default= ``True`` )
         translator_verbose (bool)         : Whether you want to print translator’s output or not. (default= ``False`` )
+        num_drivers (int)                 : Number of drivers used to translate contents in parallel. (default= ``1`` )
+        max_driver_uses (int)             : Number of translations after which a driver in the pool is recycled. (default= ``100`` )
+        num_tabs (int)                    : Number of tabs in which each driver translates chunks concurrently. (default= ``1`` )
+        pdf_n_jobs (int)                  : Number of processes to analyze PDF pages. If ``-1``, use all cores. (default= ``1`` )
     """
 
     def __init__(
@@ -73,10 +78,24 @@ class TranslationGummy:
         to_lang: str = "ja",
         verbose: bool = True,
         translator_verbose: bool = True,
+        num_drivers: int = 1,
+        max_driver_uses: int = 100,
+        num_tabs: int = 1,
+        pdf_n_jobs: int = 1,
     ):
-        self.driver: WebDriver = driver or get_driver(
+        self._driver: WebDriver = driver or get_driver(
             chrome_options=chrome_options, browser=browser, undetected=undetected
         )
+        self._quit_driver_on_close: bool = driver is None
+        self.driver_pool: DriverPool = DriverPool(
+            size=num_drivers,
+            max_uses=max_driver_uses,
+            driver=self._driver,
+            verbose=verbose,
+            chrome_options=chrome_options,
+            browser=browser,
+            undetected=undetected,
+        )
         self.gateway: str = gateway
         self.translator: translators.GummyAbstTranslator = translators.get(
             translator,
@@ -85,10 +104,45 @@ class TranslationGummy:
             from_lang=from_lang,
             to_lang=to_lang,
             verbose=translator_verbose,
+            num_tabs=num_tabs,
         )
+        self.pdf_n_jobs: int = pdf_n_jobs
         self.verbose: bool = verbose
         self.print = verbose2print(verbose=verbose)
 
+    @property
+    def driver(self) -> WebDriver:
+        """Selenium WebDriver used to crawl journals. It is shared with :attr:`driver_pool` , and if the pool drops it
+        because it stopped responding, it is replaced. (See :meth:`DriverPool.replace_external <gummy.utils.driver_utils.DriverPool.replace_external>` )
+        """
+        if self.driver_pool.external is not self._driver:
+            self.print("Replace the driver which does not respond.")
+            self._driver = self.driver_pool.replace_external()
+            self._quit_driver_on_close = True
+        return self._driver
+
+    def close(self) -> None:
+        """Quit drivers launched by this instance. (A ``driver`` given from the outside is left as it is.)
+
+        Examples:
+            >>> from gummy import TranslationGummy
+            >>> with TranslationGummy(num_drivers=2) as model:
+            ...     ja = model.translate("This is a pen.")
+        """
+        self.driver_pool.close()
+        if self._quit_driver_on_close:
+            self._quit_driver_on_close = False
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+
+    def __enter__(self) -> "TranslationGummy":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     def translate(
         self,
         query: str,
@@ -155,6 +209,26 @@ class TranslationGummy:
             >>> print(texts[:1])
             [{'head': 'Abstract', 'en': 'The  () gene product Fru has been ... for the sexually dimorphic actions of the gene.'}]
         """
+        crawler = self.get_crawler(url=url, journal_type=journal_type, gateway=gateway)
+        title, texts = crawler.get_contents(url=url, driver=self.driver, crawl_type=crawl_type, **gatewaykwargs)
+        return (title, texts)
+
+    def get_crawler(
+        self,
+        url: str,
+        journal_type: Optional[str] = None,
+        gateway: Optional[Union[str, gateways.GummyAbstGateWay]] = None,
+    ) -> journals.GummyAbstJournal:
+        """Get a journal crawler for ``url`` .
+
+        Args:
+            url (str)                   : URL of a paper or ``path/to/local.pdf``.
+            journal_type (str)          : Journal type, if you not specify, judge by analyzing from ``url``.
+            gateway (str, GummyGateWay) : identifier of the Gummy Gateway Class. See :mod:`gateways <gummy.gateways>`. (default= ``None``)
+
+        Returns:
+            GummyAbstJournal : A journal crawler.
+        """
         if journal_type is None:
             if os.path.exists(url):
                 journal_type = "pdf"
@@ -162,8 +236,8 @@ class TranslationGummy:
                 journal_type = whichJournal(url, driver=self.driver, verbose=self.verbose)
         gateway = gateway or self.gateway
         crawler = journals.get(journal_type, gateway=gateway, sleep_for_loading=3, verbose=self.verbose)
-        title, texts = crawler.get_contents(url=url, driver=self.driver, crawl_type=crawl_type, **gatewaykwargs)
-        return (title, texts)
+        crawler.pdf_n_jobs = self.pdf_n_jobs
+        return crawler
 
     def toHTML(
         self,
@@ -194,65 +268,13 @@ class TranslationGummy:
             searchpath/template (str)   : Use a ``<searchpath>/<template>`` tpl for creating HTML. (default= `TEMPLATES_DIR/paper.html`)
             gatewaykwargs (dict)        : Gateway keywargs. See :meth:`passthrough <gummy.gateways.GummyAbstGateWay.passthrough>`.
         """
-        title, contents = self.get_contents(
-            url=url, journal_type=journal_type, crawl_type=crawl_type, gateway=gateway, **gatewaykwargs
-        )
-        self.print(f"\nTranslation: {toACCENT(self.translator.name)}\n{'='*30}")
-        len_contents = len(contents)
+        crawler = self.get_crawler(url=url, journal_type=journal_type, gateway=gateway)
+        chunks = crawler.iter_contents(url=url, driver=self.driver, crawl_type=crawl_type, **gatewaykwargs)
         # Combine split text for faster translation.
-        if crawl_type == "pdf":
-            raw: str = ""
-            for i, content in enumerate(contents):
-                barname = f"[{i+1:>0{len(str(len_contents))}}/{len_contents}] " + toACCENT(content.get("head", "\t"))
-                if "body" in content:
-                    if content["body"]["raw"] == "":
-                        content["body"]["raw"], content["body"]["translated"] = self.translator.translate_wrapper(
-                            query=raw, barname=barname, from_lang=from_lang, to_lang=to_lang, correspond=correspond
-                        )
-                        raw = ""
-                    else:
-                        raw += " " + content["body"].pop("raw")
-                elif "img" in content:
-                    self.print(barname + "<img>")
-                    if "caption" in content["img"]:
-                        (
-                            content["img"]["caption"]["raw"],
-                            content["img"]["caption"]["translated"],
-                        ) = self.translator.translate_wrapper(
-                            query=content["img"]["caption"]["raw"],
-                            barname=barname,
-                            from_lang=from_lang,
-                            to_lang=to_lang,
-                            correspond=correspond,
-                        )
-            if len(raw) > 0:
-                content["body"]["raw"], content["body"]["translated"] = self.translator.translate_wrapper(
-                    query=raw, barname=barname, from_lang=from_lang, to_lang=to_lang, correspond=correspond
-                )
-        else:
-            for i, content in enumerate(contents):
-                barname = f"[{i+1:>0{len(str(len_contents))}}/{len_contents}] " + toACCENT(content.get("head", "\t"))
-                if "body" in content:
-                    content["body"]["raw"], content["body"]["translated"] = self.translator.translate_wrapper(
-                        query=content["body"]["raw"],
-                        barname=barname,
-                        from_lang=from_lang,
-                        to_lang=to_lang,
-                        correspond=correspond,
-                    )
-                elif "img" in content:
-                    self.print(barname + "<img>")
-                    if "caption" in content["img"]:
-                        (
-                            content["img"]["caption"]["raw"],
-                            content["img"]["caption"]["translated"],
-                        ) = self.translator.translate_wrapper(
-                            query=content["img"]["caption"]["raw"],
-                            barname=barname,
-                            from_lang=from_lang,
-                            to_lang=to_lang,
-                            correspond=correspond,
-                        )
+        contents = self.translate_chunks(
+            chunks=chunks, from_lang=from_lang, to_lang=to_lang, correspond=correspond, combine=crawl_type == "pdf"
+        )
+        title = crawler.crawling_logs["title"]
         if path is None:
             path = os.path.join(out_dir, sanitize_filename(fp=title, dirname="."))
         htmlpath = tohtml(
@@ -260,6 +282,125 @@ class TranslationGummy:
         )
         return htmlpath
 
+    def translate_chunks(
+        self,
+        chunks: Iterator[List[T_PAPER_CONTENT]],
+        from_lang: str = "en",
+        to_lang: str = "ja",
+        correspond: bool = True,
+        combine: bool = False,
+    ) -> List[T_PAPER_CONTENT]:
+        """Translate chunks of contents (e.g. pages from :meth:`iter_contents <gummy.journals.GummyAbstJournal.iter_contents>` )
+        in a background thread, so that the translation of a chunk starts while the following chunks are being crawled.
+
+        Args:
+            chunks (iterator)  : Chunks of contents.
+            from_lang (str)    : Language before translation.
+            to_lang (str)      : Language after translation.
+            correspond (bool)  : Whether to correspond the location of ``from_lang`` correspond to that of ``to_lang``.
+            combine (bool)     : Whether to combine split text until an empty body, the end of the chunk, or ``translator.maxsize`` for faster translation. (default= ``False``)
+
+        Returns:
+            list : All contents translated in place.
+        """
+        contents: List[T_PAPER_CONTENT] = []
+        futures = []
+        raw: str = ""
+        slot: Optional[Dict[str, Any]] = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for n, chunk in enumerate(chunks):
+                if n == 0:
+                    self.print(f"\nTranslation: {toACCENT(self.translator.name)}\n{'='*30}")
+                len_chunk = len(chunk)
+                jobs: List[Tuple[str, str, Dict[str, Any]]] = []
+                for i, content in enumerate(chunk):
+                    barname = f"[{i+1:>0{len(str(len_chunk))}}/{len_chunk}] " + toACCENT(content.get("head", "\t"))
+                    if "body" in content:
+                        if not combine:
+                            jobs.append((barname, content["body"]["raw"], content["body"]))
+                        elif content["body"]["raw"] == "":
+                            jobs.append((barname, raw, content["body"]))
+                            raw = ""
+                        else:
+                            raw += " " + content["body"].pop("raw")
+                            slot = content["body"]
+                            if len(raw) >= self.translator.maxsize:
+                                jobs.append((barname, raw, slot))
+                                raw = ""
+                    elif "img" in content:
+                        self.print(barname + "<img>")
+                        if "caption" in content["img"]:
+                            jobs.append((barname, content["img"]["caption"]["raw"], content["img"]["caption"]))
+                # Combined text does not go beyond the chunk, so that it is translated while the next chunk is crawled.
+                if len(raw) > 0:
+                    jobs.append((barname, raw, slot))
+                    raw = ""
+                contents.extend(chunk)
+                if len(jobs) > 0:
+                    futures.append(
+                        executor.submit(
+                            self.translate_jobs, jobs=jobs, from_lang=from_lang, to_lang=to_lang, correspond=correspond
+                        )
+                    )
+            # Re-raise exceptions in the main thread.
+            for future in futures:
+                future.result()
+        return contents
+
+    def translate_jobs(
+        self,
+        jobs: List[Tuple[str, str, Dict[str, Any]]],
+        from_lang: str = "en",
+        to_lang: str = "ja",
+        correspond: bool = True,
+        pack: bool = True,
+    ) -> None:
+        """Translate ``jobs`` using drivers in :attr:`driver_pool`. Consecutive short queries are packed into one request
+        (See :meth:`translate_wrapper_batch <gummy.translators.GummyAbstTranslator.translate_wrapper_batch>` ). If the pool
+        has more than one driver, packs are fanned out across them, and each result is written back to its own ``slot``,
+        so the document order is kept.
+
+        Args:
+            jobs (list)        : List of ``(barname, query, slot)``. ``slot["raw"]`` and ``slot["translated"]`` are overwritten.
+            from_lang (str)    : Language before translation.
+            to_lang (str)      : Language after translation.
+            correspond (bool)  : Whether to correspond the location of ``from_lang`` correspond to that of ``to_lang``.
+            pack (bool)        : Whether to pack consecutive queries into one request or not. (default= ``True``)
+        """
+        queries = [query for _, query, _ in jobs]
+        if pack:
+            packs = self.translator.pack_queries(queries)
+            packed = set(sum(packs, []))
+            # Empty queries are not sent to the translator.
+            for i, (_, query, slot) in enumerate(jobs):
+                if i not in packed:
+                    slot["raw"], slot["translated"] = ([], []) if correspond else ([query], [""])
+        else:
+            packs = [[i] for i in range(len(jobs))]
+
+        def translate_pack(pack: List[int]) -> None:
+            barname = jobs[pack[0]][0] + (f" (+{len(pack)-1})" if len(pack) > 1 else "")
+            with self.driver_pool.get() as driver:
+                results = self.translator.translate_wrapper_batch(
+                    queries=[queries[i] for i in pack],
+                    driver=driver,
+                    barname=barname,
+                    from_lang=from_lang,
+                    to_lang=to_lang,
+                    correspond=correspond,
+                )
+            for i, (raw, translated) in zip(pack, results):
+                jobs[i][2]["raw"], jobs[i][2]["translated"] = raw, translated
+
+        self.print(f"Translate {toBLUE(len(jobs))} contents with {toBLUE(len(packs))} requests.")
+        if self.driver_pool.size > 1 and len(packs) > 1:
+            with ThreadPoolExecutor(max_workers=self.driver_pool.size) as executor:
+                # Consume the iterator to re-raise exceptions in the main thread.
+                list(executor.map(translate_pack, packs))
+        else:
+            for pack in packs:
+                translate_pack(pack)
+
     def toPDF(
         self,
         url: str,
@@ -337,33 +478,41 @@ class TranslationGummy:
             highlight_color (list)      : The highlight color.
             gatewaykwargs (dict)        : Gateway keywargs. See :meth:`passthrough <gummy.gateways.GummyAbstGateWay.passthrough>`.
         """
-        title, contents = self.get_contents(
-            url=url, journal_type=journal_type, crawl_type="pdf", gateway=gateway, **gatewaykwargs
-        )
+        crawler = self.get_crawler(url=url, journal_type=journal_type, gateway=gateway)
+        # Images are not used for highlights.
+        crawler.pdf_image_mode = "none"
+        title, contents = crawler.get_contents(url=url, driver=self.driver, crawl_type="pdf", **gatewaykwargs)
         path_ = match2path(url, dirname=out_dir)
         out_path = path or os.path.join(out_dir, "_higlighted".join(os.path.splitext(os.path.basename(path_))))
+        # Collect text boxes of all pages, and translate them with as few requests as possible.
+        len_contents = len(contents)
+        jobs: List[Tuple[str, str, Dict[str, Any]]] = []
+        page_boxes: List[List[Tuple[Tuple[float, float, float, float], Dict[str, Any]]]] = []
+        for i, content in enumerate(contents):
+            if "head" in content:
+                page_boxes.append([])
+            raw = content.get("body", {}).get("raw", "")
+            if raw == "" or len(raw) < ignore_length:
+                continue
+            barname = f"[page.{len(page_boxes)} {i+1:>0{len(str(len_contents))}}/{len_contents}] "
+            slot: Dict[str, Any] = {}
+            jobs.append((barname, raw, slot))
+            page_boxes[-1].append((content["bbox"], slot))
+        self.translate_jobs(jobs=jobs, from_lang=from_lang, to_lang=to_lang, correspond=False)
         with open(path_, "rb") as inPdf:
             pdfInput = PdfFileReader(inPdf)
-            pdfOutput = PdfFileWriter()
-            page_no = 0
-            page = None
-            len_contents = len(contents)
-            for i, content in enumerate(contents):
-                if "head" in content:
-                    if page_no > 0:
-                        pdfOutput.addPage(page)
-                    page = pdfInput.getPage(page_no)
-                    page_no += 1
-                raw = content.get("raw", "")
-                if raw == "" or len(raw) < ignore_length:
+            # Only the highlights (and pages which refer to them) are appended to the original PDF.
+            pdfOutput = PdfIncrementalWriter(pdfInput)
+            for page_no, boxes in enumerate(page_boxes):
+                if len(boxes) == 0:
                     continue
-                barname = f"[page.{page_no} {i+1:>0{len(str(len_contents))}}/{len_contents}] "
-                translated = self.translator.translate(
-                    query=raw, barname=barname, from_lang=from_lang, to_lang=to_lang, correspond=False
-                )
-                highlight = createHighlight(bbox=content["bbox"], contents=translated, color=highlight_color)
-                addHighlightToPage(highlight, page, pdfOutput)
-            pdfOutput.addPage(page)
+                page = pdfInput.getPage(page_no)
+                highlights = [
+                    createHighlight(bbox=bbox, contents=" ".join(slot["translated"]), color=highlight_color)
+                    for bbox, slot in boxes
+                ]
+                addHighlightsToPage(highlights, page, pdfOutput)
+                pdfOutput.addPage(page)
             with open(out_path, "wb") as outPdf:
                 pdfOutput.write(outPdf)
             self.print(f"{toBLUE(out_path)} is created.")
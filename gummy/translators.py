@@ -23,15 +23,19 @@ You can easily get (import) ``Translator Class`` by the following ways.
     True
 """
 import re
+import threading
 import time
 import urllib
 import warnings
 from abc import ABCMeta, abstractmethod, abstractproperty, abstractstaticmethod
+from bisect import bisect_right
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
 
 from .utils._data import LANG_IDENTIFIER2LANG_CODE
 from .utils._exceptions import GummyImprementationError
@@ -42,14 +46,51 @@ from .utils._type import (
     T_SPECIALIZE_LANG_DATA,
 )
 from .utils._warnings import GummyImprementationWarning
+from .utils.cache_utils import TranslationMemory, get_translation_memory
 from .utils.coloring_utils import toBLUE, toGREEN, toRED
 from .utils.driver_utils import get_driver
-from .utils.generic_utils import handleKeyError, handleTypeError, mk_class_get, splitted_query_generator, verbose2print
+from .utils.generic_utils import (
+    handleKeyError,
+    handleTypeError,
+    mk_class_get,
+    splitted_query_generator,
+    str_strip,
+    verbose2print,
+)
 from .utils.monitor_utils import ProgressMonitor
 from .utils.soup_utils import find_all_target_text, find_target_text
 
+# Install (only once per document) a MutationObserver which records when the output element(s) changed the last time,
+# and return the current output text and the number of seconds since that time.
+OUTPUT_WATCHER_JS: str = """
+const [selector, joint] = arguments;
+const isOutput = (node) => (node.nodeType === 1 ? node : node.parentElement)?.closest(selector);
+if (window.__gummyLastMutation === undefined) {
+  window.__gummyLastMutation = Date.now();
+  new MutationObserver((mutations) => {
+    if (mutations.some(({target, addedNodes}) => isOutput(target) || Array.from(addedNodes).some(isOutput))) {
+      window.__gummyLastMutation = Date.now();
+    }
+  }).observe(document.body, {childList: true, subtree: true, characterData: true});
+}
+const elements = Array.from(document.querySelectorAll(selector));
+const texts = (joint === null ? elements.slice(0, 1) : elements).map((e) => e.textContent);
+return [texts.join(joint || ""), (Date.now() - window.__gummyLastMutation) / 1000];
+"""
+
 
 class GummyAbstTranslator(metaclass=ABCMeta):
+    # CSS selector of the element(s) the translated text is rendered in. If empty, ``driver.page_source`` is polled.
+    output_selector: str = ""
+    # Inserted between the texts of the elements matched by ``output_selector``. If ``None``, only the first one is used.
+    output_joint: Optional[str] = None
+    # The translated text is regarded as settled when the output element(s) have not mutated for this time [s].
+    quiet_period: float = 0.3
+    # How often the readiness is checked in the browser [s].
+    poll_frequency: float = 0.1
+    # Paragraph put between packed queries. It must pass through the translation service unchanged.
+    batch_delimiter: str = "¶"
+
     def __init__(
         self,
         driver: Optional[WebDriver] = None,
@@ -58,6 +99,8 @@ class GummyAbstTranslator(metaclass=ABCMeta):
         trials: int = 30,
         verbose: bool = False,
         use_cache: int = True,
+        use_memory: bool = True,
+        num_tabs: int = 1,
         specialize: int = True,
         from_lang: str = "en",
         to_lang: str = "ja",
@@ -72,12 +115,15 @@ class GummyAbstTranslator(metaclass=ABCMeta):
             trials (int)       : How many times to try to find translated text. (default= ``30``)
             verbose (bool)     : Whether to print message or not. (default= ``False``)
             use_cache (bool)   : Whether to use cache or not. cashe is used in :meth:`is_translated <gummy.translators.GummyAbstTranslator.is_translated>` (default= ``True``)
+            use_memory (bool)  : Whether to look up (and store) translated chunks in the :class:`TranslationMemory <gummy.utils.cache_utils.TranslationMemory>` or not. (default= ``True``)
+            num_tabs (int)     : Number of tabs which translate chunks concurrently in a single driver. (default= ``1``)
             specialize (bool)  : Whether to support multiple languages or specialize. (default= ``True``) If you want to specialize in translating between specific languages, set ``from_lang`` and ``to_lang`` arguments.
             from_lang (str)    : Language before translation.
             to_lang (str)      : Language after translation.
 
         Attributes:
-            cache (str) : Translated text acquired one time ago. Prevent bugs where the same translated text is repeated. Used in :meth:`is_translated <gummy.translators.GummyAbstTranslator.is_translated>`.
+            cache (str)                   : Translated text acquired one time ago (in the current thread). Prevent bugs where the same translated text is repeated. Used in :meth:`is_translated <gummy.translators.GummyAbstTranslator.is_translated>`.
+            memory (TranslationMemory)    : Disk-backed translation memory shared by all translators. It is opened at the first use. ( ``None`` if ``use_memory=False`` )
         """
         self.driver: WebDriver = driver
         self.maxsize: int = maxsize
@@ -85,10 +131,34 @@ class GummyAbstTranslator(metaclass=ABCMeta):
         self.trials: int = trials
         self.verbose: bool = verbose
         self.use_cache: bool = use_cache
-        self.cache: str = ""
+        self._local = threading.local()
+        self.use_memory: bool = use_memory
+        self._memory: Optional[TranslationMemory] = None
+        self.num_tabs: int = num_tabs
         self.setup(specialize=specialize, from_lang=from_lang, to_lang=to_lang)
         self.print = verbose2print(verbose=verbose)
 
+    @property
+    def cache(self) -> str:
+        """Translated text acquired one time ago. It is kept for each thread because each thread drives its own browser."""
+        return getattr(self._local, "cache", "")
+
+    @cache.setter
+    def cache(self, translated_text: str) -> None:
+        self._local.cache = translated_text
+
+    @property
+    def memory(self) -> Optional[TranslationMemory]:
+        """Translation memory. (See :func:`get_translation_memory <gummy.utils.cache_utils.get_translation_memory>` )"""
+        if self._memory is None and self.use_memory:
+            self._memory = get_translation_memory()
+        return self._memory
+
+    @memory.setter
+    def memory(self, memory: Optional[TranslationMemory]) -> None:
+        self._memory = memory
+        self.use_memory = memory is not None
+
     @property
     def class_name(self) -> str:
         """Same as ``self.__class__.__name__``."""
@@ -147,6 +217,8 @@ class GummyAbstTranslator(metaclass=ABCMeta):
         """
         self.url_fmt: str = ""
         self.lang2args = defaultdict(lambda: defaultdict(list))
+        self.from_lang: str = from_lang
+        self.to_lang: str = to_lang
         if specialize:
             self.register_method(from_lang=from_lang, to_lang=to_lang)
             (
@@ -226,6 +298,8 @@ class GummyAbstTranslator(metaclass=ABCMeta):
                 driver=driver,
                 barname=barname,
                 correspond=correspond,
+                from_lang=from_lang,
+                to_lang=to_lang,
             )[1]
         )
         setattr(self, method_name, method)
@@ -326,6 +400,8 @@ class GummyAbstTranslator(metaclass=ABCMeta):
             find_translated_corr = self.find_translated_corr
             is_translated_properly = self.is_translated_properly
             url_fmt = self.url_fmt
+            from_lang = self.from_lang
+            to_lang = self.to_lang
         else:
             handleKeyError(lst=list(self.lang2args.keys()), from_lang=from_lang)
             handleKeyError(lst=list(self.lang2args[from_lang].keys()), to_lang=to_lang)
@@ -341,8 +417,145 @@ class GummyAbstTranslator(metaclass=ABCMeta):
             correspond=correspond,
             driver=driver,
             barname=barname,
+            from_lang=from_lang,
+            to_lang=to_lang,
         )
 
+    def pack_queries(self, queries: List[str]) -> List[List[int]]:
+        """Pack consecutive (non-empty) ``queries`` so that each pack fits in ``maxsize`` once joined with ``batch_delimiter``.
+
+        Args:
+            queries (list) : Queries to be translated.
+
+        Returns:
+            list : Packs of indices of ``queries`` .
+
+        Examples:
+            >>> from gummy import translators
+            >>> translator = translators.get("deepl", maxsize=30)
+            >>> translator.pack_queries(["Hi.", "", "This is a pen.", "That is an apple."])
+            [[0, 2], [3]]
+        """
+        joint_size = len(self.batch_delimiter) + 4
+        packs: List[List[int]] = []
+        size = self.maxsize
+        for i, query in enumerate(queries):
+            if len(str_strip(query)) == 0:
+                continue
+            if size + joint_size + len(query) > self.maxsize:
+                packs.append([])
+                size = -joint_size
+            packs[-1].append(i)
+            size += joint_size + len(query)
+        return packs
+
+    def translate_wrapper_batch(
+        self,
+        queries: List[str],
+        driver: Optional[WebDriver] = None,
+        barname: Optional[str] = None,
+        from_lang: str = "en",
+        to_lang: str = "ja",
+        correspond: bool = True,
+    ) -> List[Tuple[List[str], List[str]]]:
+        """Translate many (short) ``queries`` with as few requests as possible.
+
+        Consecutive queries are packed up to ``maxsize`` (See :meth:`pack_queries <gummy.translators.GummyAbstTranslator.pack_queries>` ),
+        joined with ``batch_delimiter`` paragraphs, and sent as one request. The result is split back into each query
+        by the character offsets of the source sentences ( ``correspond=True`` ) or by ``batch_delimiter`` ( ``correspond=False`` ).
+        If it can not be split properly (e.g. some query gets no sentences), the queries in the pack are translated one by one.
+        Each query is looked up in (and stored to) :attr:`memory` by itself, and only the missing ones are packed.
+
+        Args:
+            queries (list)     : Queries to be translated.
+            driver (WebDriver) : Selenium WebDriver.
+            barname (str)      : Bar name for :meth:`ProgressMonitor <gummy.utils.monitor_utils.ProgressMonitor>`.
+            from_lang (str)    : Language before translation.
+            to_lang (str)      : Language after translation.
+            correspond (bool)  : Whether to correspond the location of ``from_lang`` correspond to that of ``to_lang``.
+
+        Returns:
+            list : SourceSentences ( ``list`` ) , TargetSentences ( ``list`` ) for each query.
+
+        Examples:
+            >>> from gummy import translators
+            >>> translator = translators.get("deepl")
+            >>> translator.translate_wrapper_batch(["This is a pen.", "That is an apple."])
+            [(['This is a pen.'], ['これはペンです。']), (['That is an apple.'], ['あれはリンゴです。'])]
+        """
+        kwargs = dict(driver=driver, barname=barname, from_lang=from_lang, to_lang=to_lang, correspond=correspond)
+        memory_kwargs = dict(
+            translator=self.name,
+            from_lang=from_lang or self.from_lang,
+            to_lang=to_lang or self.to_lang,
+            correspond=correspond,
+        )
+        results: List[Tuple[List[str], List[str]]] = [([], []) if correspond else ([query], [""]) for query in queries]
+        # Each query is looked up in the memory by itself, so that it hits regardless of its neighbours in the pack.
+        misses = list(range(len(queries)))
+        if self.memory is not None:
+            misses = []
+            for i, query in enumerate(queries):
+                result = self.memory.get(query=query, **memory_kwargs) if len(str_strip(query)) > 0 else None
+                if result is None:
+                    misses.append(i)
+                else:
+                    results[i] = result
+            if len(misses) < len(queries):
+                self.print(f"{toBLUE(len(queries)-len(misses))} queries found in the {toGREEN('translation memory')}.")
+        for pack in self.pack_queries([queries[i] for i in misses]):
+            pack = [misses[j] for j in pack]
+            if len(pack) == 1:
+                results[pack[0]] = self.translate_wrapper(query=queries[pack[0]], **kwargs)
+                continue
+            joint = f"\n\n{self.batch_delimiter}\n\n"
+            query = joint.join([queries[i] for i in pack])
+            source_sentences, target_sentences = self.translate_wrapper(query=query, **kwargs)
+            if correspond:
+                starts = [0]
+                for i in pack[:-1]:
+                    starts.append(starts[-1] + len(queries[i]) + len(joint))
+                splitted = [([], []) for _ in pack]
+                pos = 0
+                for source_sentence, target_sentence in zip(source_sentences, target_sentences):
+                    source_sentence = source_sentence.strip()
+                    if source_sentence in ["", self.batch_delimiter]:
+                        continue
+                    # Translation services may normalize whitespaces in the source sentences.
+                    match = re.compile(r"\s+".join(map(re.escape, source_sentence.split()))).search(query, pos)
+                    if match is None or self.batch_delimiter in source_sentence:
+                        splitted = None
+                        break
+                    source, target = splitted[bisect_right(starts, match.start()) - 1]
+                    source.append(source_sentence)
+                    target.append(target_sentence.strip(f" {self.batch_delimiter}"))
+                    pos = match.end()
+                # A query without any matched sentences would be rendered as an empty translation.
+                if splitted is not None and any(len(source) == 0 for source, _ in splitted):
+                    splitted = None
+            else:
+                translated_texts = [str_strip(t) for t in " ".join(target_sentences).split(self.batch_delimiter)]
+                splitted = (
+                    [([queries[i]], [translated_text]) for i, translated_text in zip(pack, translated_texts)]
+                    if len(translated_texts) == len(pack)
+                    else None
+                )
+            if splitted is None:
+                self.print(f"Could not split the packed query, so translate {toBLUE(len(pack))} queries one by one.")
+                splitted = [self.translate_wrapper(query=queries[i], **kwargs) for i in pack]
+            elif self.memory is not None:
+                for i, (source_sentences, target_sentences) in zip(pack, splitted):
+                    if len(str_strip("".join(target_sentences))) > 0:
+                        self.memory.set(
+                            query=queries[i],
+                            source_sentences=source_sentences,
+                            target_sentences=target_sentences,
+                            **memory_kwargs,
+                        )
+            for i, result in zip(pack, splitted):
+                results[i] = result
+        return results
+
     def _translate(
         self,
         query: str,
@@ -353,6 +566,8 @@ class GummyAbstTranslator(metaclass=ABCMeta):
         correspond: bool = True,
         driver: Optional[WebDriver] = None,
         barname: Optional[str] = None,
+        from_lang: Optional[str] = None,
+        to_lang: Optional[str] = None,
     ):
         """A translating function running in :meth:`translate <gummy.translators.GummyAbstTranslator.translate>`
 
@@ -364,40 +579,216 @@ class GummyAbstTranslator(metaclass=ABCMeta):
             url_fmt (str)                 : An url format ( ``"{query}"`` must be included.)
             driver (WebDriver)            : Selenium WebDriver.
             barname (str)                 : Bar name for :meth:`ProgressMonitor <gummy.utils.monitor_utils.ProgressMonitor>`.
+            from_lang (str)               : Language before translation. Used as a key of :attr:`memory`. (default= ``self.from_lang``)
+            to_lang (str)                 : Language after translation. Used as a key of :attr:`memory`. (default= ``self.to_lang``)
 
         Returns:
             tuple : SourceSentences ( ``list`` ) , TargetSentences ( ``list`` ) .
         """
+        from_lang = from_lang or self.from_lang
+        to_lang = to_lang or self.to_lang
+        memory_kwargs = dict(translator=self.name, from_lang=from_lang, to_lang=to_lang, correspond=correspond)
         driver = self.check_driver(driver=driver)
         barname = barname or self.class_name
-        SourceSentences = []
-        TargetSentences = []
-        gen = splitted_query_generator(query=query, maxsize=self.maxsize)
-        for i, q in enumerate(gen):
-            url = url_fmt.format(query=urllib.parse.quote(re.sub(pattern=r"([|/])", repl=r"\\\1", string=q)))
-            driver.refresh()
-            driver.get(url)
-            monitor = ProgressMonitor(max_iter=self.trials, verbose=self.verbose, barname=f"{barname} (query{i+1})")
-            for i in range(self.trials):
-                time.sleep(self.interval)
-                soup = BeautifulSoup(markup=driver.page_source.encode("utf-8"), features="lxml")
-                translated_text = find_translated_bulk(soup)
-                monitor.report(i, translated=translated_text[:5])
-                if is_translated_properly(translated_text):
-                    break
-            monitor.remove()
+        queries = list(splitted_query_generator(query=query, maxsize=self.maxsize))
+        results: List[Optional[Tuple[List[str], List[str]]]] = [None] * len(queries)
+        if self.memory is not None:
+            for i, q in enumerate(queries):
+                results[i] = self.memory.get(query=q, **memory_kwargs)
+                if results[i] is not None:
+                    self.print(f"{barname} (query{i+1}) found in the {toGREEN('translation memory')}.")
+        indices = [i for i, result in enumerate(results) if result is None]
+
+        def harvest(i: int, translated_text: str, soup: Optional[BeautifulSoup]) -> None:
+            """Collect the translation of ``queries[i]`` from the current window."""
+            q = queries[i]
             if correspond:
                 source_sentences, target_sentences = find_translated_corr(soup, driver)
-                SourceSentences.extend(source_sentences)
-                TargetSentences.extend(target_sentences)
             else:
-                SourceSentences.append(query)
-                TargetSentences.append(translated_text)
+                source_sentences, target_sentences = [q], [translated_text]
+            results[i] = (source_sentences, target_sentences)
+            if (self.memory is not None) and is_translated_properly(translated_text):
+                self.memory.set(
+                    query=q, source_sentences=source_sentences, target_sentences=target_sentences, **memory_kwargs
+                )
             if self.use_cache:
                 self.cache = translated_text
+
+        if self.num_tabs > 1 and len(indices) > 1 and len(self.output_selector) > 0:
+            self._translate_in_tabs(
+                queries=queries,
+                indices=indices,
+                harvest=harvest,
+                is_translated_properly=is_translated_properly,
+                url_fmt=url_fmt,
+                correspond=correspond,
+                driver=driver,
+                barname=barname,
+            )
+        for i in indices:
+            if results[i] is not None:
+                continue
+            driver.refresh()
+            driver.get(self.query2url(query=queries[i], url_fmt=url_fmt))
+            monitor = ProgressMonitor(max_iter=self.trials, verbose=self.verbose, barname=f"{barname} (query{i+1})")
+            if len(self.output_selector) > 0:
+                translated_text = self.wait_until_translated(
+                    driver=driver, is_translated_properly=is_translated_properly, monitor=monitor
+                )
+                soup = BeautifulSoup(markup=driver.page_source.encode("utf-8"), features="lxml") if correspond else None
+            else:
+                for it in range(self.trials):
+                    time.sleep(self.interval)
+                    soup = BeautifulSoup(markup=driver.page_source.encode("utf-8"), features="lxml")
+                    translated_text = find_translated_bulk(soup)
+                    monitor.report(it, translated=translated_text[:5])
+                    if is_translated_properly(translated_text):
+                        break
+            monitor.remove()
+            harvest(i, translated_text, soup)
             time.sleep(1)
+        SourceSentences = []
+        TargetSentences = []
+        for source_sentences, target_sentences in results:
+            SourceSentences.extend(source_sentences)
+            TargetSentences.extend(target_sentences)
         return (SourceSentences, TargetSentences)
 
+    @staticmethod
+    def query2url(query: str, url_fmt: str) -> str:
+        """Embed ``query`` in ``url_fmt`` ( ``"|"`` and ``"/"`` are escaped.)"""
+        return url_fmt.format(query=urllib.parse.quote(re.sub(pattern=r"([|/])", repl=r"\\\1", string=query)))
+
+    def open_tabs(self, driver: WebDriver) -> List[str]:
+        """Open tabs (window handles) in ``driver`` until there are ``num_tabs`` ones.
+
+        Args:
+            driver (WebDriver) : Selenium WebDriver.
+
+        Returns:
+            list : ``num_tabs`` window handles.
+        """
+        for _ in range(self.num_tabs - len(driver.window_handles)):
+            driver.switch_to.new_window("tab")
+        return driver.window_handles[: self.num_tabs]
+
+    def _translate_in_tabs(
+        self,
+        queries: List[str],
+        indices: List[int],
+        harvest: Callable[[int, str, Optional[BeautifulSoup]], None],
+        is_translated_properly: T_IS_TRANSLATED_PROPERLY,
+        url_fmt: str,
+        correspond: bool = True,
+        driver: Optional[WebDriver] = None,
+        barname: Optional[str] = None,
+    ) -> None:
+        """Keep up to ``num_tabs`` chunks in flight in the tabs of a single ``driver``, and harvest each tab as soon
+        as :meth:`is_translation_ready <gummy.translators.GummyAbstTranslator.is_translation_ready>` is satisfied.
+
+        Args:
+            queries (list)                : Chunks of the query.
+            indices (list)                : Indices of ``queries`` to be translated.
+            harvest (func)                : A function called as ``harvest(i, translated_text, soup)`` in the tab where ``queries[i]`` was translated.
+            is_translated_properly (func) : A function to check if the acquired translated_text is appropriate.
+            url_fmt (str)                 : An url format ( ``"{query}"`` must be included.)
+            correspond (bool)             : Whether to correspond the location of ``from_lang`` correspond to that of ``to_lang``.
+            driver (WebDriver)            : Selenium WebDriver.
+            barname (str)                 : Bar name for :meth:`ProgressMonitor <gummy.utils.monitor_utils.ProgressMonitor>`.
+        """
+        origin = driver.current_window_handle
+        handles = self.open_tabs(driver)
+        # Each tab remembers its own last translated text, which is used by ``is_translated_properly``.
+        tab2cache: Dict[str, str] = {handle: "" for handle in handles}
+        in_flight: Dict[str, Tuple[int, float, ProgressMonitor]] = {}
+        waiting = list(indices)
+        timeout = self.interval * self.trials
+        try:
+            while len(waiting) + len(in_flight) > 0:
+                for handle in handles:
+                    if handle in in_flight or len(waiting) == 0:
+                        continue
+                    i = waiting.pop(0)
+                    driver.switch_to.window(handle)
+                    driver.refresh()
+                    driver.get(self.query2url(query=queries[i], url_fmt=url_fmt))
+                    monitor = ProgressMonitor(
+                        max_iter=self.trials, verbose=self.verbose, barname=f"{barname} (query{i+1})"
+                    )
+                    in_flight[handle] = (i, time.time(), monitor)
+                for handle, (i, start, monitor) in list(in_flight.items()):
+                    driver.switch_to.window(handle)
+                    self.cache = tab2cache[handle]
+                    is_ready, translated_text = self.is_translation_ready(
+                        driver=driver, is_translated_properly=is_translated_properly
+                    )
+                    elapsed = time.time() - start
+                    monitor.report(min(int(elapsed / self.interval), self.trials - 1), translated=translated_text[:5])
+                    if is_ready or elapsed > timeout:
+                        monitor.remove()
+                        soup = (
+                            BeautifulSoup(markup=driver.page_source.encode("utf-8"), features="lxml")
+                            if correspond
+                            else None
+                        )
+                        harvest(i, translated_text, soup)
+                        tab2cache[handle] = self.cache
+                        del in_flight[handle]
+                time.sleep(self.poll_frequency)
+        finally:
+            driver.switch_to.window(origin)
+
+    def is_translation_ready(
+        self, driver: WebDriver, is_translated_properly: T_IS_TRANSLATED_PROPERLY
+    ) -> Tuple[bool, str]:
+        """Check (in the browser) if the translated text is appropriate and has settled.
+
+        Only the output element(s) specified by ``output_selector`` are read, so the whole page is neither serialized
+        nor parsed. Override this method if the translation service needs another readiness condition.
+
+        Args:
+            driver (WebDriver)            : Selenium WebDriver.
+            is_translated_properly (func) : A function to check if the acquired translated_text is appropriate.
+
+        Returns:
+            tuple : Whether the translation is ready or not ( ``bool`` ) , translated text ( ``str`` ) .
+        """
+        translated_text, quiet_time = driver.execute_script(OUTPUT_WATCHER_JS, self.output_selector, self.output_joint)
+        translated_text = str_strip(translated_text)
+        return (is_translated_properly(translated_text) and quiet_time >= self.quiet_period, translated_text)
+
+    def wait_until_translated(
+        self, driver: WebDriver, is_translated_properly: T_IS_TRANSLATED_PROPERLY, monitor: ProgressMonitor
+    ) -> str:
+        """Wait until :meth:`is_translation_ready <gummy.translators.GummyAbstTranslator.is_translation_ready>` is satisfied,
+        for up to ``interval`` * ``trials`` seconds.
+
+        Args:
+            driver (WebDriver)            : Selenium WebDriver.
+            is_translated_properly (func) : A function to check if the acquired translated_text is appropriate.
+            monitor (ProgressMonitor)     : Monitor to report the progress.
+
+        Returns:
+            str : Translated text (The last acquired one if timed out.)
+        """
+        timeout = self.interval * self.trials
+        start = time.time()
+        results = {"translated_text": ""}
+
+        def is_ready(driver: WebDriver) -> bool:
+            is_ready, results["translated_text"] = self.is_translation_ready(
+                driver=driver, is_translated_properly=is_translated_properly
+            )
+            it = min(int((time.time() - start) / self.interval), self.trials - 1)
+            monitor.report(it, translated=results["translated_text"][:5])
+            return is_ready
+
+        try:
+            WebDriverWait(driver=driver, timeout=timeout, poll_frequency=self.poll_frequency).until(is_ready)
+        except TimeoutException:
+            pass
+        return results["translated_text"]
+
     @abstractstaticmethod
     def find_translated_bulk(soup: BeautifulSoup) -> str:
         """Find translated Translated text from ``soup``
@@ -450,6 +841,8 @@ class DeepLTranslator(GummyAbstTranslator):
     for languages. See https://www.deepl.com/en/home for more info.
     """
 
+    output_selector: str = "button.lmt__translations_as_text__text_btn"
+
     def __init__(
         self,
         driver: Optional[WebDriver] = None,
@@ -458,6 +851,8 @@ class DeepLTranslator(GummyAbstTranslator):
         trials: int = 30,
         verbose: bool = False,
         use_cache: bool = True,
+        use_memory: bool = True,
+        num_tabs: int = 1,
         specialize: bool = True,
         from_lang: str = "en",
         to_lang: str = "ja",
@@ -469,6 +864,8 @@ class DeepLTranslator(GummyAbstTranslator):
             trials=trials,
             verbose=verbose,
             use_cache=use_cache,
+            use_memory=use_memory,
+            num_tabs=num_tabs,
             specialize=specialize,
             from_lang=from_lang,
             to_lang=to_lang,
@@ -527,6 +924,9 @@ class GoogleTranslator(GummyAbstTranslator):
     another. See https://translate.google.com/ for more info.
     """
 
+    output_selector: str = 'span[jsname="W297wb"]'
+    output_joint: Optional[str] = ""
+
     def __init__(
         self,
         driver: Optional[WebDriver] = None,
@@ -535,6 +935,8 @@ class GoogleTranslator(GummyAbstTranslator):
         trials: int = 30,
         verbose: bool = False,
         use_cache: bool = True,
+        use_memory: bool = True,
+        num_tabs: int = 1,
         specialize: bool = True,
         from_lang: str = "en",
         to_lang: str = "ja",
@@ -546,6 +948,8 @@ class GoogleTranslator(GummyAbstTranslator):
             trials=trials,
             verbose=verbose,
             use_cache=use_cache,
+            use_memory=use_memory,
+            num_tabs=num_tabs,
             specialize=specialize,
             from_lang=from_lang,
             to_lang=to_lang,
@@ -679,6 +1083,8 @@ class GoogleTranslator(GummyAbstTranslator):
         correspond: bool = False,
         driver: Optional[WebDriver] = None,
         barname: Optional[str] = None,
+        from_lang: Optional[str] = None,
+        to_lang: Optional[str] = None,
     ):
         if correspond == True:
             warnings.warn(
@@ -695,6 +1101,8 @@ class GoogleTranslator(GummyAbstTranslator):
             correspond=correspond,
             driver=driver,
             barname=barname,
+            from_lang=from_lang,
+            to_lang=to_lang,
         )
 
     def specialize2langs(self, from_lang: str, to_lang: str, **kwargs) -> T_SPECIALIZE_LANG_DATA:
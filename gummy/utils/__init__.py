@@ -1,38 +1,61 @@
 # coding: utf-8
-from . import (coloring_utils, compress_utils, download_utils, driver_utils,
-               environ_utils, generic_utils, journal_utils, monitor_utils,
-               outfmt_utils, pdf_utils, soup_utils)
+from . import (cache_utils, coloring_utils, compress_utils, download_utils,
+               driver_utils, environ_utils, generic_utils, http_utils,
+               journal_utils, monitor_utils, outfmt_utils, pdf_utils,
+               soup_utils, tex_utils)
 from ._data import *
 from ._exceptions import *
 from ._path import *
 from ._type import *
 from ._warnings import *
+from .cache_utils import (PDFLayoutCache, TranslationMemory,
+                          get_translation_memory)
 from .coloring_utils import (toACCENT, toBLUE, toCYAN, toFLASH, toGRAY,
                              toGREEN, toPURPLE, toRED, toRED_FLASH, toREVERSE,
                              toWHITE, toYELLOW)
-from .compress_utils import extract_from_compressed, is_compressed
-from .download_utils import (decide_extension, download_file, match2path,
-                             path2base64, src2base64)
-from .driver_utils import (DRIVER_TYPE, click, download_PDF_with_driver,
-                           get_chrome_options, get_driver, pass_forms,
-                           scrollDown, try_find_element,
+from .compress_utils import (extract_from_compressed, is_compressed,
+                             iter_from_compressed, read_from_compressed)
+from .download_utils import (decide_extension, download_file, fetch_image,
+                             get_img_url, match2path, path2base64,
+                             prefetch_images, src2base64)
+from .driver_utils import (DriverPool, click, download_PDF_with_driver,
+                           get_chrome_options, get_driver, get_driver_type,
+                           pass_forms, scrollDown, try_find_element,
                            try_find_element_click, try_find_element_send_keys,
                            wait_until_all_elements)
 from .environ_utils import (check_environ, load_environ, name2envname,
                             read_environ, show_environ, where_is_envfile,
                             write_environ)
-from .generic_utils import (DictParamProcessor, ListParamProcessorCreate,
-                            get_latest_filename, handleKeyError,
-                            handleTypeError, mk_class_get, now_str,
-                            readable_bytes, recreate_dir,
+from .generic_utils import (DictParamProcessor, LazyClassRegistry,
+                            ListParamProcessorCreate, get_latest_filename,
+                            handleKeyError, handleTypeError, mk_class_get,
+                            now_str, readable_bytes, recreate_dir,
                             splitted_query_generator, str_strip, try_wrapper,
                             verbose2print)
-from .journal_utils import canonicalize, whichJournal
+from .http_utils import configure_session, create_session, get_session
+from .journal_utils import canonicalize, pop_canonical_body, whichJournal
 from .monitor_utils import ProgressMonitor, progress_reporthook_create
-from .outfmt_utils import (check_contents, get_jinja_all_attrs, html2pdf,
-                           sanitize_filename, tohtml, toPDF)
-from .pdf_utils import (addHighlightToPage, createHighlight, get_pdf_contents,
-                        get_pdf_pages, parser_pdf_pages)
-from .soup_utils import (find_all_target_text, find_target_id,
-                         find_target_text, group_soup_with_head, kwargs2tag,
-                         replace_soup_tag, split_section, str2soup)
+from .outfmt_utils import (check_contents, get_jinja_all_attrs,
+                           get_jinja_environment, html2pdf, sanitize_filename,
+                           tohtml, toPDF)
+from .pdf_utils import (PDFImageRef, PDFImageStore, PdfIncrementalWriter,
+                        addHighlightsToPage, addHighlightToPage,
+                        createHighlight, get_pdf_contents, get_pdf_digest,
+                        get_pdf_num_pages, get_pdf_pages, iter_pdf_contents,
+                        parser_pdf_pages)
+from .soup_utils import (compile_soup_tags_matcher, decompose_soup_tags,
+                         find_all_target_text, find_target_id,
+                         find_target_text, get_soup_parser,
+                         group_soup_with_head, html2soup, kwargs2tag,
+                         replace_soup_tag, set_soup_parser, split_section,
+                         str2soup)
+from .tex_utils import (assemble_tex_project, find_main_tex, inline_tex_inputs,
+                        latex_to_text, read_tex_files, split_tex_sections,
+                        strip_tex_comments, tex_sections_to_text)
+
+
+def __getattr__(name):
+    # ``DRIVER_TYPE`` is decided lazily. See :meth:`get_driver_type <gummy.utils.driver_utils.get_driver_type>`.
+    if name == "DRIVER_TYPE":
+        return get_driver_type()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
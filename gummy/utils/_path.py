@@ -4,7 +4,16 @@ from pathlib import Path
 
 from .coloring_utils import toBLUE
 
-__all__ = ["UTILS_DIR", "MODULE_DIR", "TEMPLATES_DIR", "REPO_DIR", "GUMMY_DIR", "DOTENV_PATH", "IMG_NOT_FOUND_SRC"]
+__all__ = [
+    "UTILS_DIR",
+    "MODULE_DIR",
+    "TEMPLATES_DIR",
+    "REPO_DIR",
+    "GUMMY_DIR",
+    "CACHE_DIR",
+    "DOTENV_PATH",
+    "IMG_NOT_FOUND_SRC",
+]
 
 UTILS_DIR: str = os.path.dirname(os.path.abspath(__file__))  # path/to/gummy/utils
 MODULE_DIR: str = os.path.dirname(UTILS_DIR)  # path/to/gummy
@@ -17,6 +26,7 @@ if os.path.exists(GUMMY_DIR) and not os.access(GUMMY_DIR, os.W_OK):
 if not os.path.exists(GUMMY_DIR):
     os.mkdir(GUMMY_DIR)
     print(f"{toBLUE(GUMMY_DIR)} is created. Downloaded data will be stored here.")
+CACHE_DIR: str = os.path.join(GUMMY_DIR, ".cache")  # /Users/<username>/TranslationGummy/.cache
 DOTENV_PATH: str = os.path.join(GUMMY_DIR, ".env")  # /Users/<username>/TranslationGummy/.env
 if not os.path.exists(DOTENV_PATH):
     Path(DOTENV_PATH).touch()
@@ -0,0 +1,373 @@
+# coding: utf-8
+""" Utility programs for caching the results of time-consuming processes in ``CACHE_DIR``."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from ._path import CACHE_DIR
+from .generic_utils import str_strip
+
+
+class TranslationMemory:
+    """Disk-backed translation memory (SQLite) which stores translated chunks.
+
+    Each record is keyed by the translator name, ``from_lang``, ``to_lang``,
+    ``correspond`` and a hash of the normalized chunk, so the same abstracts
+    or boilerplate paragraphs do not need to be translated twice.
+
+    Args:
+        path (str)        : path/to/translation_memory.sqlite3 (default= ``CACHE_DIR/translation_memory.sqlite3``)
+        max_entries (int) : Maximum number of records. The least recently used records are evicted. (default= ``100_000``)
+        max_age (int)     : Maximum age of records [s]. Older records are evicted. (default= ``30 days``)
+        evict_every (int) : Run :meth:`evict <gummy.utils.cache_utils.TranslationMemory.evict>` every ``evict_every`` insertions. (default= ``100``)
+
+    Attributes:
+        hits (int)   : Number of chunks found in the memory.
+        misses (int) : Number of chunks not found in the memory.
+
+    Examples:
+        >>> from gummy.utils import TranslationMemory
+        >>> memory = TranslationMemory()
+        >>> memory.get(translator="DeepL", from_lang="en", to_lang="ja", query="This is a pen.")
+        >>> memory.set(translator="DeepL", from_lang="en", to_lang="ja", query="This is a pen.", source_sentences=["This is a pen."], target_sentences=["これはペンです。"])
+        >>> memory.get(translator="DeepL", from_lang="en", to_lang="ja", query="This  is a pen. ")
+        (['This is a pen.'], ['これはペンです。'])
+        >>> memory.stats
+        {'hits': 1, 'misses': 1, 'entries': 1}
+    """
+
+    def __init__(
+        self,
+        path: str = os.path.join(CACHE_DIR, "translation_memory.sqlite3"),
+        max_entries: int = 100_000,
+        max_age: int = 30 * 24 * 60 * 60,
+        evict_every: int = 100,
+    ):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path: str = path
+        self.max_entries: int = max_entries
+        self.max_age: int = max_age
+        self.evict_every: int = evict_every
+        self.hits: int = 0
+        self.misses: int = 0
+        self._num_insertions: int = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS memory "
+                "(key TEXT PRIMARY KEY, translator TEXT, from_lang TEXT, to_lang TEXT, "
+                "source TEXT, target TEXT, created REAL, accessed REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS memory_accessed ON memory (accessed)")
+        self.evict()
+
+    @staticmethod
+    def make_key(translator: str, from_lang: str, to_lang: str, query: str, correspond: bool = True) -> str:
+        """Create a key from the translator information and a hash of the normalized ``query``.
+
+        Args:
+            translator (str)  : Translator service name.
+            from_lang (str)   : Language before translation.
+            to_lang (str)     : Language after translation.
+            query (str)       : Chunk to be translated.
+            correspond (bool) : Whether the sentences are corresponded or not.
+
+        Returns:
+            str : A key of the record.
+        """
+        digest = hashlib.sha256(str_strip(query).encode("utf-8")).hexdigest()
+        return "/".join([translator, from_lang, to_lang, "corr" if correspond else "bulk", digest])
+
+    def get(
+        self, translator: str, from_lang: str, to_lang: str, query: str, correspond: bool = True
+    ) -> Optional[Tuple[List[str], List[str]]]:
+        """Look up the translation of ``query``.
+
+        Returns:
+            tuple : SourceSentences ( ``list`` ) , TargetSentences ( ``list`` ) if found, else ``None``.
+        """
+        key = self.make_key(translator, from_lang, to_lang, query, correspond)
+        with self._lock:
+            row = self._conn.execute("SELECT source, target, created FROM memory WHERE key = ?", (key,)).fetchone()
+            if row is None or (time.time() - row[2] > self.max_age):
+                self.misses += 1
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE memory SET accessed = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return (json.loads(row[0]), json.loads(row[1]))
+
+    def set(
+        self,
+        translator: str,
+        from_lang: str,
+        to_lang: str,
+        query: str,
+        source_sentences: List[str],
+        target_sentences: List[str],
+        correspond: bool = True,
+    ) -> None:
+        """Store the translation of ``query``.
+
+        Args:
+            source_sentences (list) : Source sentences.
+            target_sentences (list) : Target sentences.
+        """
+        key = self.make_key(translator, from_lang, to_lang, query, correspond)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO memory VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    translator,
+                    from_lang,
+                    to_lang,
+                    json.dumps(source_sentences, ensure_ascii=False),
+                    json.dumps(target_sentences, ensure_ascii=False),
+                    now,
+                    now,
+                ),
+            )
+            self._num_insertions += 1
+        if self._num_insertions % self.evict_every == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove records which are older than ``max_age``, and then the least recently used ones beyond ``max_entries``.
+
+        Returns:
+            int : Number of evicted records.
+        """
+        with self._lock, self._conn:
+            num_evicted = self._conn.execute(
+                "DELETE FROM memory WHERE created < ?", (time.time() - self.max_age,)
+            ).rowcount
+            num_evicted += self._conn.execute(
+                "DELETE FROM memory WHERE key IN (SELECT key FROM memory ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        return num_evicted
+
+    def clear(self) -> None:
+        """Remove all records."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM memory")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM memory").fetchone()[0]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the number of records."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+
+TRANSLATION_MEMORY_PATH: str = os.path.join(CACHE_DIR, "translation_memory.sqlite3")
+_TRANSLATION_MEMORIES: Dict[str, TranslationMemory] = {}
+_TRANSLATION_MEMORIES_LOCK = threading.Lock()
+
+
+def get_translation_memory(path: str = TRANSLATION_MEMORY_PATH) -> TranslationMemory:
+    """Get the :class:`TranslationMemory <gummy.utils.cache_utils.TranslationMemory>` at ``path`` . It is opened
+    (and evicted) at the first call for each ``path`` , and shared by all following calls (and all translators.)
+
+    Args:
+        path (str) : path/to/translation_memory.sqlite3 (default= ``TRANSLATION_MEMORY_PATH``)
+
+    Returns:
+        TranslationMemory : The shared translation memory.
+
+    Examples:
+        >>> from gummy.utils import get_translation_memory
+        >>> get_translation_memory() is get_translation_memory()
+        True
+    """
+    path = os.path.abspath(path)
+    with _TRANSLATION_MEMORIES_LOCK:
+        memory = _TRANSLATION_MEMORIES.get(path)
+        if memory is None:
+            memory = _TRANSLATION_MEMORIES[path] = TranslationMemory(path=path)
+    return memory
+
+
+class PDFLayoutCache:
+    """Disk-backed cache (SQLite) of the layout analysis results of PDF pages.
+
+    Each page is keyed by a hash of the PDF file content and the layout parameters (``LAParams``), so re-running
+    on the same PDF (e.g. with a different translator or template) does not repeat the layout analysis. Pages are
+    stored compactly: texts as a zlib-compressed JSON, and bboxes as a packed array of doubles. Images referred from
+    pages are stored once per PDF.
+
+    Args:
+        path (str)        : path/to/pdf_layout_cache.sqlite3 (default= ``CACHE_DIR/pdf_layout_cache.sqlite3``)
+        max_entries (int) : Maximum number of PDFs. The least recently used PDFs are evicted. (default= ``1_000``)
+        max_age (int)     : Maximum age of PDFs [s]. Older PDFs are evicted. (default= ``30 days``)
+        evict_every (int) : Run :meth:`evict <gummy.utils.cache_utils.PDFLayoutCache.evict>` every ``evict_every`` PDFs. (default= ``10``)
+
+    Attributes:
+        hits (int)   : Number of pages found in the cache.
+        misses (int) : Number of pages analyzed and stored in the cache.
+
+    Examples:
+        >>> from gummy.utils import PDFLayoutCache, get_pdf_contents
+        >>> cache = PDFLayoutCache()
+        >>> pdf_pages = get_pdf_contents("path/to/paper.pdf", cache=cache)
+        >>> pdf_pages = get_pdf_contents("path/to/paper.pdf", cache=cache)  # No layout analysis.
+        >>> cache.stats
+        {'hits': 12, 'misses': 12, 'entries': 1}
+    """
+
+    def __init__(
+        self,
+        path: str = os.path.join(CACHE_DIR, "pdf_layout_cache.sqlite3"),
+        max_entries: int = 1_000,
+        max_age: int = 30 * 24 * 60 * 60,
+        evict_every: int = 10,
+    ):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path: str = path
+        self.max_entries: int = max_entries
+        self.max_age: int = max_age
+        self.evict_every: int = evict_every
+        self.hits: int = 0
+        self.misses: int = 0
+        self._num_insertions: int = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents (key TEXT PRIMARY KEY, num_pages INTEGER, created REAL, accessed REAL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages (key TEXT, page INTEGER, texts BLOB, bboxes BLOB, PRIMARY KEY (key, page))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS images (key TEXT, digest TEXT, data BLOB, PRIMARY KEY (key, digest))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS documents_accessed ON documents (accessed)")
+        self.evict()
+
+    @staticmethod
+    def make_key(digest: str, laparams: Dict[str, Any]) -> str:
+        """Create a key from a hash of the PDF file content and the layout parameters.
+
+        Args:
+            digest (str)    : A hash of the PDF file content.
+            laparams (dict) : Layout parameters. (ex. ``vars(LAParams())`` )
+
+        Returns:
+            str : A key of the PDF.
+        """
+        str_laparams = json.dumps(laparams, sort_keys=True, default=str)
+        return "/".join([digest, hashlib.sha256(str_laparams.encode("utf-8")).hexdigest()])
+
+    def get(self, key: str) -> Tuple[Optional[int], Dict[int, List[Tuple[str, Tuple[float, ...]]]]]:
+        """Look up the pages of the PDF.
+
+        Returns:
+            tuple : The number of pages ( ``None`` if the PDF is not fully analyzed yet), and cached pages ( ``{page: [[text, bbox], ...]}`` )
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT num_pages, created FROM documents WHERE key = ?", (key,)).fetchone()
+            if row is None or (time.time() - row[1] > self.max_age):
+                return (None, {})
+            with self._conn:
+                self._conn.execute("UPDATE documents SET accessed = ? WHERE key = ?", (time.time(), key))
+            rows = self._conn.execute("SELECT page, texts, bboxes FROM pages WHERE key = ?", (key,)).fetchall()
+            self.hits += len(rows)
+        pages = {}
+        for page, texts, bboxes in rows:
+            coords = array("d")
+            coords.frombytes(bboxes)
+            pages[page] = [
+                [text, tuple(coords[4 * i : 4 * i + 4])] for i, text in enumerate(json.loads(zlib.decompress(texts)))
+            ]
+        return (row[0], pages)
+
+    def get_images(self, key: str) -> Dict[str, bytes]:
+        """Look up the images of the PDF.
+
+        Returns:
+            dict : ``{digest: data}``
+        """
+        with self._lock:
+            return dict(self._conn.execute("SELECT digest, data FROM images WHERE key = ?", (key,)).fetchall())
+
+    def set(
+        self,
+        key: str,
+        page: int,
+        contents: List[Tuple[Any, Tuple[float, ...]]],
+        images: Optional[Dict[str, bytes]] = None,
+    ) -> None:
+        """Store the contents of a page.
+
+        Args:
+            key (str)       : A key of the PDF.
+            page (int)      : Page number (0-based).
+            contents (list) : Each element is a list which contains [text, bbox(x0,y0,x1,y1)]. ``text`` must be JSON serializable.
+            images (dict)   : Images referred from ``contents`` ( ``{digest: data}`` ) (default= ``None``)
+        """
+        texts = zlib.compress(json.dumps([text for text, _ in contents], ensure_ascii=False).encode("utf-8"))
+        bboxes = array("d", [float(e) for _, bbox in contents for e in bbox]).tobytes()
+        now = time.time()
+        with self._lock, self._conn:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO documents VALUES (?, NULL, ?, ?)", (key, now, now)
+            ).rowcount
+            self._conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)", (key, page, texts, bboxes))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO images VALUES (?, ?, ?)", [(key, d, data) for d, data in (images or {}).items()]
+            )
+            self._num_insertions += inserted
+            self.misses += 1
+        if inserted and self._num_insertions % self.evict_every == 0:
+            self.evict()
+
+    def finish(self, key: str, num_pages: int) -> None:
+        """Mark that all ``num_pages`` pages of the PDF are stored."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE documents SET num_pages = ? WHERE key = ?", (num_pages, key))
+
+    def evict(self) -> int:
+        """Remove PDFs which are older than ``max_age``, and then the least recently used ones beyond ``max_entries``.
+
+        Returns:
+            int : Number of evicted PDFs.
+        """
+        with self._lock, self._conn:
+            num_evicted = self._conn.execute(
+                "DELETE FROM documents WHERE created < ?", (time.time() - self.max_age,)
+            ).rowcount
+            num_evicted += self._conn.execute(
+                "DELETE FROM documents WHERE key IN (SELECT key FROM documents ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            self._conn.execute("DELETE FROM pages WHERE key NOT IN (SELECT key FROM documents)")
+            self._conn.execute("DELETE FROM images WHERE key NOT IN (SELECT key FROM documents)")
+        return num_evicted
+
+    def clear(self) -> None:
+        """Remove all PDFs."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents")
+            self._conn.execute("DELETE FROM pages")
+            self._conn.execute("DELETE FROM images")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the number of PDFs."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
@@ -5,8 +5,9 @@ import os
 import tarfile
 import zipfile
 from abc import ABCMeta, abstractstaticmethod
+from contextlib import closing
 from io import _io
-from typing import List, Optional, Union
+from typing import IO, Iterator, List, Optional, Tuple, Union
 
 from ._type import T_NoneType
 from .coloring_utils import toBLUE
@@ -83,6 +84,22 @@ def is_compressed(ext: str) -> bool:
     return ext in [".zip", ".gz", ".tar.gz", ".tgz", "bzip2", ".tar.bz2", ".tar"]
 
 
+def get_extractor(path: str) -> "GummyAbstExtractor":
+    """Get the extractor for a compressed file.
+
+    Args:
+        path (str) : path/to/compressed_file.
+
+    Returns:
+        GummyAbstExtractor : :class:`ZipExtractor <gummy.utils.compress_utils.ZipExtractor>` or :class:`TarExtractor <gummy.utils.compress_utils.TarExtractor>`
+    """
+    zip_ext = os.path.splitext(path)[-1]
+    if zip_ext == "":
+        mimetype = get_mimetype(path)
+        zip_ext = ".zip" if (mimetype is not None) and (mimetype.split("/")[-1] == "zip") else None
+    return {".zip": ZipExtractor}.get(zip_ext, TarExtractor)
+
+
 def extract_from_compressed(
     path: str, ext: Optional[str] = None, dirname: str = ".", verbose: bool = True
 ) -> List[str]:
@@ -97,11 +114,7 @@ def extract_from_compressed(
     Returns:
         list : Paths of extracted files.
     """
-    zip_ext = os.path.splitext(path)[-1]
-    if zip_ext == "":
-        mimetype = get_mimetype(path)
-        zip_ext = ".zip" if (mimetype is not None) and (mimetype.split("/")[-1] == "zip") else None
-    Extractor = {".zip": ZipExtractor}.get(zip_ext, TarExtractor)
+    Extractor = get_extractor(path)
     extracted_file_paths = Extractor.extract_from_compressed(
         path=path,
         ext=ext,
@@ -111,6 +124,57 @@ def extract_from_compressed(
     return extracted_file_paths
 
 
+def iter_from_compressed(path: str, ext: Optional[str] = None) -> Iterator[Tuple[str, IO[bytes]]]:
+    """Stream files in compressed file without extracting them to the disk.
+
+    Args:
+        path (str) : path/to/compressed_file.
+        ext (str)  : Stream only files with this extension. If ``None``, all files will be streamed.
+
+    Yields:
+        tuple (str, IO[bytes]) : Name of the file, and the file-like object which can be read until the next one is yielded.
+
+    Examples:
+        >>> from gummy.utils import iter_from_compressed
+        >>> for name, f in iter_from_compressed("2012.00001.tar.gz", ext=".tex"):
+        ...     print(name, len(f.read()))
+        main.tex 52110
+        appendix.tex 8014
+    """
+    yield from get_extractor(path).iter_from_compressed(path=path, ext=ext)
+
+
+def read_from_compressed(
+    path: str, ext: Optional[str] = None, max_files: Optional[int] = None
+) -> List[Tuple[str, bytes]]:
+    """Read files in compressed file into memory.
+
+    Args:
+        path (str)      : path/to/compressed_file.
+        ext (str)       : Read only files with this extension. If ``None``, all files will be read.
+        max_files (int) : Stop reading the compressed file after this number of files are found. (default= ``None``)
+
+    Returns:
+        list : Each element is a tuple of the name and the data of the file.
+
+    Examples:
+        >>> from gummy.utils import read_from_compressed
+        >>> name, data = read_from_compressed("2012.00001.tar.gz", ext=".tex", max_files=1)[0]
+        >>> name
+        'main.tex'
+    """
+    files = []
+    if max_files is not None and max_files <= 0:
+        return files
+    # Close the compressed file as soon as enough files are found.
+    with closing(iter_from_compressed(path=path, ext=ext)) as stream:
+        for name, f in stream:
+            files.append((name, f.read()))
+            if len(files) == max_files:
+                break
+    return files
+
+
 class GummyAbstExtractor(metaclass=ABCMeta):
     """File Extractor."""
 
@@ -143,6 +207,23 @@ class GummyAbstExtractor(metaclass=ABCMeta):
                     print(f"\t- {name}")
         return extracted_file_paths
 
+    @classmethod
+    def iter_from_compressed(cls, path: str, ext: Optional[str] = None) -> Iterator[Tuple[str, IO[bytes]]]:
+        """Stream files in compressed file without extracting them to the disk.
+
+        Args:
+            path (str) : path/to/compressed_file.
+            ext (str)  : Stream only files with this extension. If ``None``, all files will be streamed.
+
+        Yields:
+            tuple (str, IO[bytes]) : Name of the file, and the file-like object which can be read until the next one is yielded.
+        """
+        with cls.open_compressed_file(path) as compressed_f:
+            for name, member in cls.get_file_members(compressed_f):
+                if ext is None or name.endswith(ext):
+                    with cls.open_member(compressed_f, member) as f:
+                        yield (name, f)
+
     @abstractstaticmethod
     def open_compressed_file(path: str):
         """Open a compressed file."""
@@ -154,6 +235,17 @@ class GummyAbstExtractor(metaclass=ABCMeta):
         for name in compressed_f.namelist():
             yield name
 
+    @abstractstaticmethod
+    def get_file_members(compressed_f: _io._IOBase):
+        """Get pairs of the name and the member of files (not directories) in the order they are stored."""
+        for name in compressed_f.namelist():
+            yield (name, name)
+
+    @abstractstaticmethod
+    def open_member(compressed_f: _io._IOBase, member) -> IO[bytes]:
+        """Open a member in the compressed file as a file-like object."""
+        return compressed_f.open(member)
+
 
 class ZipExtractor(GummyAbstExtractor):
     """Extractor for Zip file.
@@ -175,6 +267,16 @@ class ZipExtractor(GummyAbstExtractor):
         for name in compressed_f.namelist():
             yield name
 
+    @staticmethod
+    def get_file_members(compressed_f: _io._IOBase):
+        for info in compressed_f.infolist():
+            if not info.is_dir():
+                yield (info.filename, info)
+
+    @staticmethod
+    def open_member(compressed_f: _io._IOBase, member: zipfile.ZipInfo) -> IO[bytes]:
+        return compressed_f.open(member)
+
 
 class TarExtractor(GummyAbstExtractor):
     """Extractor for Tar file.
@@ -197,3 +299,15 @@ class TarExtractor(GummyAbstExtractor):
         for m in compressed_f.getmembers():
             name = m.name
             yield name
+
+    @staticmethod
+    def get_file_members(compressed_f: _io._IOBase):
+        # Iterate over the archive instead of ``getmembers`` , so that the (compressed) stream is read only as far as
+        # the files are needed.
+        for m in compressed_f:
+            if m.isfile():
+                yield (m.name, m)
+
+    @staticmethod
+    def open_member(compressed_f: _io._IOBase, member: tarfile.TarInfo) -> IO[bytes]:
+        return compressed_f.extractfile(member)
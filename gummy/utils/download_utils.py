@@ -1,21 +1,37 @@
 # coding: utf-8
 """ Utility programs for downloading """
 import base64
+import hashlib
+import json
 import os
 import re
+import shutil
+import tempfile
+import threading
+import time
 import urllib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from io import _io
-from typing import Dict, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 import bs4
+import requests
+import urllib3
 
-from ._path import GUMMY_DIR, IMG_NOT_FOUND_SRC
+from ._path import CACHE_DIR, GUMMY_DIR, IMG_NOT_FOUND_SRC
 from .coloring_utils import toBLUE, toGREEN, toRED
-from .compress_utils import extract_from_compressed, is_compressed
+from .compress_utils import is_compressed, iter_from_compressed
 from .driver_utils import download_PDF_with_driver
 from .generic_utils import readable_bytes
+from .http_utils import HTTP_CONFIG, get_session
 from .monitor_utils import progress_reporthook_create
 
+IMAGE_CACHE_DIR: str = os.path.join(CACHE_DIR, "images")
+IMAGE_CACHE_TTL: float = 24 * 60 * 60
+DOWNLOAD_CACHE_DIR: str = os.path.join(CACHE_DIR, "downloads")
+DOWNLOAD_SEGMENT_SIZE: int = 2**20  # Minimum size [bytes] of each segment of a parallel download.
+
 CONTENT_ENCODING2EXT: Dict[str, str] = {
     "x-gzip": ".gz",
     "image/jpeg": ".jpg",
@@ -87,20 +103,137 @@ def decide_extension(
     return ext
 
 
+def _load_json_index(index_path: str) -> Dict[str, Union[str, float]]:
+    """Load an index file of the cache. If it is not found (or broken), return an empty one."""
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, mode="r") as f:
+                return json.load(f)
+        except ValueError:
+            pass
+    return {}
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` atomically. The temporary file has a unique name, so that threads and processes
+    writing the same ``path`` do not clobber each other's file."""
+    dirname = os.path.dirname(path)
+    os.makedirs(dirname, exist_ok=True)
+    with tempfile.NamedTemporaryFile(mode="wb", dir=dirname, suffix=".tmp", delete=False) as f:
+        f.write(data)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.remove(f.name)
+        raise
+
+
+def _dump_json_index(index_path: str, index: Dict[str, Union[str, float]]) -> None:
+    """Save an index file of the cache atomically."""
+    _write_atomically(index_path, json.dumps(index).encode("utf-8"))
+
+
+def _get_range_validator(index: Dict[str, Union[str, float]]) -> str:
+    """Get the validator for ``If-Range`` if the download recorded in ``index`` can be resumed, otherwise ``""`` .
+    (Weak ``ETag`` can not be used for it.)"""
+    if not (index.get("accept_ranges") and index.get("total_size", -1) >= 0):
+        return ""
+    etag = index.get("etag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return index.get("last_modified", "")
+
+
+def _split_into_segments(total_size: int, n_segments: int = 1) -> List[List[Optional[int]]]:
+    """Split ``[0, total_size)`` into segments ``[start, end]`` . If ``total_size`` is unknown (``-1`` ), ``end`` is ``None`` .
+
+    Examples:
+        >>> from gummy.utils.download_utils import _split_into_segments
+        >>> _split_into_segments(total_size=10 * 2**20, n_segments=4)
+        [[0, 2621440], [2621440, 5242880], [5242880, 7864320], [7864320, 10485760]]
+        >>> _split_into_segments(total_size=-1, n_segments=4)
+        [[0, None]]
+    """
+    if total_size < 0:
+        return [[0, None]]
+    n_segments = max(1, min(n_segments, total_size // DOWNLOAD_SEGMENT_SIZE))
+    bounds = [total_size * i // n_segments for i in range(n_segments + 1)]
+    return [[start, end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _download_segment(
+    ret: requests.Response, part_path: str, segment: List[Optional[int]], on_block: Callable[[int], None]
+) -> None:
+    """Write the body of ``ret`` to ``segment = [start, end]`` of ``part_path`` . ``start`` is advanced as it is written,
+    so ``segment`` always shows the range which is not downloaded yet."""
+    block_size = 8 * 1024
+    with open(part_path, mode="r+b") as f:
+        f.seek(segment[0])
+        while segment[1] is None or segment[0] < segment[1]:
+            block = ret.raw.read(block_size if segment[1] is None else min(block_size, segment[1] - segment[0]))
+            if len(block) == 0:
+                break
+            f.write(block)
+            segment[0] += len(block)
+            on_block(len(block))
+    if segment[1] is None:
+        segment[1] = segment[0]
+    elif segment[0] < segment[1]:
+        raise requests.ConnectionError(f"Connection was closed at {segment[0]} of {segment[1]} [bytes].")
+
+
+def _download_range(
+    url: str, part_path: str, segment: List[int], validator: str, on_block: Callable[[int], None]
+) -> None:
+    """Download ``segment = [start, end]`` of ``url`` with a ``Range`` request, and write it to ``part_path`` ."""
+    headers = {"Accept-Encoding": "identity", "Range": f"bytes={segment[0]}-{segment[1]-1}"}
+    if validator:
+        headers["If-Range"] = validator
+    with get_session().get(url=url, stream=True, headers=headers) as ret:
+        if ret.status_code != 206:
+            raise requests.HTTPError(f"Could not get {headers['Range']} (status={ret.status_code})", response=ret)
+        _download_segment(ret, part_path=part_path, segment=segment, on_block=on_block)
+
+
 def download_file(
-    url: str, dirname: str = ".", path: Optional[str] = None, bar_width: int = 20, verbose: bool = True
+    url: str,
+    dirname: str = ".",
+    path: Optional[str] = None,
+    bar_width: int = 20,
+    verbose: bool = True,
+    cache_dir: Optional[str] = None,
+    use_cache: bool = True,
+    n_segments: int = 1,
 ) -> str:
     """Download a file.
+
+    Headers and body are streamed in one request. ``<cache_dir>/<sha256(url)>.json`` records where the ``url`` was
+    saved with its ``ETag`` and ``Last-Modified`` , and if the file is still there, the next download of the same
+    ``url`` (to the same place) is a conditional request (``If-None-Match`` / ``If-Modified-Since`` ), so the body is
+    not pulled again unless it is modified.
+
+    The body is written to ``path + ".part"`` . If the server accepts range requests (``Accept-Ranges: bytes`` ), the
+    ranges which are not downloaded yet are also recorded, and an interrupted transfer is resumed from there with
+    ``Range`` and ``If-Range`` (in this call up to ``HTTP_CONFIG["retries"]`` times, and in the next call.) In that
+    case, the file can be also downloaded in ``n_segments`` parallel segments (of ``DOWNLOAD_SEGMENT_SIZE`` bytes or
+    more.) The browser is opened only if the server does not serve the file at all.
+
     Args:
-        url (str)       : File URL.
-        dirname (str)   : The directory where downloaded data will be saved.
-        path (str)      : path/to/downloaded_file
-        bar_width (int) : The width of progress bar.
-        verbose (bool)  : Whether print verbose or not.
+        url (str)        : File URL.
+        dirname (str)    : The directory where downloaded data will be saved.
+        path (str)       : path/to/downloaded_file
+        bar_width (int)  : The width of progress bar.
+        verbose (bool)   : Whether print verbose or not.
+        cache_dir (str)  : Where the index of downloaded files is saved. If ``None``, use ``DOWNLOAD_CACHE_DIR`` . (default= ``None``)
+        use_cache (bool) : Whether to revalidate (or resume) the file downloaded before instead of downloading it again. (default= ``True``)
+        n_segments (int) : The maximum number of segments downloaded in parallel. (default= ``1``)
 
     Returns:
         path (str) : path/to/downloaded_file
 
+    Raises:
+        requests.RequestException : If the transfer is interrupted more than ``HTTP_CONFIG["retries"]`` times.
+
     Examples:
         >>> from gummy.utils import download_file
         >>> download_file(url="https://raw.githubusercontent.com/opencv/opencv/master/data/haarcascades/haarcascade_eye.xml")
@@ -111,46 +244,235 @@ def download_file(
                     * Save Destination : ./haarcascade_eye.xml
         haarcascade_eye.xml	100.0%[####################] 0.1[s] 5.5[GB/s]	eta -0.0[s]
         './haarcascade_eye.xml'
+        >>> download_file(url="https://raw.githubusercontent.com/opencv/opencv/master/data/haarcascades/haarcascade_eye.xml")
+        ./haarcascade_eye.xml is not modified since the last download.
+        './haarcascade_eye.xml'
     """
-    try:
-        with urllib.request.urlopen(url) as web_file:
-            # Get Information from webfile header
-            headers = dict(web_file.headers._headers)
-        content_encoding = headers.get("Content-Encoding")
-        content_length, unit = readable_bytes(int(headers.get("Content-Length", 0)))
-        content_length = f"{content_length:.1f} [{unit}]"
-        content_type = headers.get("Content-Type")
-        fn = url.split("/")[-1]
-        if path is None:
-            *name, ext = fn.split(".")
-            name = ".".join(name)
-            guessed_ext = decide_extension(content_encoding, content_type, fn)
-            path = os.path.join(dirname, name + guessed_ext)
-        if verbose:
-            print(
-                f"""Download a file from {toBLUE(url)}
+    index_path = os.path.join(
+        cache_dir or DOWNLOAD_CACHE_DIR, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json"
+    )
+    index = _load_json_index(index_path) if use_cache else {}
+    cached_path = index.get("path", "")
+    # Revalidate (or resume) only if the file downloaded before is where it is requested to be saved.
+    is_requested = bool(cached_path) and (
+        os.path.abspath(cached_path) == os.path.abspath(path)
+        if path is not None
+        else os.path.abspath(os.path.dirname(cached_path)) == os.path.abspath(dirname)
+    )
+    is_cached = is_requested and os.path.isfile(cached_path)
+    segments = index.get("segments") if is_requested and os.path.isfile(cached_path + ".part") else None
+    validator = _get_range_validator(index)
+    num_retries = 0
+    while True:
+        # Ask for the file as it is (e.g. arXiv serves the tarball with "Content-Encoding: x-gzip")
+        headers = {"Accept-Encoding": "identity"}
+        if is_cached and index.get("etag"):
+            headers["If-None-Match"] = index["etag"]
+        if is_cached and index.get("last_modified"):
+            headers["If-Modified-Since"] = index["last_modified"]
+        if segments and validator:
+            headers["Range"] = f"bytes={segments[0][0]}-{segments[0][1]-1}"
+            headers["If-Range"] = validator
+        is_started = False
+        try:
+            with get_session().get(url=url, stream=True, headers=headers) as ret:
+                if ret.status_code == 304 and is_cached:
+                    if verbose:
+                        print(f"{toBLUE(cached_path)} is not modified since the last download.")
+                    index["validated_at"] = time.time()
+                    _dump_json_index(index_path, index)
+                    return cached_path
+                if ret.status_code == 416 and "Range" in headers:
+                    # The recorded ranges are not valid any more, so download the whole file again.
+                    # (It is not counted as a retry, and it never happens twice because "Range" is not sent again.)
+                    segments = None
+                    continue
+                ret.raise_for_status()
+                if ret.status_code == 206 and "Range" in headers:
+                    path = index["path"]
+                    total_size = index["total_size"]
+                    if verbose:
+                        print(f"Resume downloading {toBLUE(path)} from {toBLUE(url)}")
+                else:
+                    # Get Information from webfile header
+                    content_encoding = ret.headers.get("Content-Encoding")
+                    total_size = int(ret.headers.get("Content-Length", -1))
+                    content_length, unit = readable_bytes(max(total_size, 0))
+                    content_length = f"{content_length:.1f} [{unit}]"
+                    content_type = ret.headers.get("Content-Type")
+                    if path is None:
+                        *name, ext = url.split("/")[-1].split(".")
+                        name = ".".join(name)
+                        guessed_ext = decide_extension(content_encoding, content_type, url.split("/")[-1])
+                        path = os.path.join(dirname, name + guessed_ext)
+                    if verbose:
+                        print(
+                            f"""Download a file from {toBLUE(url)}
             * Content-Encoding : {toGREEN(content_encoding)}
             * Content-Length   : {toGREEN(content_length)}
             * Content-Type     : {toGREEN(content_type)}
             * Save Destination : {toBLUE(path)}"""
-            )
-        _, res = urllib.request.urlretrieve(
-            url=url,
-            filename=path,
-            reporthook=progress_reporthook_create(filename=fn, bar_width=bar_width, verbose=verbose),
-        )
+                        )
+                    is_cached = False
+                    index = {
+                        "path": path,
+                        "etag": ret.headers.get("ETag", ""),
+                        "last_modified": ret.headers.get("Last-Modified", ""),
+                        "total_size": total_size,
+                        "accept_ranges": ret.headers.get("Accept-Ranges") == "bytes",
+                    }
+                    validator = _get_range_validator(index)
+                    segments = _split_into_segments(total_size=total_size, n_segments=n_segments if validator else 1)
+                    # Write to a temporary file, so that a broken download is never taken as the file.
+                    with open(path + ".part", mode="wb") as f:
+                        if len(segments) > 1:
+                            f.truncate(total_size)
+                is_started = True
+                downloaded = total_size - sum(end - start for start, end in segments) if total_size >= 0 else 0
+                reporthook = progress_reporthook_create(
+                    filename=url.split("/")[-1], bar_width=bar_width, verbose=verbose
+                )
+                reporthook(0, 1, total_size)
+                lock = threading.Lock()
+
+                def on_block(size: int) -> None:
+                    nonlocal downloaded
+                    with lock:
+                        downloaded += size
+                        reporthook(downloaded, 1, total_size)
+
+                try:
+                    # The first segment is in the body of this response, and others are got with range requests.
+                    with ThreadPoolExecutor(max_workers=max(1, len(segments) - 1)) as executor:
+                        futures = [
+                            executor.submit(_download_range, url, path + ".part", segment, validator, on_block)
+                            for segment in segments[1:]
+                        ]
+                        _download_segment(ret, part_path=path + ".part", segment=segments[0], on_block=on_block)
+                        for future in futures:
+                            future.result()
+                finally:
+                    segments = [[start, end] for start, end in segments if end is None or start < end]
+                    if use_cache and len(segments) > 0 and validator:
+                        _dump_json_index(index_path, dict(index, segments=segments, validated_at=time.time()))
+            os.replace(path + ".part", path)
+            if use_cache:
+                _dump_json_index(index_path, dict(index, validated_at=time.time()))
+            return path
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            if verbose:
+                print(f"{toRED(e)} : url={toBLUE(url)}")
+            if not is_started:
+                # The server does not serve the file, so try the browser.
+                break
+            if num_retries >= HTTP_CONFIG["retries"]:
+                # The transfer was interrupted too many times. (The ".part" file is resumed in the next call.)
+                if isinstance(e, requests.RequestException):
+                    raise
+                raise requests.ConnectionError(e) from e
+            num_retries += 1
+            if not validator:
+                segments = None
+            if verbose:
+                print(f"Retry downloading ({num_retries}/{HTTP_CONFIG['retries']})")
+    if verbose:
+        print(f"Try to download using webdriver {toRED('(Open Browser)')}")
+    try:
+        path = download_PDF_with_driver(url=url, dirname=dirname, verbose=verbose)
     except urllib.error.URLError as e:
-        if verbose:
-            print(f"{toRED(e)} : url={toBLUE(url)}")
-            print(f"Try to download using webdriver {toRED('(Open Browser)')}")
-        try:
-            path = download_PDF_with_driver(url=url, dirname=dirname, verbose=verbose)
-        except urllib.error.URLError as e:
-            print(f"{toRED(e)}")
-            path = None
+        print(f"{toRED(e)}")
+        path = None
     return path
 
 
+def get_img_url(src: Union[bs4.element.Tag, str], base: Optional[str] = None) -> str:
+    """Get the absolute image url from src url or <img> tag element.
+
+    Args:
+        src (str, bs4.element.Tag) : Image src url, or ``<img>`` tag element.
+        base (str)                 : Base URL. Join a base URL and a possibly relative URL to form an absolute interpretation of the latter.
+
+    Returns:
+        str : Image url.
+    """
+    if isinstance(src, bs4.element.Tag) and src.name == "img":
+        for target in ["src", "data-src", "data-original"]:
+            s = src.get(target)
+            if (s is not None) and (not re.match(pattern=r"^(javascript:|data:).+", string=s)):
+                break
+        src = s
+    return urllib.parse.urljoin(base=base, url=src)
+
+
+def fetch_image(url: str, cache_dir: Optional[str] = None, ttl: Optional[float] = None) -> bytes:
+    """Fetch an image through the content-addressed cache.
+
+    Images are stored as ``<cache_dir>/<sha256[:2]>/<sha256>`` , and ``<cache_dir>/urls/<sha256(url)>.json`` records which
+    one the ``url`` points to with its ``ETag`` . The cached image is used as it is for ``ttl`` seconds, and after that,
+    it is revalidated with ``If-None-Match`` .
+
+    Args:
+        url (str)       : Image url.
+        cache_dir (str) : Where images are cached. If ``None``, use ``IMAGE_CACHE_DIR`` . (default= ``None``)
+        ttl (float)     : How long the cached image is used without revalidation [s]. If ``None``, use ``IMAGE_CACHE_TTL`` . (default= ``None``)
+
+    Returns:
+        bytes : Image data.
+    """
+    cache_dir = cache_dir or IMAGE_CACHE_DIR
+    ttl = IMAGE_CACHE_TTL if ttl is None else ttl
+    index_path = os.path.join(cache_dir, "urls", hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+    index = _load_json_index(index_path)
+    blob_path = os.path.join(cache_dir, index.get("digest", "")[:2], index.get("digest", "-"))
+    is_cached = os.path.exists(blob_path)
+    if is_cached and time.time() - index.get("validated_at", 0) < ttl:
+        with open(blob_path, mode="rb") as f:
+            return f.read()
+    headers = {"If-None-Match": index["etag"]} if is_cached and index.get("etag") else {}
+    ret = get_session().get(url=url, headers=headers)
+    if ret.status_code == 304:
+        with open(blob_path, mode="rb") as f:
+            data = f.read()
+    else:
+        ret.raise_for_status()
+        data = ret.content
+        index["digest"] = digest = hashlib.sha256(data).hexdigest()
+        index["etag"] = ret.headers.get("ETag", "")
+        blob_path = os.path.join(cache_dir, digest[:2], digest)
+        if not os.path.exists(blob_path):
+            _write_atomically(blob_path, data)
+    index["validated_at"] = time.time()
+    _dump_json_index(index_path, index)
+    return data
+
+
+def prefetch_images(urls: Iterable[str], max_workers: int = 8, verbose: bool = True) -> List[str]:
+    """Download images concurrently (with bounded parallelism) into the cache used by :meth:`fetch_image <gummy.utils.download_utils.fetch_image>` .
+
+    Args:
+        urls (list)       : Image urls.
+        max_workers (int) : Maximum number of images downloaded at the same time. (default= ``8``)
+        verbose (bool)    : Whether print verbose or not.
+
+    Returns:
+        list : Urls which could not be fetched.
+    """
+    urls = list(dict.fromkeys([url for url in urls if url.startswith("http")]))
+
+    def prefetch(url: str) -> bool:
+        try:
+            fetch_image(url)
+            return True
+        except Exception:
+            return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        failed = [url for url, ok in zip(urls, executor.map(prefetch, urls)) if not ok]
+    if verbose and len(urls) > 0:
+        print(f"Prefetched {toGREEN(len(urls)-len(failed))}/{len(urls)} images.")
+    return failed
+
+
 def src2base64(src: Union[bs4.element.Tag, str], base: Optional[str] = None) -> str:
     """Create base64 encoded img tag from src url or <img> tag element.
 
@@ -173,20 +495,10 @@ def src2base64(src: Union[bs4.element.Tag, str], base: Optional[str] = None) ->
         ...     f.write(img_tag)
         >>> # open sample.html to check the results.
     """
-    if isinstance(src, bs4.element.Tag) and src.name == "img":
-        for target in ["src", "data-src", "data-original"]:
-            s = src.get(target)
-            if (s is not None) and (not re.match(pattern=r"^(javascript:|data:).+", string=s)):
-                break
-        src = s
-    url = urllib.parse.urljoin(base=base, url=src)
+    url = get_img_url(src=src, base=base)
     try:
-        request = urllib.request.Request(
-            url, headers={"User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:47.0) Gecko/20100101 Firefox/47.0"}
-        )
-        with urllib.request.urlopen(request) as web_file:
-            data = base64.b64encode(web_file.read()).decode("utf-8")
-            img_tag = f'<img src="data:image/jpeg;base64,{data}"/>'
+        data = base64.b64encode(fetch_image(url)).decode("utf-8")
+        img_tag = f'<img src="data:image/jpeg;base64,{data}"/>'
     except Exception as e:
         print(f"Tried to get an image but got an error: {toRED(e)}")
         img_tag = f'<img src="{IMG_NOT_FOUND_SRC}"/>'
@@ -242,8 +554,12 @@ def match2path(file: Union[str, _io._IOBase], dirname: str = GUMMY_DIR) -> str:
             print(toRED(f"Failed to download PDF from {toBLUE(file)}"))
         ext = "." + path.split(".")[-1]
         if is_compressed(ext):
-            extracted_file_paths = extract_from_compressed(path, ext=".pdf", dirname=dirname)
-            path = extracted_file_paths[0]
+            # Extract only the first PDF (which is streamed out of the compressed file.)
+            with closing(iter_from_compressed(path, ext=".pdf")) as stream:
+                name, f = next(stream)
+                path = os.path.join(dirname, os.path.basename(name))
+                with open(path, mode="wb") as fpdf:
+                    shutil.copyfileobj(f, fpdf)
     else:
         path = file
     return path
@@ -1,14 +1,19 @@
 # coding: utf-8
 """ Utility programs for Selenium WebDriver. See `1. Installation — Selenium Python Bindings 2 documentation <https://selenium-python.readthedocs.io/installation.html#drivers>`_ for more details."""
+import json
+import os
+import queue
+import threading
 import time
 import warnings
 from calendar import c
 from lib2to3.pgen2 import driver
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import undetected_chromedriver as uc
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, WebDriverException
 from selenium.webdriver import DesiredCapabilities
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -23,6 +28,10 @@ from .coloring_utils import toACCENT, toBLUE, toGRAY, toGREEN, toRED
 from .generic_utils import get_latest_filename, handleKeyError, try_wrapper
 
 SUPPORTED_DRIVER_TYPES: List[str] = ["local", "remote"]
+DRIVER_TYPE_STATE_PATH: str = os.path.join(GUMMY_DIR, ".driver_type.json")  # Memoize the result of _check_driver.
+DRIVER_TYPE_TTL: int = 24 * 60 * 60
+_DRIVER_TYPE: Optional[str] = None
+_DRIVER_TYPE_LOCK = threading.Lock()
 
 
 def _print_driver_check_log(is_succeed: bool, driver_type: str) -> None:
@@ -114,26 +123,64 @@ def _get_driver_remote(chrome_options: Options, selenium_port: str = "4444", **k
     return driver
 
 
-############################
-#  START: Check driver
-############################
+def get_driver_type(refresh: bool = False, ttl: int = DRIVER_TYPE_TTL, verbose: bool = True) -> str:
+    """Get the driver type which works in your current environment.
 
-try:
-    __DRIVER_SETUP__
-except NameError:
-    DRIVER_TYPE = _check_driver()
-    print(f"DRIVER_TYPE: {toACCENT(DRIVER_TYPE)}")
-    __DRIVER_SETUP__: bool = True
-    if DRIVER_TYPE == "":
-        warnings.warn(message="Fails to launch all supported drivers.", category=DriverNotFoundWarning)
+    Drivers are not probed when ``gummy`` is imported, but when this function is called for the first time. The result
+    is memoized in the process and in ``DRIVER_TYPE_STATE_PATH`` for ``ttl`` seconds, so other processes do not need
+    to launch drivers again.
 
-############################
-#  END: Check driver
-############################
+    Args:
+        refresh (bool) : Whether to probe drivers again even if the result is memoized. (default= ``False``)
+        ttl (int)      : How long the result in ``DRIVER_TYPE_STATE_PATH`` is valid [s]. (default= ``DRIVER_TYPE_TTL``)
+        verbose (bool) : Whether you want to print output or not. (default= ``True`` )
+
+    Returns:
+        str : One of ``SUPPORTED_DRIVER_TYPES`` ( ``""`` if no driver can be built.)
+
+    Examples:
+        >>> from gummy.utils import get_driver_type
+        >>> get_driver_type()
+        [o] local driver CAN be built.
+        [x] remote driver CAN NOT be built.
+        DRIVER_TYPE: local
+        'local'
+        >>> get_driver_type()
+        'local'
+    """
+    global _DRIVER_TYPE
+    with _DRIVER_TYPE_LOCK:
+        if (not refresh) and (_DRIVER_TYPE is not None):
+            return _DRIVER_TYPE
+        if (not refresh) and os.path.exists(DRIVER_TYPE_STATE_PATH):
+            try:
+                with open(DRIVER_TYPE_STATE_PATH, mode="r") as f:
+                    state = json.load(f)
+                if state["driver_type"] in SUPPORTED_DRIVER_TYPES and time.time() - state["checked_at"] < ttl:
+                    _DRIVER_TYPE = state["driver_type"]
+                    return _DRIVER_TYPE
+            except (ValueError, KeyError, TypeError):
+                pass
+        _DRIVER_TYPE = _check_driver()
+        if verbose:
+            print(f"DRIVER_TYPE: {toACCENT(_DRIVER_TYPE)}")
+        if _DRIVER_TYPE == "":
+            warnings.warn(message="Fails to launch all supported drivers.", category=DriverNotFoundWarning)
+        else:
+            with open(DRIVER_TYPE_STATE_PATH, mode="w") as f:
+                json.dump({"driver_type": _DRIVER_TYPE, "checked_at": time.time()}, f)
+        return _DRIVER_TYPE
+
+
+def __getattr__(name: str) -> Any:
+    # ``DRIVER_TYPE`` used to be decided at import time. Keep it available, but decide it lazily.
+    if name == "DRIVER_TYPE":
+        return get_driver_type()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_driver(
-    driver_type: str = DRIVER_TYPE,
+    driver_type: Optional[str] = None,
     chrome_options: Optional[Options] = None,
     browser: bool = False,
     undetected: bool = True,
@@ -142,11 +189,12 @@ def get_driver(
     """Get a driver that works in your current environment.
 
     Args:
-        driver_type (str)              : driver type. (default= ``DRIVER_TYPE``)
+        driver_type (str)              : driver type. If not specify, use :meth:`get_driver_type() <gummy.utils.driver_utils.get_driver_type>` to decide it.
         chrome_options (ChromeOptions) : Instance of ChromeOptions. If not specify, use :meth:`get_chrome_options() <gummy.utils.driver_utils.get_chrome_options>` to get default options.
         browser (bool)                 : Whether you want to run Chrome with GUI browser. (default= ``False`` )
         selenium_port (str)            : selenium port number. This will be used when you run on `Docker <https://github.com/iwasakishuto/Translation-Gummy/tree/master/docker>`_
     """
+    driver_type = driver_type or get_driver_type()
     handleKeyError(lst=SUPPORTED_DRIVER_TYPES, driver_type=driver_type)
     if chrome_options is None:
         chrome_options = get_chrome_options(browser=browser)
@@ -156,6 +204,174 @@ def get_driver(
         return _get_driver_remote(chrome_options=chrome_options, selenium_port=selenium_port)
 
 
+class DriverPool:
+    """Pool of Selenium WebDrivers which are shared by multiple threads.
+
+    Drivers are launched lazily (up to ``size``) with :meth:`get_driver <gummy.utils.driver_utils.get_driver>`,
+    checked whether they are still alive when they are acquired, and recycled (quit and relaunched) after they
+    are used ``max_uses`` times. A ``driver`` given from the outside (:attr:`external` ) is also pooled, but it is
+    never recycled. If it stops responding, it is quit and dropped, and :meth:`replace_external <gummy.utils.driver_utils.DriverPool.replace_external>`
+    gives the new one.
+
+    Args:
+        size (int)         : Maximum number of drivers. (default= ``1``)
+        max_uses (int)     : Number of uses after which a driver is recycled. (default= ``100``)
+        driver (WebDriver) : Selenium WebDriver which is already launched. (default= ``None``)
+        verbose (bool)     : Whether you want to print output or not. (default= ``True`` )
+        driver_kwargs      : Keyword arguments for :meth:`get_driver <gummy.utils.driver_utils.get_driver>`.
+
+    Examples:
+        >>> from gummy.utils import DriverPool
+        >>> with DriverPool(size=2) as pool:
+        ...     with pool.get() as driver:
+        ...         driver.get("https://www.google.com/")
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_uses: int = 100,
+        driver: Optional[WebDriver] = None,
+        verbose: bool = True,
+        **driver_kwargs,
+    ):
+        self.size: int = max(size, 1)
+        self.max_uses: int = max_uses
+        self.verbose: bool = verbose
+        self.driver_kwargs: Dict[str, Any] = driver_kwargs
+        self._idle: queue.Queue = queue.Queue()
+        self._uses: Dict[int, int] = {}
+        self._external: Optional[WebDriver] = driver
+        self._num_drivers: int = 0
+        self._lock = threading.Lock()
+        if driver is not None:
+            self._add(driver)
+
+    def _add(self, driver: WebDriver) -> None:
+        with self._lock:
+            self._num_drivers += 1
+            self._uses[id(driver)] = 0
+        self._idle.put(driver)
+
+    def _discard(self, driver: WebDriver) -> None:
+        with self._lock:
+            self._num_drivers -= 1
+            self._uses.pop(id(driver), None)
+            if driver is self._external:
+                self._external = None
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @property
+    def external(self) -> Optional[WebDriver]:
+        """The driver given from the outside. ``None`` if it has been dropped because it stopped responding."""
+        return self._external
+
+    def replace_external(self) -> WebDriver:
+        """Replace the external driver dropped by the pool. An idle driver in the pool is taken over if there is one,
+        otherwise a new one is launched. The pool does not quit it any more, so it has to be quit by the caller.
+
+        Returns:
+            WebDriver : Selenium WebDriver, which is the new :attr:`external` .
+        """
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            driver = get_driver(**self.driver_kwargs)
+            with self._lock:
+                self._num_drivers += 1
+                self._uses[id(driver)] = 0
+        with self._lock:
+            self._external = driver
+        self._idle.put(driver)
+        return driver
+
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        """Check whether the ``driver`` still responds or not."""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """Acquire a healthy driver. If all drivers are in use and the pool is full, wait up to ``timeout`` seconds.
+
+        Args:
+            timeout (float) : Number of seconds before timing out. (default= ``None``)
+
+        Returns:
+            WebDriver : Selenium WebDriver.
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    launch = self._num_drivers < self.size
+                    if launch:
+                        self._num_drivers += 1
+                if launch:
+                    try:
+                        driver = get_driver(**self.driver_kwargs)
+                    except Exception:
+                        with self._lock:
+                            self._num_drivers -= 1
+                        raise
+                    if self.verbose:
+                        print(f"Launched a driver ({toBLUE(self._num_drivers)}/{self.size}) in the pool.")
+                    with self._lock:
+                        self._uses[id(driver)] = 0
+                    return driver
+                driver = self._idle.get(timeout=timeout)
+            if self.is_healthy(driver):
+                return driver
+            if self.verbose:
+                print(f"{toRED('Discarded')} a driver which does not respond.")
+            self._discard(driver)
+
+    def release(self, driver: WebDriver) -> None:
+        """Return the ``driver`` to the pool. It is recycled if it has been used ``max_uses`` times."""
+        with self._lock:
+            self._uses[id(driver)] = num_uses = self._uses.get(id(driver), 0) + 1
+        if num_uses >= self.max_uses and driver is not self._external:
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def get(self, timeout: Optional[float] = None) -> Iterator[WebDriver]:
+        """Acquire a driver, and release it at the end of the ``with`` block."""
+        driver = self.acquire(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Quit all idle drivers launched by the pool."""
+        idle_external = False
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if driver is self._external:
+                idle_external = True
+            else:
+                self._discard(driver)
+        if idle_external:
+            self._idle.put(self._external)
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
 def try_find_element(
     driver: WebDriver, by: str, identifier: str, timeout: int = 3, verbose: bool = True
 ) -> WebElement:
@@ -2,6 +2,7 @@
 """ Utility programs that can be used in general."""
 import argparse
 import datetime
+import importlib
 import os
 import re
 import shutil
@@ -182,6 +183,94 @@ def mk_class_get(
     return get
 
 
+def _iter_entry_points(group: str) -> list:
+    """Get entry points in ``group`` (Compatible with both ``Python<3.10`` and ``Python>=3.10``)"""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return []
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return list(eps.select(group=group))
+    return list(eps.get(group, []))
+
+
+class LazyClassRegistry(dict):
+    """Dictionary of ``identifier`` -> class, whose values are resolved (imported) only when they are accessed.
+
+    Each value is a class, or a ``"module:ClassName"`` string. If ``group`` is given, classes registered as entry points
+    in ``group`` are also added (without being loaded), so plugin packages can provide their own classes like::
+
+        [project.entry-points."gummy.journals"]
+        myjournal = "my_package.crawlers:MyJournalCrawler"
+
+    Args:
+        group (str) : Entry point group name. (default= ``None``)
+
+    Examples:
+        >>> from gummy.utils import LazyClassRegistry
+        >>> registry = LazyClassRegistry({"ordered": "collections:OrderedDict"})
+        >>> registry["ordered"]
+        collections.OrderedDict
+    """
+
+    def __init__(self, *args, group: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.group: Optional[str] = group
+        self._entry_points_loaded: bool = group is None
+
+    def _load_entry_points(self) -> None:
+        if not self._entry_points_loaded:
+            self._entry_points_loaded = True
+            for entry_point in _iter_entry_points(group=self.group):
+                self.setdefault(entry_point.name.lower(), entry_point)
+
+    @staticmethod
+    def resolve(value: Any) -> type:
+        """Resolve ``value`` (class, ``"module:ClassName"`` or entry point) to the class."""
+        if isinstance(value, str):
+            module_name, _, qualname = value.partition(":")
+            value = importlib.import_module(module_name)
+            for attr in qualname.split("."):
+                value = getattr(value, attr)
+        elif hasattr(value, "load"):
+            value = value.load()
+        return value
+
+    def __getitem__(self, key: str) -> type:
+        self._load_entry_points()
+        value = super().__getitem__(key)
+        if not isinstance(value, type):
+            value = self.resolve(value)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def __contains__(self, key: object) -> bool:
+        self._load_entry_points()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._load_entry_points()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._load_entry_points()
+        return super().__len__()
+
+    def keys(self):
+        self._load_entry_points()
+        return super().keys()
+
+    def values(self) -> list:
+        return [self[key] for key in self.keys()]
+
+    def items(self) -> list:
+        return [(key, self[key]) for key in self.keys()]
+
+
 def recreate_dir(path: str, exist_ok: bool = True) -> None:
     """Super-mkdir. Create a leaf directory and all intermediate ones.
 
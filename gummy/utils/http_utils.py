@@ -0,0 +1,142 @@
+# coding: utf-8
+""" Utility programs for HTTP(S) requests which do not need a browser. All of them share one pooled session."""
+import importlib.util
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_USER_AGENT: str = "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:47.0) Gecko/20100101 Firefox/47.0"
+HTTP_CONFIG: Dict[str, Any] = {
+    "pool_connections": 16,  # Number of hosts whose connections are kept alive.
+    "pool_maxsize": 16,  # Maximum number of connections per host.
+    "timeout": (10, 60),  # (connect, read) timeouts [s].
+    "retries": 3,
+    "backoff_factor": 0.5,  # Sleep backoff_factor * (2 ** (retry - 1)) [s] between retries.
+    "status_forcelist": (429, 500, 502, 503, 504),
+    "user_agent": DEFAULT_USER_AGENT,
+    "offline": False,  # If True, all requests fail immediately (e.g. when crawling recorded pages.)
+}
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_accept_encoding() -> str:
+    """Get the ``Accept-Encoding`` header. ``br`` is added only if a brotli decoder is installed."""
+    encodings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(name) is not None for name in ["brotli", "brotlicffi"]):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` which uses ``timeout`` if it is not specified for each request.
+
+    Args:
+        timeout (float, tuple) : Default ``(connect, read)`` timeouts [s].
+    """
+
+    def __init__(self, *args, timeout: Union[float, Tuple[float, float]] = HTTP_CONFIG["timeout"], **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class OfflineAdapter(BaseAdapter):
+    """Adapter which refuses all requests. It is used when the session is offline."""
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        raise requests.ConnectionError(f"The session is offline, so could not get {request.url}", request=request)
+
+    def close(self) -> None:
+        pass
+
+
+def create_session(
+    pool_connections: int = HTTP_CONFIG["pool_connections"],
+    pool_maxsize: int = HTTP_CONFIG["pool_maxsize"],
+    timeout: Union[float, Tuple[float, float]] = HTTP_CONFIG["timeout"],
+    retries: int = HTTP_CONFIG["retries"],
+    backoff_factor: float = HTTP_CONFIG["backoff_factor"],
+    status_forcelist: Tuple[int, ...] = HTTP_CONFIG["status_forcelist"],
+    user_agent: str = HTTP_CONFIG["user_agent"],
+    offline: bool = HTTP_CONFIG["offline"],
+) -> requests.Session:
+    """Create a session with connection pools, timeouts, retries with backoff, and transparent compression.
+
+    Args:
+        pool_connections (int)   : Number of hosts whose connections are kept alive.
+        pool_maxsize (int)       : Maximum number of connections per host.
+        timeout (float, tuple)   : Default ``(connect, read)`` timeouts [s].
+        retries (int)            : Maximum number of retries.
+        backoff_factor (float)   : Sleep ``backoff_factor * (2 ** (retry - 1))`` seconds between retries.
+        status_forcelist (tuple) : HTTP status codes which should be retried.
+        user_agent (str)         : ``User-Agent`` header.
+        offline (bool)           : If ``True`` , all requests raise ``requests.ConnectionError`` without any network access.
+
+    Returns:
+        requests.Session : A session.
+    """
+    retry_kwargs = dict(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        raise_on_status=False,
+    )
+    try:
+        retry = Retry(allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]), **retry_kwargs)
+    except TypeError:  # urllib3<1.26
+        retry = Retry(method_whitelist=frozenset(["HEAD", "GET", "OPTIONS"]), **retry_kwargs)
+    if offline:
+        adapter = OfflineAdapter()
+    else:
+        adapter = TimeoutHTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry, timeout=timeout
+        )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": user_agent, "Accept-Encoding": get_accept_encoding()})
+    return session
+
+
+def get_session() -> requests.Session:
+    """Get the session shared by all non-Selenium I/O. It is created at the first call with ``HTTP_CONFIG``.
+
+    Examples:
+        >>> from gummy.utils import get_session
+        >>> session = get_session()
+        >>> ret = session.get("https://www.nature.com/articles/ncb0800_500")
+        >>> ret.url
+        'https://www.nature.com/articles/ncb0800_500'
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = create_session(**HTTP_CONFIG)
+        return _SESSION
+
+
+def configure_session(**kwargs) -> requests.Session:
+    """Update ``HTTP_CONFIG`` and recreate the shared session.
+
+    Args:
+        kwargs : Keyword arguments for :meth:`create_session <gummy.utils.http_utils.create_session>`.
+
+    Examples:
+        >>> from gummy.utils import configure_session
+        >>> session = configure_session(pool_maxsize=32, timeout=(5, 30))
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        HTTP_CONFIG.update(kwargs)
+        old_session, _SESSION = _SESSION, create_session(**HTTP_CONFIG)
+    if old_session is not None:
+        old_session.close()
+    return _SESSION
@@ -3,16 +3,18 @@
 import os
 import re
 import sys
+import threading
 import time
 import warnings
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import requests
 from bs4 import BeautifulSoup
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from ._exceptions import JournalTypeIndistinguishableError, ShieldSquareCaptchaError
 from .coloring_utils import toACCENT, toBLUE, toGREEN, toRED
+from .http_utils import get_session
 
 DOMAIN2JOURNAL: Dict[str, str] = {
     "aacrjournals.org": "AACRPublications",
@@ -143,13 +145,55 @@ DOMAIN2JOURNAL: Dict[str, str] = {
 """
 
 
-def canonicalize(url, driver: Optional[WebDriver] = None, sleep_for_loading: int = 1) -> str:
+CANONICAL_URL_TTL: int = 10 * 60
+MAX_CACHED_BODY_SIZE: int = 16 * 1024 * 1024
+MAX_CANONICAL_URL_CACHE_SIZE: int = 128
+# url -> (expiration time, canonical url, body downloaded while resolving the url), in least recently used order.
+_CANONICAL_URL_CACHE: "OrderedDict[str, Tuple[float, str, Optional[bytes]]]" = OrderedDict()
+_CANONICAL_URL_LOCK = threading.Lock()
+
+
+def _read_body(ret, max_size: int = MAX_CACHED_BODY_SIZE) -> Optional[bytes]:
+    """Read the body of a streamed response, but give up (and return ``None`` ) once it exceeds ``max_size`` bytes.
+    ``Content-Length`` is not trusted, as it may be missing or wrong."""
+    chunks, size = [], 0
+    for chunk in ret.iter_content(chunk_size=64 * 1024):
+        size += len(chunk)
+        if size > max_size:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _resolve_url(url: str) -> Tuple[str, Optional[bytes]]:
+    """Follow redirects once. Try ``HEAD`` first, and if the server does not accept it, fall back to a streamed ``GET``
+    whose (HTML) body is kept, so that it does not have to be downloaded again.
+
+    Returns:
+        tuple : canonical URL ( ``str`` ), body ( ``bytes`` or ``None`` )
+    """
+    session = get_session()
+    ret = session.head(url=url, allow_redirects=True)
+    if ret.ok:
+        return (ret.url, None)
+    with session.get(url=url, stream=True) as ret:
+        body = _read_body(ret, max_size=MAX_CACHED_BODY_SIZE) if "html" in ret.headers.get("Content-Type", "") else None
+        return (ret.url, body)
+
+
+def canonicalize(
+    url, driver: Optional[WebDriver] = None, sleep_for_loading: int = 1, ttl: int = CANONICAL_URL_TTL
+) -> str:
     """canonicalize the URL by accessing the URL once.
 
+    The result is cached for ``ttl`` seconds (up to ``MAX_CANONICAL_URL_CACHE_SIZE`` URLs), so :meth:`whichJournal <gummy.utils.journal_utils.whichJournal>`
+    and :meth:`get_soup_source <gummy.journals.GummyAbstJournal.get_soup_source>` share one round-trip.
+
     Args:
         url (str)               : URL of the paper.
         driver (WebDriver)      : Selenium WebDriver. (default= ``None``)
         sleep_for_loading (int) : Number of seconds to wait for a web page to load (default= ``1`` )
+        ttl (int)               : How long the canonical URL is cached [s]. (default= ``CANONICAL_URL_TTL``)
 
     Returns:
         str : canonized URL.
@@ -159,14 +203,47 @@ def canonicalize(url, driver: Optional[WebDriver] = None, sleep_for_loading: int
     #     time.sleep(sleep_for_loading)
     #     cano_url = driver.current_url
     # else:
+    with _CANONICAL_URL_LOCK:
+        expires, cano_url, _ = _CANONICAL_URL_CACHE.get(url, (0, url, None))
+        if expires > time.time():
+            _CANONICAL_URL_CACHE.move_to_end(url)
+            return cano_url
     try:
-        ret = requests.get(url=url)
-        cano_url = ret.url
+        cano_url, body = _resolve_url(url)
     except:
-        cano_url = url
+        return url
+    with _CANONICAL_URL_LOCK:
+        now = time.time()
+        for key in [key for key, (expires, _, _) in _CANONICAL_URL_CACHE.items() if expires <= now]:
+            del _CANONICAL_URL_CACHE[key]
+        for key in set([url, cano_url]):
+            _CANONICAL_URL_CACHE[key] = (now + ttl, cano_url, body)
+            _CANONICAL_URL_CACHE.move_to_end(key)
+        while len(_CANONICAL_URL_CACHE) > MAX_CANONICAL_URL_CACHE_SIZE:
+            _CANONICAL_URL_CACHE.popitem(last=False)
     return cano_url
 
 
+def pop_canonical_body(url: str) -> Optional[bytes]:
+    """Pop the body downloaded while :meth:`canonicalize <gummy.utils.journal_utils.canonicalize>` resolved the ``url`` .
+
+    Args:
+        url (str) : URL (or canonical URL) of the paper.
+
+    Returns:
+        bytes : Body of the page if it has been downloaded, otherwise ``None`` .
+    """
+    with _CANONICAL_URL_LOCK:
+        expires, cano_url, body = _CANONICAL_URL_CACHE.get(url, (0, url, None))
+        if body is None or expires <= time.time():
+            return None
+        # The body is handed over only once to free the memory.
+        for key, (expires_, cano_url_, _) in list(_CANONICAL_URL_CACHE.items()):
+            if cano_url_ == cano_url:
+                _CANONICAL_URL_CACHE[key] = (expires_, cano_url_, None)
+    return body
+
+
 def whichJournal(url: str, driver: Optional[WebDriver] = None, verbose: bool = True) -> str:
     """Decide which journal from the domain of the ``url``
 
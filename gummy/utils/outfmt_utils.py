@@ -2,17 +2,22 @@
 """ Utility programs for creating HTML or PDF."""
 import os
 import re
+import threading
 import unicodedata
 import warnings
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pdfkit
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
-from ._path import TEMPLATES_DIR
+from ._path import CACHE_DIR, TEMPLATES_DIR
 from .coloring_utils import toBLUE, toGREEN, toRED
 from .generic_utils import str_strip
 
+JINJA_CACHE_DIR: str = os.path.join(CACHE_DIR, "jinja2")
+_JINJA_ENVIRONMENTS: Dict[str, Environment] = {}
+_JINJA_ENVIRONMENTS_LOCK = threading.Lock()
+
 
 def sanitize_filename(
     fp: str, dirname: Optional[str] = None, ext: Optional[str] = None, allow_unicode: bool = False
@@ -88,6 +93,39 @@ def get_jinja_all_attrs(string: str, keyname: str) -> set:
     return attributes
 
 
+def get_jinja_environment(searchpath: str = TEMPLATES_DIR) -> Environment:
+    """Get the ``jinja2.Environment`` for templates in ``searchpath`` . It is created at the first call for each
+    ``searchpath`` , and shared by all following calls, so each template is compiled only once.
+
+    Compiled templates are kept in the environment, and also in ``JINJA_CACHE_DIR`` as bytecode, which is reused by
+    other processes. A template is compiled again only if its file is modified (``auto_reload`` checks the mtime.)
+
+    Args:
+        searchpath (str) : Loader will find templates from the file system, and this directory is a base.
+
+    Returns:
+        Environment : The shared environment.
+
+    Examples:
+        >>> from gummy.utils import get_jinja_environment
+        >>> env = get_jinja_environment()
+        >>> env is get_jinja_environment()
+        True
+        >>> template = env.get_template("paper.html")
+    """
+    searchpath = os.path.abspath(searchpath)
+    with _JINJA_ENVIRONMENTS_LOCK:
+        env = _JINJA_ENVIRONMENTS.get(searchpath)
+        if env is None:
+            os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+            env = _JINJA_ENVIRONMENTS[searchpath] = Environment(
+                loader=FileSystemLoader(searchpath=searchpath),
+                bytecode_cache=FileSystemBytecodeCache(directory=JINJA_CACHE_DIR),
+                auto_reload=True,
+            )
+    return env
+
+
 def check_contents(path: str, contents: List[Dict[str, Any]] = []) -> None:
     """Check whether all attributes in template is contained in contents.
 
@@ -133,8 +171,7 @@ def tohtml(
     Returns:
         str : path/to/output.html
     """
-    env = Environment(loader=FileSystemLoader(searchpath=searchpath))
-    template = env.get_template(template)
+    template = get_jinja_environment(searchpath=searchpath).get_template(template)
 
     # TODO: Check nested all variables.
     # check_contents(path=template.filename, contents=contents)
@@ -2,21 +2,37 @@
 """Utility programs for handling and analyzing PDF file."""
 import base64
 import contextlib
+import hashlib
 import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from io import _io
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from pdfminer.converter import PDFPageAggregator
 from pdfminer.layout import LAParams, LTFigure, LTImage, LTItem, LTTextBox, LTTextLine
 from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
 from pdfminer.pdfpage import PDFPage
-from PyPDF2 import PdfFileWriter
-from PyPDF2.generic import ArrayObject, DictionaryObject, FloatObject, NameObject, NumberObject, TextStringObject
+from PyPDF2 import PdfFileReader, PdfFileWriter
+from PyPDF2.generic import (
+    ArrayObject,
+    DictionaryObject,
+    FloatObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
 from PyPDF2.pdf import PageObject
 from werkzeug.datastructures import FileStorage
 
 from ._path import GUMMY_DIR
+from .cache_utils import PDFLayoutCache
 from .download_utils import match2path
+from .generic_utils import handleKeyError
+
+PDF_LAPARAMS: Dict[str, Any] = {"detect_vertical": True}  # Keyword arguments of ``LAParams``.
+SUPPORTED_PDF_IMAGE_MODES: List[str] = ["inline", "ref", "none"]
 
 
 @contextlib.contextmanager
@@ -35,51 +51,341 @@ def get_pdf_pages(file: Union[FileStorage, str, _io._IOBase], dirname: str = GUM
             yield PDFPage.get_pages(fp=f_pdf)
 
 
-def parser_pdf_pages(layout_objs: List[LTItem]) -> List[Tuple[str, LTItem]]:
+class PDFImageRef:
+    """Lightweight reference to an image stored in :class:`PDFImageStore <gummy.utils.pdf_utils.PDFImageStore>` .
+    Its ``<img>`` tag (with base64 data) is materialized only when it is rendered (``str(ref)`` ).
+
+    Args:
+        digest (str)           : A hash (sha256) of the image data.
+        store (PDFImageStore)  : A store which has the image data.
+    """
+
+    __slots__ = ("digest", "store")
+
+    def __init__(self, digest: str, store: Optional["PDFImageStore"] = None):
+        self.digest: str = digest
+        self.store: Optional[PDFImageStore] = store
+
+    @property
+    def data(self) -> bytes:
+        """Raw data of the image."""
+        return self.store[self.digest]
+
+    def __str__(self) -> str:
+        return self.store.to_img_tag(self.digest)
+
+    __html__ = __str__
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, PDFImageRef) and other.digest == self.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        # Only the digest is sent to (or received from) other processes.
+        return (PDFImageRef, (self.digest,))
+
+    def __repr__(self) -> str:
+        return f"PDFImageRef({self.digest[:12]})"
+
+
+class PDFImageStore:
+    """Store of the distinct images in PDF, keyed by their digests. Repeated images (e.g. logos and watermarks on
+    every page) are stored only once, and base64 data is created only when it is rendered.
+
+    Examples:
+        >>> from gummy.utils import PDFImageStore
+        >>> images = PDFImageStore()
+        >>> ref = images.add(b"...")
+        >>> ref == images.add(b"...")
+        True
+        >>> len(images)
+        1
+        >>> str(ref)
+        '<img src="data:image/jpeg;base64,Li4u" />'
+    """
+
+    def __init__(self):
+        self.images: Dict[str, bytes] = {}
+        self._img_tags: Dict[str, str] = {}
+
+    def add(self, data: bytes) -> PDFImageRef:
+        """Store ``data`` (if it is new), and return its reference."""
+        digest = hashlib.sha256(data).hexdigest()
+        self.images.setdefault(digest, data)
+        return PDFImageRef(digest=digest, store=self)
+
+    def update(self, images: Dict[str, bytes]) -> None:
+        """Store ``{digest: data}`` ."""
+        for digest, data in images.items():
+            self.images.setdefault(digest, data)
+
+    def bind(self, page_texts: List[Tuple[Any, LTItem]]) -> List[Tuple[Any, LTItem]]:
+        """Make references in ``page_texts`` (e.g. received from other processes) refer to this store."""
+        for text, _ in page_texts:
+            if isinstance(text, PDFImageRef):
+                text.store = self
+        return page_texts
+
+    def to_img_tag(self, digest: str) -> str:
+        """Get the ``<img>`` tag with base64 data of the image. It is created at the first call."""
+        if digest not in self._img_tags:
+            bs64data = base64.b64encode(self.images[digest]).decode("utf-8")
+            self._img_tags[digest] = f'<img src="data:image/jpeg;base64,{bs64data}" />'
+        return self._img_tags[digest]
+
+    def __getitem__(self, digest: str) -> bytes:
+        return self.images[digest]
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self.images
+
+    def __len__(self) -> int:
+        return len(self.images)
+
+
+def parser_pdf_pages(
+    layout_objs: List[LTItem], image_mode: str = "inline", images: Optional[PDFImageStore] = None
+) -> List[Tuple[str, LTItem]]:
     """Parse PDF pages and get contents in order.
 
     Args:
-        layout_objs (list) : Each element is pdfminer.layout object.
+        layout_objs (list)      : Each element is pdfminer.layout object.
+        image_mode (str)        : How to handle images. One of ``SUPPORTED_PDF_IMAGE_MODES`` . (default= ``"inline"`` )
+        images (PDFImageStore)  : Where images are stored if ``image_mode=="ref"`` . (default= ``None`` )
 
     Returns:
-        list : Each element is a list which contains [text, bbox(x0,y0,x1,y1)]
+        list : Each element is a list which contains [text, bbox(x0,y0,x1,y1)]. An image is an ``<img>`` tag with base64 data (``"inline"`` ), a :class:`PDFImageRef <gummy.utils.pdf_utils.PDFImageRef>` (``"ref"`` ), or not contained (``"none"`` ).
     """
+    handleKeyError(lst=SUPPORTED_PDF_IMAGE_MODES, image_mode=image_mode)
+    if image_mode == "ref" and images is None:
+        images = PDFImageStore()
     objects = []
     for lt_obj in layout_objs:
         if isinstance(lt_obj, LTTextBox) or isinstance(lt_obj, LTTextLine):
             objects.append([lt_obj.get_text(), lt_obj.bbox])
         elif isinstance(lt_obj, LTImage):
-            rawdata = lt_obj.stream.get_rawdata()
-            bs64data = base64.b64encode(rawdata).decode("utf-8")
-            objects.append([f'<img src="data:image/jpeg;base64,{bs64data}" />', lt_obj.bbox])
+            if image_mode == "inline":
+                rawdata = lt_obj.stream.get_rawdata()
+                bs64data = base64.b64encode(rawdata).decode("utf-8")
+                objects.append([f'<img src="data:image/jpeg;base64,{bs64data}" />', lt_obj.bbox])
+            elif image_mode == "ref":
+                objects.append([images.add(lt_obj.stream.get_rawdata()), lt_obj.bbox])
         elif isinstance(lt_obj, LTFigure):
-            objects.extend(parser_pdf_pages(lt_obj._objs))
+            objects.extend(parser_pdf_pages(lt_obj._objs, image_mode=image_mode, images=images))
     return objects
 
 
-def get_pdf_contents(file: Union[FileStorage, str, _io._IOBase], dirname: str = GUMMY_DIR) -> List[Tuple[str, LTItem]]:
-    """Get PDF contents.
+def _dump_pdf_page(page_texts: List[Tuple[Any, LTItem]]) -> Tuple[List[Tuple[Any, LTItem]], Dict[str, bytes]]:
+    """Convert image references in ``page_texts`` into ``{"image": digest}`` to be stored in :class:`PDFLayoutCache <gummy.utils.cache_utils.PDFLayoutCache>` ."""
+    contents, images = [], {}
+    for text, bbox in page_texts:
+        if isinstance(text, PDFImageRef):
+            images[text.digest] = text.data
+            text = {"image": text.digest}
+        contents.append([text, bbox])
+    return (contents, images)
+
+
+def _load_pdf_page(contents: List[Tuple[Any, LTItem]], images: PDFImageStore) -> List[Tuple[Any, LTItem]]:
+    """Inverse of :func:`_dump_pdf_page <gummy.utils.pdf_utils._dump_pdf_page>` ."""
+    return [
+        [PDFImageRef(text["image"], store=images) if isinstance(text, dict) else text, bbox] for text, bbox in contents
+    ]
+
+
+def get_pdf_digest(file: Union[FileStorage, str, _io._IOBase], dirname: str = GUMMY_DIR) -> str:
+    """Get a hash (sha256) of the PDF file content.
 
     Args:
-        file (data, str) : url or path or data of PDF.
+        file (data, str) : url or path or data of PDF. The position of data is restored after reading.
         dirname (str)    : if ``file`` is url, download and save it to ``dirname``. (defalt= ``GUMMY_DIR``)
 
     Returns:
-        list : Each element is a list which contains [text, bbox(x0,y0,x1,y1)]
+        str : A hex digest.
     """
-    # Settings.
+    digest = hashlib.sha256()
+    if isinstance(file, FileStorage) or isinstance(file, io.TextIOWrapper):
+        fp = getattr(file, "buffer", file)
+        pos = fp.tell()
+        digest.update(fp.read())
+        fp.seek(pos)
+    else:
+        with open(match2path(file, dirname=dirname), mode="rb") as f_pdf:
+            for chunk in iter(lambda: f_pdf.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _create_pdf_interpreter() -> Tuple[PDFPageInterpreter, PDFPageAggregator]:
+    """Create an interpreter and a device to analyze layouts of PDF pages with ``PDF_LAPARAMS`` ."""
     rsrcmgr = PDFResourceManager()
-    laparams = LAParams(detect_vertical=True)
+    laparams = LAParams(**PDF_LAPARAMS)
     device = PDFPageAggregator(rsrcmgr=rsrcmgr, laparams=laparams)
     interpreter = PDFPageInterpreter(rsrcmgr=rsrcmgr, device=device)
-    #  parse PDF pages
+    return (interpreter, device)
+
+
+def _get_pdf_contents_of_pages(
+    path: str, pagenos: List[int], image_mode: str = "inline"
+) -> Tuple[List[List[Tuple[str, LTItem]]], Dict[str, bytes]]:
+    """Get contents of the pages ``pagenos`` (0-based), and images referred from them if ``image_mode=="ref"`` .
+    This is run in each worker process of :func:`iter_pdf_contents <gummy.utils.pdf_utils.iter_pdf_contents>` ."""
+    interpreter, device = _create_pdf_interpreter()
+    images = PDFImageStore()
     pdf_pages = []
+    with open(path, mode="rb") as f_pdf:
+        for page in PDFPage.get_pages(fp=f_pdf, pagenos=set(pagenos)):
+            interpreter.process_page(page)
+            layout = device.get_result()
+            pdf_pages.append(parser_pdf_pages(layout_objs=layout._objs, image_mode=image_mode, images=images))
+    return (pdf_pages, images.images)
+
+
+def get_pdf_num_pages(file: Union[FileStorage, str, _io._IOBase], dirname: str = GUMMY_DIR) -> int:
+    """Get the number of PDF pages without layout analysis.
+
+    Args:
+        file (data, str) : url or path or data of PDF. The position of data is restored after counting.
+        dirname (str)    : if ``file`` is url, download and save it to ``dirname``. (defalt= ``GUMMY_DIR``)
+
+    Returns:
+        int : The number of pages.
+    """
+    if isinstance(file, FileStorage) or isinstance(file, io.TextIOWrapper):
+        pos = file.tell()
+        num_pages = sum(1 for _ in PDFPage.get_pages(fp=file))
+        file.seek(pos)
+        return num_pages
+    path = match2path(file, dirname=dirname)
+    with open(path, mode="rb") as f_pdf:
+        return sum(1 for _ in PDFPage.get_pages(fp=f_pdf))
+
+
+def iter_pdf_contents(
+    file: Union[FileStorage, str, _io._IOBase],
+    dirname: str = GUMMY_DIR,
+    n_jobs: int = 1,
+    cache: Optional[PDFLayoutCache] = None,
+    image_mode: str = "inline",
+) -> Iterator[List[Tuple[str, LTItem]]]:
+    """Iterate PDF contents page by page. Each page is yielded as soon as its layout is analyzed, so the following
+    processes (e.g. translation) can start before the whole PDF is analyzed.
+
+    Layout analysis of ``pdfminer`` is CPU-bound, so if ``n_jobs`` is not ``1`` , pages are split into contiguous ranges,
+    and they are analyzed in ``n_jobs`` processes. Pages are yielded in page order when each range is finished.
+    If ``cache`` is given, pages analyzed before (with the same file content and ``PDF_LAPARAMS`` ) are read from it.
+
+    Args:
+        file (data, str)         : url or path or data of PDF.
+        dirname (str)            : if ``file`` is url, download and save it to ``dirname``. (defalt= ``GUMMY_DIR``)
+        n_jobs (int)             : Number of processes. If ``-1``, use all cores. It is ignored when ``file`` is data. (default= ``1``)
+        cache (PDFLayoutCache)   : Cache of the layout analysis results. (default= ``None``)
+        image_mode (str)         : How to handle images. See :func:`parser_pdf_pages <gummy.utils.pdf_utils.parser_pdf_pages>` . (default= ``"inline"``)
+
+    Yields:
+        list : Contents of a page. Each element is a list which contains [text, bbox(x0,y0,x1,y1)]
+
+    Examples:
+        >>> from gummy.utils import iter_pdf_contents
+        >>> for i, page_texts in enumerate(iter_pdf_contents("path/to/paper.pdf", image_mode="ref")):
+        ...     print(i, len(page_texts))
+    """
+    handleKeyError(lst=SUPPORTED_PDF_IMAGE_MODES, image_mode=image_mode)
+    n_jobs = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+    if isinstance(file, str):
+        # Download only once.
+        file = match2path(file, dirname=dirname)
+    # All images in this PDF are stored in one place, and pages have only their references.
+    images = PDFImageStore()
+
+    def store(i: int, page_texts: List[Tuple[str, LTItem]]) -> List[Tuple[str, LTItem]]:
+        if cache is not None:
+            contents, page_images = _dump_pdf_page(page_texts)
+            cache.set(key, page=i, contents=contents, images=page_images)
+        return page_texts
+
+    cached: Dict[int, List[Tuple[str, LTItem]]] = {}
+    if cache is not None:
+        laparams = dict(vars(LAParams(**PDF_LAPARAMS)), image_mode=image_mode)
+        key = cache.make_key(digest=get_pdf_digest(file), laparams=laparams)
+        num_pages, cached = cache.get(key)
+        if image_mode == "ref":
+            images.update(cache.get_images(key))
+            cached = {i: _load_pdf_page(contents, images=images) for i, contents in cached.items()}
+        if num_pages is not None and len(cached) >= num_pages:
+            yield from (cached[i] for i in range(num_pages))
+            return
+    if n_jobs > 1 and isinstance(file, str):
+        num_pages = get_pdf_num_pages(file)
+        missing = [i for i in range(num_pages) if i not in cached]
+        if len(missing) > 1:
+            # More ranges than processes, so that a process which finishes early takes the next one.
+            num_ranges = min(len(missing), n_jobs * 2)
+            ranges = [
+                missing[len(missing) * i // num_ranges : len(missing) * (i + 1) // num_ranges]
+                for i in range(num_ranges)
+            ]
+            with ProcessPoolExecutor(max_workers=min(n_jobs, num_ranges)) as executor:
+                futures = iter(
+                    [executor.submit(_get_pdf_contents_of_pages, file, pagenos, image_mode) for pagenos in ranges]
+                )
+                analyzed: Iterator[List[Tuple[str, LTItem]]] = iter([])
+                for i in range(num_pages):
+                    page_texts = cached.get(i)
+                    if page_texts is None:
+                        page_texts = next(analyzed, None)
+                        if page_texts is None:
+                            pdf_pages, worker_images = next(futures).result()
+                            images.update(worker_images)
+                            analyzed = iter(pdf_pages)
+                            page_texts = next(analyzed)
+                        page_texts = store(i, images.bind(page_texts))
+                    yield page_texts
+            if cache is not None:
+                cache.finish(key, num_pages=num_pages)
+            return
+    #  parse PDF pages
+    interpreter, device = _create_pdf_interpreter()
+    num_pages = 0
     with get_pdf_pages(file=file, dirname=dirname) as pages:
-        for page in pages:
+        for i, page in enumerate(pages):
+            num_pages += 1
+            if i in cached:
+                yield cached[i]
+                continue
             interpreter.process_page(page)
             layout = device.get_result()
-            pdf_pages.append(parser_pdf_pages(layout_objs=layout._objs))
-    return pdf_pages
+            yield store(i, parser_pdf_pages(layout_objs=layout._objs, image_mode=image_mode, images=images))
+    if cache is not None:
+        cache.finish(key, num_pages=num_pages)
+
+
+def get_pdf_contents(
+    file: Union[FileStorage, str, _io._IOBase],
+    dirname: str = GUMMY_DIR,
+    n_jobs: int = 1,
+    cache: Optional[PDFLayoutCache] = None,
+    image_mode: str = "inline",
+) -> List[List[Tuple[str, LTItem]]]:
+    """Get PDF contents. This is the list version of :func:`iter_pdf_contents <gummy.utils.pdf_utils.iter_pdf_contents>` .
+
+    Args:
+        file (data, str)         : url or path or data of PDF.
+        dirname (str)            : if ``file`` is url, download and save it to ``dirname``. (defalt= ``GUMMY_DIR``)
+        n_jobs (int)             : Number of processes. If ``-1``, use all cores. It is ignored when ``file`` is data. (default= ``1``)
+        cache (PDFLayoutCache)   : Cache of the layout analysis results. (default= ``None``)
+        image_mode (str)         : How to handle images. See :func:`parser_pdf_pages <gummy.utils.pdf_utils.parser_pdf_pages>` . (default= ``"inline"``)
+
+    Returns:
+        list : Each element is a list which contains [text, bbox(x0,y0,x1,y1)]
+
+    Examples:
+        >>> from gummy.utils import PDFLayoutCache, get_pdf_contents
+        >>> pdf_pages = get_pdf_contents("path/to/paper.pdf", n_jobs=-1, cache=PDFLayoutCache())
+    """
+    return list(iter_pdf_contents(file=file, dirname=dirname, n_jobs=n_jobs, cache=cache, image_mode=image_mode))
 
 
 # ========================================
@@ -87,6 +393,18 @@ def get_pdf_contents(file: Union[FileStorage, str, _io._IOBase], dirname: str =
 # ========================================
 
 
+def _add_pdf_object(output: PdfFileWriter, obj: DictionaryObject):
+    """Add ``obj`` to ``output`` , and return its reference. (``_addObject`` is renamed to ``_add_object`` in PyPDF2>=1.28)"""
+    add_object = getattr(output, "_add_object", None) or output._addObject
+    return add_object(obj)
+
+
+def _write_pdf_object(obj: Any, stream: _io._IOBase) -> None:
+    """Serialize ``obj`` to ``stream`` . (``writeToStream`` is renamed to ``write_to_stream`` in PyPDF2>=1.28)"""
+    write_to_stream = getattr(obj, "write_to_stream", None) or obj.writeToStream
+    write_to_stream(stream, None)
+
+
 def createHighlight(
     bbox: Tuple[int, int, int, int] = (0, 0, 1, 1),
     contents: str = "",
@@ -158,8 +476,134 @@ def addHighlightToPage(highlight: DictionaryObject, page: PageObject, output: Pd
         ...     with open("output.pdf", mode="wb") as outPdf:
         ...         pdfOutput.write(outPdf)
     """
-    highlight_ref = output._addObject(highlight)
+    highlight_ref = _add_pdf_object(output, highlight)
     if "/Annots" in page:
         page[NameObject("/Annots")].append(highlight_ref)
     else:
         page[NameObject("/Annots")] = ArrayObject([highlight_ref])
+
+
+def addHighlightsToPage(highlights: List[DictionaryObject], page: PageObject, output: PdfFileWriter):
+    """Add highlights to a page at once.
+
+    Args:
+        highlights (list)      : Each element is a highlight information created by :func:`createHighlight <gummy.utils.pdf_utils.createHighlight>` .
+        page (PageObject)      : A single page within a PDF file.
+        output (PdfFileWriter) : A pdf writer.
+
+    Examples:
+        >>> from gummy.utils import createHighlight, addHighlightsToPage
+        >>> from PyPDF2 import PdfFileWriter, PdfFileReader
+        >>> pdfOutput = PdfFileWriter()
+        >>> with open("input.pdf", mode="rb") as inPdf:
+        ...     pdfInput = PdfFileReader(inPdf)
+        ...     page = pdfInput.getPage(0)
+        ...     highlights = [createHighlight(bbox=bbox, contents="COMMENT") for bbox in [(10,10,90,90), (10,100,90,180)]]
+        ...     addHighlightsToPage(highlights, page, pdfOutput)
+        ...     pdfOutput.addPage(page)
+        ...     with open("output.pdf", mode="wb") as outPdf:
+        ...         pdfOutput.write(outPdf)
+    """
+    if len(highlights) == 0:
+        return
+    highlight_refs = [_add_pdf_object(output, highlight) for highlight in highlights]
+    if "/Annots" in page:
+        page[NameObject("/Annots")].extend(highlight_refs)
+    else:
+        page[NameObject("/Annots")] = ArrayObject(highlight_refs)
+
+
+class PdfIncrementalWriter:
+    """PDF writer which appends only new (or updated) objects and a cross-reference section to the original bytes
+    (an incremental update). Time and memory of writing scale with the number of added objects, not with the size of
+    the document. It can be used instead of ``PdfFileWriter`` in
+    :func:`addHighlightsToPage <gummy.utils.pdf_utils.addHighlightsToPage>` , and only pages passed to
+    :meth:`addPage <gummy.utils.pdf_utils.PdfIncrementalWriter.addPage>` are updated.
+
+    Args:
+        reader (PdfFileReader) : A reader of the original PDF.
+
+    Examples:
+        >>> from gummy.utils import PdfIncrementalWriter, createHighlight, addHighlightsToPage
+        >>> from PyPDF2 import PdfFileReader
+        >>> with open("input.pdf", mode="rb") as inPdf:
+        ...     pdfInput = PdfFileReader(inPdf)
+        ...     pdfOutput = PdfIncrementalWriter(pdfInput)
+        ...     page = pdfInput.getPage(0)
+        ...     addHighlightsToPage([createHighlight(bbox=(10,10,90,90), contents="COMMENT")], page, pdfOutput)
+        ...     pdfOutput.addPage(page)
+        ...     with open("output.pdf", mode="wb") as outPdf:
+        ...         pdfOutput.write(outPdf)
+    """
+
+    TRAILER_KEYS: List[str] = ["/Root", "/Info", "/ID"]
+
+    def __init__(self, reader: PdfFileReader):
+        if reader.isEncrypted:
+            raise ValueError("Incremental update of an encrypted PDF is not supported.")
+        self.reader: PdfFileReader = reader
+        self._size: int = int(reader.trailer["/Size"])
+        self._objects: Dict[int, Tuple[int, Any]] = {}  # {idnum: (generation, object)}
+
+    def _add_object(self, obj: Any) -> IndirectObject:
+        """Add a new object, and return its reference."""
+        idnum = self._size
+        self._size += 1
+        self._objects[idnum] = (0, obj)
+        return IndirectObject(idnum, 0, self.reader)
+
+    _addObject = _add_object
+
+    def addPage(self, page: PageObject) -> None:
+        """Mark ``page`` (and its ``/Annots`` if it is an indirect object) as updated."""
+        ref = page.indirectRef
+        self._objects[ref.idnum] = (ref.generation, page)
+        annots = dict.get(page, "/Annots")
+        if isinstance(annots, IndirectObject):
+            self._objects[annots.idnum] = (annots.generation, annots.getObject())
+
+    @staticmethod
+    def _get_startxref(stream: _io._IOBase) -> int:
+        """Get the offset of the last cross-reference section of the original PDF."""
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        stream.seek(max(size - 1024, 0))
+        tail = stream.read()
+        return int(tail[tail.rindex(b"startxref") + len(b"startxref") :].split()[0])
+
+    def write(self, stream: _io._IOBase) -> None:
+        """Write the original PDF followed by the incremental update to ``stream`` ."""
+        src = self.reader.stream
+        prev = self._get_startxref(src)
+        src.seek(0)
+        for chunk in iter(lambda: src.read(1 << 20), b""):
+            stream.write(chunk)
+        if len(self._objects) == 0:
+            return
+        offset = stream.tell()
+        update = io.BytesIO(b"\n")
+        offsets: Dict[int, Tuple[int, int]] = {}
+        for idnum, (generation, obj) in sorted(self._objects.items()):
+            offsets[idnum] = (offset + update.tell(), generation)
+            update.write(f"{idnum} {generation} obj\n".encode("latin-1"))
+            _write_pdf_object(obj, update)
+            update.write(b"\nendobj\n")
+        startxref = offset + update.tell()
+        # Contiguous object numbers make one subsection. The head of the free list (object 0) comes first, because
+        # some readers expect cross-reference sections to start from it.
+        update.write(b"xref\n0 1\n0000000000 65535 f \n")
+        idnums = sorted(offsets.keys())
+        start = 0
+        for i in range(1, len(idnums) + 1):
+            if i == len(idnums) or idnums[i] != idnums[i - 1] + 1:
+                update.write(f"{idnums[start]} {i-start}\n".encode("latin-1"))
+                for idnum in idnums[start:i]:
+                    update.write(f"{offsets[idnum][0]:010d} {offsets[idnum][1]:05d} n \n".encode("latin-1"))
+                start = i
+        trailer = DictionaryObject({NameObject(k): v for k, v in self.reader.trailer.items() if k in self.TRAILER_KEYS})
+        trailer[NameObject("/Size")] = NumberObject(self._size)
+        trailer[NameObject("/Prev")] = NumberObject(prev)
+        update.write(b"trailer\n")
+        _write_pdf_object(trailer, update)
+        update.write(f"\nstartxref\n{startxref}\n%%EOF\n".encode("latin-1"))
+        stream.write(update.getvalue())
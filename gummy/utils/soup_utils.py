@@ -1,11 +1,66 @@
 # coding: utf-8
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import NavigableString, PageElement, Tag
 
 from .coloring_utils import toACCENT, toBLUE, toGREEN
-from .generic_utils import str_strip
+from .generic_utils import handleKeyError, str_strip
+
+DOCUMENT_TAG_NAMES: List[str] = ["html", "body", "head"]
+SUPPORTED_SOUP_PARSERS: List[str] = ["html.parser", "lxml", "html5lib"]
+_SOUP_PARSER: str = "html.parser"
+
+
+def get_soup_parser(parser: Optional[str] = None) -> str:
+    """Get the parser used by :func:`html2soup <gummy.utils.soup_utils.html2soup>` .
+
+    Args:
+        parser (str) : A parser name. If ``None``, use the global one set by :func:`set_soup_parser <gummy.utils.soup_utils.set_soup_parser>` . (default= ``None`` )
+
+    Returns:
+        str : A parser name.
+    """
+    parser = parser or _SOUP_PARSER
+    handleKeyError(lst=SUPPORTED_SOUP_PARSERS, parser=parser)
+    return parser
+
+
+def set_soup_parser(parser: str) -> None:
+    """Set the global parser used by :func:`html2soup <gummy.utils.soup_utils.html2soup>` .
+
+    - ``"html.parser"`` : Python's builtin parser. (default)
+    - ``"lxml"``        : Very fast C parser. It is several times faster than ``"html.parser"`` on long articles.
+    - ``"html5lib"``    : Parses the page in the same way a web browser does, but it is very slow.
+
+    Args:
+        parser (str) : A parser name.
+
+    Examples:
+        >>> from gummy.utils import set_soup_parser
+        >>> set_soup_parser("lxml")
+    """
+    global _SOUP_PARSER
+    _SOUP_PARSER = get_soup_parser(parser)
+
+
+def html2soup(html: Union[str, bytes], parser: Optional[str] = None) -> BeautifulSoup:
+    """Convert a whole html page to soup.
+
+    Args:
+        html (str, bytes) : A html page.
+        parser (str)      : A parser name. If ``None``, use the global one. See :func:`set_soup_parser <gummy.utils.soup_utils.set_soup_parser>` (default= ``None`` )
+
+    Returns:
+        bs4.BeautifulSoup : A data structure representing a parsed HTML or XML document.
+
+    Examples:
+        >>> from gummy.utils import html2soup
+        >>> html2soup("<title>Translation-Gummy</title>", parser="lxml")
+        <html><head><title>Translation-Gummy</title></head></html>
+    """
+    return BeautifulSoup(markup=html, features=get_soup_parser(parser))
 
 
 def str2soup(string: str) -> BeautifulSoup:
@@ -31,12 +86,115 @@ def str2soup(string: str) -> BeautifulSoup:
         <html><head><title>Translation-Gummy</title></head></html>
     """
     soup = BeautifulSoup(markup=string, features="html5lib")
-    for attr in ["html", "body", "head"]:
+    for attr in DOCUMENT_TAG_NAMES:
         if hasattr(soup, attr) and getattr(soup, attr) is not None:
             getattr(soup, attr).unwrap()
     return soup
 
 
+def _ancestors(element: PageElement, root: Tag) -> List[Tag]:
+    """Get ancestors of ``element`` from its parent up to ``root`` (bottom-up)."""
+    ancestors = []
+    for parent in element.parents:
+        ancestors.append(parent)
+        if parent is root:
+            break
+    return ancestors
+
+
+def _move_contents(parent: Tag, start: int, stop: int, into: Tag) -> None:
+    """Move ``parent.contents[start:stop]`` to the end of ``into``."""
+    elements = []
+    # Extract from the back so that the indexes of the remaining elements do not change.
+    for i in range(stop - 1, start - 1, -1):
+        element = parent.contents[i]
+        element.extract(_self_index=i)
+        elements.append(element)
+    for element in reversed(elements):
+        # Same as :func:`str2soup <gummy.utils.soup_utils.str2soup>`, document-level tags are unwrapped.
+        if element.name in DOCUMENT_TAG_NAMES:
+            _move_contents(parent=element, start=0, stop=len(element.contents), into=into)
+        else:
+            into.append(element)
+
+
+def _cut_between(
+    root: Tag, start: Optional[PageElement], stop: Optional[PageElement], into: Tag, factory: BeautifulSoup
+) -> Tag:
+    """Move all nodes between ``start`` and ``stop`` (both exclusive) in ``root`` into ``into``.
+
+    The result is the same as the one of parsing the html between ``start`` and ``stop`` (``str(root)[end_of_start:start_of_stop]``):
+
+    - Ancestors of ``start`` are closed, so their following siblings are flattened.
+    - Ancestors of ``stop`` are opened, so they are copied (without children) and wrap the preceding siblings of ``stop``.
+
+    Args:
+        root (bs4.element.Tag)          : A tree which contains ``start`` and ``stop``.
+        start (bs4.element.PageElement) : A start node. If ``None``, cut from the beginning of ``root``.
+        stop (bs4.element.PageElement)  : A stop node. If ``None``, cut to the end of ``root``.
+        into (bs4.element.Tag)          : Where the nodes are moved.
+        factory (bs4.BeautifulSoup)     : Used to create the copies of the ancestors of ``stop``.
+
+    Returns:
+        bs4.element.Tag : ``into``
+    """
+    if start is None:
+        # The opening tag of ``root`` is in the range unless it is a document.
+        closed = {id(root)} if isinstance(root, BeautifulSoup) else set()
+    else:
+        closed = {id(parent) for parent in _ancestors(start, root)}
+    opened: List[Tag] = []
+    common: Optional[Tag] = None
+    for parent in [root] if stop is None else _ancestors(stop, root):
+        if id(parent) in closed:
+            common = parent
+            break
+        opened.append(parent)
+    # <--- Close the ancestors of ``start`` ---
+    begin = 0
+    if start is not None:
+        child = start
+        while child.parent is not common:
+            parent = child.parent
+            _move_contents(parent=parent, start=parent.index(child) + 1, stop=len(parent.contents), into=into)
+            child = parent
+        begin = common.index(child) + 1
+    if common is not None:
+        edge = opened[-1] if len(opened) > 0 else stop
+        _move_contents(
+            parent=common, start=begin, stop=len(common.contents) if edge is None else common.index(edge), into=into
+        )
+    # --- END Close the ancestors of ``start`` --->
+    # <--- Open the ancestors of ``stop`` ---
+    container = into
+    for i in reversed(range(len(opened))):
+        parent = opened[i]
+        if parent.name not in DOCUMENT_TAG_NAMES:
+            wrapper = factory.new_tag(
+                name=parent.name, namespace=parent.namespace, nsprefix=parent.prefix, attrs=dict(parent.attrs)
+            )
+            container.append(wrapper)
+            container = wrapper
+        edge = opened[i - 1] if i > 0 else stop
+        _move_contents(
+            parent=parent, start=0, stop=len(parent.contents) if edge is None else parent.index(edge), into=container
+        )
+    # --- END Open the ancestors of ``stop`` --->
+    # Leading whitespaces are also dropped by the parser.
+    if len(into.contents) > 0 and type(into.contents[0]) is NavigableString:
+        text = into.contents[0].lstrip()
+        if len(text) > 0:
+            into.contents[0].replace_with(NavigableString(text))
+        else:
+            into.contents[0].extract(_self_index=0)
+    return into
+
+
+def _is_descendant(element: PageElement, ancestor: Optional[PageElement]) -> bool:
+    """Whether ``element`` is in ``ancestor`` or not."""
+    return ancestor is not None and any(parent is ancestor for parent in element.parents)
+
+
 def split_section(
     section: BeautifulSoup,
     name: Optional[str] = None,
@@ -47,6 +205,16 @@ def split_section(
 ) -> List[BeautifulSoup]:
     """Split ``bs4.BeautifulSoup``.
 
+    Nodes are moved from ``section`` into the split elements instead of being serialized and parsed again,
+    so ``section`` is emptied except for the delimiters. Delimiters inside another delimiter follow it
+    without splitting its contents again.
+
+    .. note::
+        The tree is split as the parser built it. Before, each slice was parsed again with ``html5lib`` , which
+        also normalized invalid nesting (e.g. ``<h2>`` in ``<p>`` built by ``"html.parser"`` or ``"lxml"`` ), and
+        added an empty ``<p></p>`` for each ``</p>`` whose start tag was in the previous slice. Neither happens now,
+        so the results differ from before on such trees. Use ``set_soup_parser("html5lib")`` to get browser-like trees.
+
     Args:
         section (bs4.BeautifulSoup) : A data structure representing a parsed HTML or XML document.
         name (str)                  : A filter on tag name.
@@ -89,20 +257,23 @@ def split_section(
         <p>bbbbbbbbbbbbbbbbbbbbbb</p>
         ]
     """
-    str_section = str(section)
     page_elements = []
     delimiters = section.find_all(name=name, attrs=attrs, recursive=recursive, text=text, **kwargs)
-    # Initialization (Prevent occuring an error when for-loop enter continue at the beginning (i=0))
-    end = 0
-    for i, delimiter in enumerate(delimiters):
-        str_delimiter = str(delimiter)
-        start = str_section.find(str_delimiter)
-        if start == -1:
+    outer = None
+    for delimiter in delimiters:
+        if _is_descendant(delimiter, outer):
+            # The contents of ``outer`` are already in it, so they are not split any more.
+            page_elements.append(BeautifulSoup(markup="", features="html.parser"))
+            page_elements.append(delimiter)
             continue
-        page_elements.append(str2soup(string=str_section[end:start]))
+        page_element = BeautifulSoup(markup="", features="html.parser")
+        page_elements.append(
+            _cut_between(root=section, start=outer, stop=delimiter, into=page_element, factory=page_element)
+        )
         page_elements.append(delimiter)
-        end = start + len(str_delimiter)
-    page_elements.append(str2soup(string=str_section[end:]))
+        outer = delimiter
+    page_element = BeautifulSoup(markup="", features="html.parser")
+    page_elements.append(_cut_between(root=section, start=outer, stop=None, into=page_element, factory=page_element))
     return page_elements
 
 
@@ -116,6 +287,10 @@ def group_soup_with_head(
 ) -> List[BeautifulSoup]:
     """Gouping ``bs4.BeautifulSoup`` based on head.
 
+    Heads and their bodies are moved from ``soup`` into the groups instead of being serialized and parsed again.
+    Heads inside another head are left in it. Copy ``soup`` (``copy.copy``) if it has to be kept as it is.
+    As with :func:`split_section <gummy.utils.soup_utils.split_section>` , invalid nesting is not normalized any more.
+
     Args:
         section (bs4.BeautifulSoup) : A data structure representing a parsed HTML or XML document.
         name (str)                  : A filter on tag name.
@@ -153,27 +328,24 @@ def group_soup_with_head(
         </div>
         </section>]
     """
-    str_soup = str(soup)
+    factory = BeautifulSoup(markup="", features="lxml")
+    heads = []
+    for head in soup.find_all(name=name, attrs=attrs, recursive=recursive, text=text, **kwargs):
+        if len(heads) == 0 or not _is_descendant(head, heads[-1]):
+            heads.append(head)
     sections = []
-    heads = soup.find_all(name=name, attrs=attrs, recursive=recursive, text=text, **kwargs)
-    # Initialization (Prevent occuring an error when for-loop enter continue at the beginning (i=0))
-    end = 0
-    section = BeautifulSoup(markup="", features="lxml").new_tag(name="section")
-    if len(heads) > 0:
-        for i, head in enumerate(heads):
-            str_head = str(head)
-            start = str_soup.find(str_head)
-            if start == -1:
-                continue
-            if i > 0:
-                body = str2soup(string=str_soup[end:start])
-                section.append(body)
-                sections.append(section)
-            end = start + len(str_head)
-            section = BeautifulSoup(markup="", features="lxml").new_tag(name="section")
-            section.append(head)
-        body = str2soup(string=str_soup[end:])
-        section.append(body)
+    for i, head in enumerate(heads):
+        section = factory.new_tag(name="section")
+        # Cut the body before moving the head, because the head marks where the body starts.
+        body = _cut_between(
+            root=soup,
+            start=head,
+            stop=heads[i + 1] if i + 1 < len(heads) else None,
+            into=factory.new_tag(name="section"),
+            factory=factory,
+        )
+        section.append(head)
+        _move_contents(parent=body, start=0, stop=len(body.contents), into=section)
         sections.append(section)
     return sections
 
@@ -398,6 +570,94 @@ def find_target_id(soup, key, name=None, attrs={}, recursive=True, text=None, de
     return id_
 
 
+def compile_soup_tags_matcher(rules: List[Dict[str, Any]]) -> Callable[[Tag, int], int]:
+    """Compile rules (kwargs for ``soup.find_all``) into one matcher.
+
+    Rules whose ``name`` is a string are only tested against tags with that name,
+    and the other rules (e.g. ``name`` is a function) are tested against all tags.
+
+    Args:
+        rules (list) : A list of kwargs for ``soup.find_all`` method.
+
+    Returns:
+        callable : ``matcher(tag, limit)`` returns the index of the first rule (``< limit``) which ``tag`` matches, or ``-1``.
+
+    Examples:
+        >>> from bs4 import BeautifulSoup
+        >>> from gummy.utils import compile_soup_tags_matcher
+        >>> matcher = compile_soup_tags_matcher([{"name": "script"}, {"name": "div", "class_": "ads"}])
+        >>> soup = BeautifulSoup('<div class="ads"><script></script></div>')
+        >>> matcher(soup.div, 2), matcher(soup.script, 2), matcher(soup.div, 1)
+        (1, 0, -1)
+    """
+    named: Dict[str, List[Tuple[int, Callable[[Tag], Any]]]] = {}
+    others: List[Tuple[int, Callable[[Tag], Any]]] = []
+    for i, rule in enumerate(rules):
+        rule = rule.copy()
+        string = rule.pop("string", rule.pop("text", None))
+        strainer = SoupStrainer(string=string, **rule)
+        # ``SoupStrainer.search`` is deprecated since beautifulsoup4 4.13.0 (Replaced by ``match``)
+        match = getattr(strainer, "match", None) or strainer.search
+        if isinstance(rule.get("name"), str):
+            named.setdefault(rule["name"], []).append((i, match))
+        else:
+            others.append((i, match))
+    candidates: Dict[str, List[Tuple[int, Callable[[Tag], Any]]]] = {}
+
+    def matcher(tag: Tag, limit: int) -> int:
+        if tag.name not in candidates:
+            candidates[tag.name] = sorted(named.get(tag.name, []) + others, key=lambda x: x[0])
+        for i, match in candidates[tag.name]:
+            if i >= limit:
+                break
+            if match(tag):
+                return i
+        return -1
+
+    return matcher
+
+
+def decompose_soup_tags(soup: BeautifulSoup, rules: List[Dict[str, Any]]) -> List[int]:
+    """Decompose all tags which match any of ``rules`` in a single traversal.
+
+    The result is the same as the one of decomposing ``soup.find_all(**rule)`` for each rule in order,
+    except that all rules are tested against the tree before decomposition.
+
+    Args:
+        soup (bs4.BeautifulSoup) : A data structure representing a parsed HTML or XML document.
+        rules (list)             : A list of kwargs for ``soup.find_all`` method.
+
+    Returns:
+        list : The number of tags which each rule found.
+
+    Examples:
+        >>> from bs4 import BeautifulSoup
+        >>> from gummy.utils import decompose_soup_tags
+        >>> soup = BeautifulSoup('<div><script></script><div class="ads"><script></script></div><p>Main</p></div>')
+        >>> decompose_soup_tags(soup, rules=[{"name": "script"}, {"name": "div", "class_": "ads"}, {"name": "a"}])
+        [2, 1, 0]
+        >>> soup
+        <html><body><div><p>Main</p></div></body></html>
+    """
+    matcher = compile_soup_tags_matcher(rules)
+    counts = [0] * len(rules)
+    decomposed: List[Tag] = []
+    # A tag in a decomposed tag is only counted by the rules which are applied before (or same as) the outer one.
+    stack = [(child, len(rules)) for child in reversed(soup.contents) if isinstance(child, Tag)]
+    while len(stack) > 0:
+        tag, limit = stack.pop()
+        i = matcher(tag, limit)
+        if i >= 0:
+            counts[i] += 1
+            if limit == len(rules):
+                decomposed.append(tag)
+            limit = i + 1
+        stack.extend((child, limit) for child in reversed(tag.contents) if isinstance(child, Tag))
+    for tag in decomposed:
+        tag.decompose()
+    return counts
+
+
 def kwargs2tag(**kwargs) -> str:
     """Generate a string tag from a ditionary object.
 
@@ -0,0 +1,162 @@
+# coding: utf-8
+"""Utility programs for handling TeX sources (which may be split across many files)."""
+import os
+import posixpath
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from .compress_utils import is_compressed, read_from_compressed
+
+TEX_INPUT_PATTERN = re.compile(r"\\(?:input|include)(?:\s*\{([^{}]+)\}|\s+([^\s{}\\%]+))")
+TEX_SECTION_PATTERN = re.compile(r"\\section\*?\s*[\[{]")
+TEX_COMMENT_PATTERN = re.compile(r"(?<!\\)%.*")
+
+
+def read_tex_files(path: str) -> Dict[str, str]:
+    """Read all TeX files in a (compressed) TeX project.
+
+    Args:
+        path (str) : path/to/compressed_file (e.g. arXiv e-print tarball) or path/to/file.tex
+
+    Returns:
+        dict : Name (path in the project) to TeX source.
+    """
+    if is_compressed("." + path.split(".")[-1]):
+        files = read_from_compressed(path, ext=".tex")
+    else:
+        with open(path, mode="rb") as f:
+            files = [(os.path.basename(path), f.read())]
+    return {posixpath.normpath(name): data.decode("utf-8", errors="replace") for name, data in files}
+
+
+def strip_tex_comments(tex: str) -> str:
+    """Remove comments (from an unescaped ``%`` to the end of the line) from TeX source.
+
+    Examples:
+        >>> from gummy.utils import strip_tex_comments
+        >>> strip_tex_comments("100\\\\% sure. % \\\\input{draft}")
+        '100\\\\% sure. '
+    """
+    return TEX_COMMENT_PATTERN.sub("", tex)
+
+
+def find_main_tex(files: Dict[str, str]) -> str:
+    """Find the main file of a TeX project, which has ``\\documentclass`` and ``\\begin{document}`` .
+    If there are some candidates, the largest one is chosen.
+
+    Args:
+        files (dict) : Name to TeX source. (See :func:`read_tex_files <gummy.utils.tex_utils.read_tex_files>` )
+
+    Returns:
+        str : Name of the main file.
+    """
+    if len(files) == 0:
+        raise ValueError("There are no TeX files.")
+    return max(
+        files.keys(),
+        key=lambda name: (
+            "\\begin{document}" in files[name],
+            "\\documentclass" in files[name],
+            len(files[name]),
+        ),
+    )
+
+
+def inline_tex_inputs(tex: str, files: Dict[str, str], dirname: str = "", max_depth: int = 10, _depth: int = 0) -> str:
+    """Replace ``\\input`` and ``\\include`` with the contents of the files. Files not in ``files`` are left as they are.
+
+    Args:
+        tex (str)       : TeX source.
+        files (dict)    : Name to TeX source. (See :func:`read_tex_files <gummy.utils.tex_utils.read_tex_files>` )
+        dirname (str)   : The directory of the main file, where names in ``\\input`` are relative to.
+        max_depth (int) : The maximum depth of nested inputs. (It also stops inputs which include each other.)
+
+    Returns:
+        str : TeX source without comments, whose inputs are inlined.
+
+    Examples:
+        >>> from gummy.utils import inline_tex_inputs
+        >>> inline_tex_inputs("\\\\input{intro}\\n\\\\include{sec/method}", files={"intro.tex": "Intro", "sec/method.tex": "Method"})
+        'Intro\\nMethod'
+    """
+    tex = strip_tex_comments(tex)
+    if _depth >= max_depth:
+        return tex
+
+    def replace(match: re.Match) -> str:
+        name = (match.group(1) or match.group(2)).strip()
+        for candidate in [name, name + ".tex"]:
+            candidate = posixpath.normpath(posixpath.join(dirname, candidate))
+            if candidate in files:
+                return inline_tex_inputs(
+                    files[candidate], files=files, dirname=dirname, max_depth=max_depth, _depth=_depth + 1
+                )
+        return match.group(0)
+
+    return TEX_INPUT_PATTERN.sub(replace, tex)
+
+
+def assemble_tex_project(path: str) -> str:
+    """Assemble the TeX source of a project into one, by inlining inputs to the main file.
+
+    Args:
+        path (str) : path/to/compressed_file (e.g. arXiv e-print tarball) or path/to/file.tex
+
+    Returns:
+        str : TeX source without comments.
+    """
+    files = read_tex_files(path)
+    main = find_main_tex(files)
+    return inline_tex_inputs(files[main], files=files, dirname=posixpath.dirname(main))
+
+
+def split_tex_sections(tex: str) -> List[str]:
+    """Split the document of TeX source at ``\\section`` . The preamble is dropped.
+
+    Args:
+        tex (str) : TeX source.
+
+    Returns:
+        list : TeX sources. The first one is before the first ``\\section`` (e.g. abstract), and each of the others starts with ``\\section`` .
+
+    Examples:
+        >>> from gummy.utils import split_tex_sections
+        >>> split_tex_sections("\\\\begin{document}Abst\\\\section{Intro}A\\\\subsection{B}C\\\\section*{D}E\\\\end{document}")
+        ['Abst', '\\\\section{Intro}A\\\\subsection{B}C', '\\\\section*{D}E']
+    """
+    start = tex.find("\\begin{document}")
+    if start >= 0:
+        tex = tex[start + len("\\begin{document}") :]
+    end = tex.find("\\end{document}")
+    if end >= 0:
+        tex = tex[:end]
+    starts = [0] + [m.start() for m in TEX_SECTION_PATTERN.finditer(tex)] + [len(tex)]
+    return [tex[s:e] for s, e in zip(starts[:-1], starts[1:]) if s < e]
+
+
+def latex_to_text(tex: str) -> str:
+    """Convert TeX source to plain text with ``pylatexenc`` ."""
+    from pylatexenc.latex2text import LatexNodes2Text
+
+    return LatexNodes2Text().latex_to_text(tex)
+
+
+def tex_sections_to_text(tex_sections: List[str], n_jobs: int = 1) -> List[str]:
+    """Convert TeX sections to plain text.
+
+    ``LatexNodes2Text`` is pure python and CPU-bound, so if ``n_jobs`` is not ``1`` , sections are converted in
+    ``n_jobs`` processes.
+
+    Args:
+        tex_sections (list) : TeX sources. (See :func:`split_tex_sections <gummy.utils.tex_utils.split_tex_sections>` )
+        n_jobs (int)        : Number of processes. If ``-1``, use all cores. (default= ``1``)
+
+    Returns:
+        list : Plain text of each section.
+    """
+    n_jobs = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+    if n_jobs > 1 and len(tex_sections) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tex_sections))) as executor:
+            return list(executor.map(latex_to_text, tex_sections))
+    return [latex_to_text(tex) for tex in tex_sections]
@@ -1,14 +1,15 @@
 # coding: utf-8
 import os
 import sys
+import threading
 import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator, List, Type
 
 import pytest
 from _pytest.config import Config
 from _pytest.config.argparsing import Parser
 
-from data import TestData
-
 try:
     from gummy.utils._warnings import EnvVariableNotDefinedWarning, GummyImprementationWarning
 except ModuleNotFoundError:
@@ -18,6 +19,8 @@ except ModuleNotFoundError:
     print(f"You didn't install 'Translation-Gummy', so add {REPO_DIR} to search path for modules.")
     from gummy.utils._warnings import EnvVariableNotDefinedWarning, GummyImprementationWarning
 
+from data import TestData
+
 
 def pytest_addoption(parser: Parser) -> None:
     parser.addoption(
@@ -35,3 +38,21 @@ def pytest_configure(config: Config) -> None:
 def db():
     database = TestData()
     return database
+
+
+@pytest.fixture
+def http_server() -> Iterator[Callable[[Type[BaseHTTPRequestHandler]], str]]:
+    """Serve a request handler class on a local server, and return its base URL (``http://127.0.0.1:<port>`` ).
+    Servers are shut down at the end of the test."""
+    servers: List[ThreadingHTTPServer] = []
+
+    def serve(handler: Type[BaseHTTPRequestHandler]) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
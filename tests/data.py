@@ -1,5 +1,14 @@
 # coding: utf-8
-from typing import Dict, List
+import json
+import os
+import random
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from gummy import journals
+from bs4 import BeautifulSoup
+from gummy.utils import configure_session, download_utils, html2soup, str2soup
+from gummy.utils._type import T_PAPER_TITLE_CONTENTS
 
 # Journal Data.
 JournalData: Dict[str, List[str]] = {
@@ -236,11 +245,162 @@ SentenceData: Dict[str, str] = dict(
 )
 
 
+# Recorded Journal Pages. (See fixtures/journals/README.md)
+JOURNAL_FIXTURES_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "journals")
+JOURNAL_FIXTURE_EXTS: List[str] = [".html", ".pdf", ".tex"]
+
+
+def load_journal_fixtures(dirname: str = JOURNAL_FIXTURES_DIR) -> Dict[str, List[Tuple[str, Optional[str]]]]:
+    """Collect recorded pages as ``{journal_type: [(path, url), ...]}``"""
+    fixtures: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+    for journal_type in sorted(os.listdir(dirname)) if os.path.isdir(dirname) else []:
+        journal_dir = os.path.join(dirname, journal_type)
+        if journal_type not in journals.TranslationGummyJournalCrawlers:
+            continue
+        urls: Dict[str, str] = {}
+        if os.path.exists(os.path.join(journal_dir, "urls.json")):
+            with open(os.path.join(journal_dir, "urls.json"), mode="r") as f:
+                urls = json.load(f)
+        for fn in sorted(os.listdir(journal_dir)):
+            if os.path.splitext(fn)[1] in JOURNAL_FIXTURE_EXTS:
+                fixtures.setdefault(journal_type, []).append((os.path.join(journal_dir, fn), urls.get(fn)))
+    return fixtures
+
+
+JournalFixtures: Dict[str, List[Tuple[str, Optional[str]]]] = load_journal_fixtures()
+
+
+@contextmanager
+def offline(images_dir: str = os.path.join(JOURNAL_FIXTURES_DIR, "images")) -> Iterator[None]:
+    """Use only recorded images, and refuse all other requests."""
+    cache_dir, ttl = download_utils.IMAGE_CACHE_DIR, download_utils.IMAGE_CACHE_TTL
+    download_utils.IMAGE_CACHE_DIR, download_utils.IMAGE_CACHE_TTL = images_dir, float("inf")
+    configure_session(offline=True)
+    try:
+        yield
+    finally:
+        download_utils.IMAGE_CACHE_DIR, download_utils.IMAGE_CACHE_TTL = cache_dir, ttl
+        configure_session(offline=False)
+
+
+def crawl_fixture(crawler: journals.GummyAbstJournal, path: str, url: Optional[str] = None) -> T_PAPER_TITLE_CONTENTS:
+    """Get contents from a recorded page.
+
+    Args:
+        crawler (GummyAbstJournal) : A journal crawler.
+        path (str)                 : Path to a recorded page (``.html`` , ``.pdf`` or ``.tex`` )
+        url (str)                  : The url where the page was recorded. It is used as a base of relative image urls.
+
+    Returns:
+        tuple (str, dict) : (title, content)
+    """
+    crawler.crawling_logs = {}
+    crawler._store_crawling_logs(url=url or path, cano_url=url)
+    ext = os.path.splitext(path)[1]
+    if ext == ".html":
+        with open(path, mode="rb") as f:
+            soup = html2soup(html=f.read(), parser=crawler.soup_parser)
+        return crawler.get_contents_soup(soup=soup)
+    elif ext == ".pdf":
+        pdf_pages = crawler.get_pdf_source(url=path)
+        return (crawler.get_title_from_pdf(pdf_pages), crawler.get_contents_from_pdf_pages(pdf_pages))
+    elif ext == ".tex":
+        tex_source_sections = crawler.get_tex_source_sections(url=path)
+        title = crawler.get_title_from_tex("".join(tex_source_sections))
+        return (title, crawler.get_contents_from_tex_sections(crawler.get_sections_from_tex(tex_source_sections)))
+    raise ValueError(f"Not supported fixture: {path}")
+
+
+# Former implementations of soup_utils, which serialized the soup and parsed every slice again with html5lib.
+def legacy_split_section(section: BeautifulSoup, **kwargs) -> List[BeautifulSoup]:
+    str_section = str(section)
+    page_elements = []
+    end = 0
+    for delimiter in section.find_all(**kwargs):
+        str_delimiter = str(delimiter)
+        start = str_section.find(str_delimiter)
+        if start == -1:
+            continue
+        page_elements.append(str2soup(string=str_section[end:start]))
+        page_elements.append(delimiter)
+        end = start + len(str_delimiter)
+    page_elements.append(str2soup(string=str_section[end:]))
+    return page_elements
+
+
+def legacy_group_soup_with_head(soup: BeautifulSoup, **kwargs) -> List[BeautifulSoup]:
+    str_soup = str(soup)
+    sections = []
+    end = 0
+    section = BeautifulSoup(markup="", features="lxml").new_tag(name="section")
+    heads = soup.find_all(**kwargs)
+    if len(heads) > 0:
+        for i, head in enumerate(heads):
+            str_head = str(head)
+            start = str_soup.find(str_head)
+            if start == -1:
+                continue
+            if i > 0:
+                section.append(str2soup(string=str_soup[end:start]))
+                sections.append(section)
+            end = start + len(str_head)
+            section = BeautifulSoup(markup="", features="lxml").new_tag(name="section")
+            section.append(head)
+        section.append(str2soup(string=str_soup[end:]))
+        sections.append(section)
+    return sections
+
+
+def make_random_section(seed: int = 0) -> str:
+    """Make a (validly nested) html section with unique ``<img>`` and ``<h2>`` at random depths."""
+    rnd = random.Random(seed)
+    counter = {"img": 0, "h2": 0}
+
+    def text() -> str:
+        return " ".join(rnd.choices(["cell", "gene", "protein", "mice"], k=rnd.randint(1, 4)))
+
+    def unique(name: str) -> str:
+        counter[name] += 1
+        return f'<img src="{counter[name]}.png"/>' if name == "img" else f"<h2>Head {counter[name]}</h2>"
+
+    def inline(depth: int) -> str:
+        html = ""
+        for _ in range(rnd.randint(1, 3)):
+            r = rnd.random()
+            if r < 0.2:
+                html += unique("img")
+            elif r < 0.4 and depth < 2:
+                # <a> in <a> is not valid.
+                tag = rnd.choice(["span", "em", "a"] if depth == 0 else ["span", "em"])
+                html += f"<{tag}>{inline(depth + 1)}</{tag}>"
+            else:
+                html += text()
+        return html
+
+    def block(depth: int) -> str:
+        html = ""
+        for _ in range(rnd.randint(1, 4)):
+            r = rnd.random()
+            if r < 0.3 and depth < 3:
+                tag = rnd.choice(["div", "section", "figure"])
+                html += f"<{tag}>{block(depth + 1)}</{tag}>"
+            elif r < 0.45:
+                html += unique("h2")
+            elif r < 0.55:
+                html += unique("img")
+            else:
+                html += f"<p>{inline(0)}</p>"
+        return html
+
+    return f"<div>{block(0)}</div>"
+
+
 # Save as db.
 class TestData:
     def __init__(self):
         self.journals: Dict[str, List[str]] = JournalData
         self.sentences: Dict[str, str] = SentenceData
+        self.journal_fixtures: Dict[str, List[Tuple[str, Optional[str]]]] = JournalFixtures
 
     def insert_journal(self, journal: str, url: str) -> None:
         self.journals[journal].append(url)
@@ -0,0 +1,21 @@
+# coding: utf-8
+import os
+from typing import Optional
+
+import pytest
+from gummy import journals
+
+from data import JOURNAL_FIXTURES_DIR, JournalFixtures, crawl_fixture, offline
+
+FIXTURES = [(journal_type, path, url) for journal_type, pages in JournalFixtures.items() for path, url in pages]
+
+
+@pytest.mark.skipif(len(FIXTURES) == 0, reason=f"No recorded pages in {JOURNAL_FIXTURES_DIR}")
+@pytest.mark.parametrize("journal_type, path, url", FIXTURES)
+def test_journal_fixtures(journal_type: str, path: str, url: Optional[str]):
+    crawler: journals.GummyAbstJournal = journals.get(identifier=journal_type, verbose=False)
+    with offline(images_dir=os.path.join(JOURNAL_FIXTURES_DIR, "images")):
+        title, texts = crawl_fixture(crawler, path=path, url=url)
+
+    assert len(title) > 0
+    assert len(texts) > 0
@@ -1,10 +1,13 @@
 # coding: utf-8
 import os
+import threading
+from types import SimpleNamespace
+from typing import List
 
 import pytest
 from gummy import gateways, translators
 from gummy.models import TranslationGummy
-from gummy.utils import get_driver
+from gummy.utils import DriverPool, driver_utils, get_driver
 
 from data import JournalData
 
@@ -18,3 +21,77 @@ def test_models(db, gateway: str, translator: str, journal_type: str = "nature")
         # Make HTML & PDF.
         pdfpath: str = gummy.toPDF(url=url, delete_html=True)
         os.remove(pdfpath)
+
+
+def test_translate_chunks():
+    gummy = TranslationGummy.__new__(TranslationGummy)
+    gummy.translator = SimpleNamespace(name="stub", maxsize=5000)
+    gummy.print = lambda *args, **kwargs: None
+    queries: List[str] = []
+    translated = threading.Event()
+
+    def translate_jobs(jobs, **kwargs):
+        for _, query, slot in jobs:
+            queries.append(query.strip())
+            slot["translated"] = query
+        translated.set()
+
+    gummy.translate_jobs = translate_jobs
+
+    def chunks():
+        for page in range(3):
+            yield [{"body": {"raw": f"Page {page}."}}, {"body": {"raw": f"Line {page}."}}]
+            # The first page is translated while the following pages are being analyzed.
+            assert translated.wait(timeout=5)
+
+    contents = gummy.translate_chunks(chunks=chunks(), combine=True)
+    assert queries == [f"Page {page}. Line {page}." for page in range(3)]
+    assert len(contents) == 6
+
+
+@pytest.mark.parametrize("own_driver", [True, False])
+def test_close(own_driver: bool):
+    calls: List[str] = []
+    gummy = TranslationGummy.__new__(TranslationGummy)
+    gummy._driver = SimpleNamespace(quit=lambda: calls.append("driver.quit"))
+    gummy.driver_pool = SimpleNamespace(close=lambda: calls.append("driver_pool.close"))
+    gummy._quit_driver_on_close = own_driver
+    with gummy as model:
+        assert model is gummy
+    gummy.close()
+    # A driver given from the outside is not quit, and the own one is quit only once.
+    if own_driver:
+        assert calls == ["driver_pool.close", "driver.quit", "driver_pool.close"]
+    else:
+        assert calls == ["driver_pool.close", "driver_pool.close"]
+
+
+def test_driver_replaced(monkeypatch):
+    class Driver:
+        def __init__(self):
+            self.alive: bool = True
+            self.quitted: bool = False
+
+        def execute_script(self, script: str) -> int:
+            return 1 if self.alive else 0
+
+        def quit(self) -> None:
+            self.quitted = True
+
+    monkeypatch.setattr(driver_utils, "get_driver", lambda **kwargs: Driver())
+    driver = Driver()
+    gummy = TranslationGummy.__new__(TranslationGummy)
+    gummy._driver = driver
+    gummy._quit_driver_on_close = False
+    gummy.print = lambda *args, **kwargs: None
+    gummy.driver_pool = DriverPool(size=1, driver=driver, verbose=False)
+    assert gummy.driver is driver
+    # The pool drops (and quits) the driver which does not respond, and launches a new one.
+    driver.alive = False
+    with gummy.driver_pool.get() as new_driver:
+        assert new_driver is not driver
+    assert driver.quitted
+    # The model takes it over instead of keeping the dead one.
+    assert gummy.driver is new_driver
+    assert gummy.driver_pool.external is new_driver
+    assert gummy._quit_driver_on_close
@@ -1,6 +1,8 @@
 # coding: utf-8
+from typing import List, Tuple
+
 from gummy import translators
-from gummy.utils import get_driver
+from gummy.utils import TranslationMemory, get_driver, get_translation_memory
 
 
 def _test_translators(db, identifier: str, **kwargs):
@@ -21,3 +23,61 @@ def test_google_translators(db):
 
 def test_deepl_translators(db):
     _test_translators(db=db, identifier="deepl")
+
+
+def test_memory_shared(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        translators, "get_translation_memory", lambda: get_translation_memory(path=str(tmp_path / "m.sqlite3"))
+    )
+    assert translators.get("deepl", use_memory=False).memory is None
+    translator = translators.get("deepl")
+    assert translator._memory is None
+    assert translator.memory is translators.get("deepl").memory
+
+
+def test_pack_queries():
+    translator = translators.get("deepl", maxsize=30, use_memory=False)
+    assert translator.pack_queries(["Hi.", "", "This is a pen.", "That is an apple."]) == [[0, 2], [3]]
+    assert translator.pack_queries(["a" * 100, "b"]) == [[0], [1]]
+
+
+def make_batch_translator(tmp_path, skip: str = ""):
+    """Translator whose ``translate_wrapper`` translates each paragraph as one sentence (and skips ``skip`` )."""
+    translator = translators.get("deepl", maxsize=1000, use_memory=False)
+    translator.memory = TranslationMemory(path=str(tmp_path / "memory.sqlite3"))
+    translator.requested: List[str] = []
+
+    def translate_wrapper(query: str, **kwargs) -> Tuple[List[str], List[str]]:
+        translator.requested.append(query)
+        paragraphs = [p for p in query.split("\n\n") if p != skip or p == query]
+        return (paragraphs, [p if p == translator.batch_delimiter else f"<{p}>" for p in paragraphs])
+
+    translator.translate_wrapper = translate_wrapper
+    return translator
+
+
+def test_translate_wrapper_batch_memory(tmp_path):
+    translator = make_batch_translator(tmp_path)
+    assert translator.translate_wrapper_batch(["Copyright.", "Intro."]) == [
+        (["Copyright."], ["<Copyright.>"]),
+        (["Intro."], ["<Intro.>"]),
+    ]
+    assert len(translator.requested) == 1
+    # Each query hits the memory by itself, even if its neighbours in the pack are different.
+    translator.requested.clear()
+    assert translator.translate_wrapper_batch(["Method.", "Result.", "Copyright."]) == [
+        (["Method."], ["<Method.>"]),
+        (["Result."], ["<Result.>"]),
+        (["Copyright."], ["<Copyright.>"]),
+    ]
+    assert translator.requested == [f"Method.\n\n{translator.batch_delimiter}\n\nResult."]
+
+
+def test_translate_wrapper_batch_missing_sentences(tmp_path):
+    translator = make_batch_translator(tmp_path, skip="Result.")
+    # "Result." gets no sentences in the packed translation, so the queries are translated one by one.
+    assert translator.translate_wrapper_batch(["Method.", "Result."]) == [
+        (["Method."], ["<Method.>"]),
+        (["Result."], ["<Result.>"]),
+    ]
+    assert translator.requested[1:] == ["Method.", "Result."]
@@ -1,11 +1,57 @@
 # coding: utf-8
+import io
+import json
+import os
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
 from typing import List
 
 import pytest
+import requests
+from bs4 import BeautifulSoup
 from gummy import journals
-from gummy.utils import get_driver, whichJournal
+from gummy.utils import (
+    DriverPool,
+    LazyClassRegistry,
+    PDFImageRef,
+    PDFLayoutCache,
+    PdfIncrementalWriter,
+    TranslationMemory,
+    addHighlightsToPage,
+    canonicalize,
+    configure_session,
+    createHighlight,
+    decompose_soup_tags,
+    download_file,
+    download_utils,
+    driver_utils,
+    fetch_image,
+    get_pdf_contents,
+    get_pdf_num_pages,
+    get_driver,
+    get_driver_type,
+    get_jinja_environment,
+    get_translation_memory,
+    group_soup_with_head,
+    html2soup,
+    http_utils,
+    iter_from_compressed,
+    iter_pdf_contents,
+    journal_utils,
+    outfmt_utils,
+    pop_canonical_body,
+    read_from_compressed,
+    set_soup_parser,
+    split_section,
+    tohtml,
+    whichJournal,
+)
+from PyPDF2 import PdfFileReader, PdfFileWriter
 
-from data import JournalData
+from data import JournalData, legacy_group_soup_with_head, legacy_split_section, make_random_section
 
 
 @pytest.mark.parametrize("journal_type", list(JournalData.keys()))
@@ -17,3 +63,613 @@ def test_whichJournal(db, journal_type: str):
             assert whichJournal(url=url, driver=driver) == journal_type
             crawler = journals.get(journal_type)
             assert crawler.journal_type == journal_type
+
+
+def test_TranslationMemory(tmp_path):
+    memory = TranslationMemory(path=str(tmp_path / "memory.sqlite3"), max_entries=2)
+    kwargs = dict(translator="DeepL", from_lang="en", to_lang="ja")
+    assert memory.get(query="This is a pen.", **kwargs) is None
+    memory.set(query="This is a pen.", source_sentences=["This is a pen."], target_sentences=["これはペンです。"], **kwargs)
+    assert memory.get(query=" This  is a pen.", **kwargs) == (["This is a pen."], ["これはペンです。"])
+    assert memory.get(query="This is a pen.", correspond=False, **kwargs) is None
+    assert memory.stats == {"hits": 1, "misses": 2, "entries": 1}
+    for query in ["a", "b"]:
+        memory.set(query=query, source_sentences=[query], target_sentences=[query], **kwargs)
+    assert memory.evict() == 1
+    assert len(memory) == 2
+
+
+def test_get_translation_memory(tmp_path):
+    path = str(tmp_path / "memory.sqlite3")
+    assert get_translation_memory(path=path) is get_translation_memory(path=path)
+    assert get_translation_memory(path=path) is not get_translation_memory(path=str(tmp_path / "other.sqlite3"))
+
+
+def test_DriverPool():
+    class Driver:
+        alive: bool = True
+
+        def execute_script(self, script: str) -> int:
+            return 1 if self.alive else 0
+
+    driver = Driver()
+    pool = DriverPool(size=1, max_uses=1, driver=driver, verbose=False)
+    with pool.get() as d:
+        assert d is driver
+    # An external driver is never recycled.
+    assert pool.acquire(timeout=1) is driver
+    pool.release(driver)
+    pool.close()
+    assert pool.acquire(timeout=1) is driver
+
+
+def test_get_driver_type(tmp_path, monkeypatch):
+    path = tmp_path / "driver_type.json"
+    path.write_text(json.dumps({"driver_type": "remote", "checked_at": time.time()}))
+    monkeypatch.setattr(driver_utils, "DRIVER_TYPE_STATE_PATH", str(path))
+    monkeypatch.setattr(driver_utils, "_DRIVER_TYPE", None)
+    assert get_driver_type() == "remote"
+    assert driver_utils.DRIVER_TYPE == "remote"
+
+
+def test_LazyClassRegistry():
+    registry = LazyClassRegistry({"ordereddict": "collections:OrderedDict"}, group="gummy.test_utils")
+    assert "ordereddict" in registry
+    assert dict.__getitem__(registry, "ordereddict") == "collections:OrderedDict"
+    assert registry.get("ordereddict").__name__ == "OrderedDict"
+    assert isinstance(dict.__getitem__(registry, "ordereddict"), type)
+    assert registry.get("not_registered") is None
+
+
+def test_canonicalize(http_server, monkeypatch):
+    class Handler(BaseHTTPRequestHandler):
+        num_requests: int = 0
+
+        def do_HEAD(self):
+            Handler.num_requests += 1
+            self.send_response(405)
+            self.end_headers()
+
+        def do_GET(self):
+            Handler.num_requests += 1
+            if self.path == "/paper":
+                self.send_response(301)
+                self.send_header("Location", "/articles/paper")
+                self.end_headers()
+            elif self.path == "/large":
+                # Without "Content-Length".
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.wfile.write(b"<html><body>" + b"large " * 100 + b"</body></html>")
+            else:
+                body = b"<html><body>paper</body></html>"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    base_url = http_server(Handler)
+    url = f"{base_url}/paper"
+    cano_url = canonicalize(url)
+    assert cano_url.endswith("/articles/paper")
+    num_requests = Handler.num_requests
+    assert canonicalize(url) == cano_url
+    assert Handler.num_requests == num_requests
+    assert pop_canonical_body(cano_url) == b"<html><body>paper</body></html>"
+    assert pop_canonical_body(url) is None
+    # Bodies larger than MAX_CACHED_BODY_SIZE are not kept, even if the size is not announced.
+    monkeypatch.setattr(journal_utils, "MAX_CACHED_BODY_SIZE", 100)
+    large_url = url.replace("/paper", "/large")
+    assert canonicalize(large_url) == large_url
+    assert pop_canonical_body(large_url) is None
+    # Expired entries are dropped, and the least recently used ones are evicted.
+    monkeypatch.setattr(journal_utils, "MAX_CANONICAL_URL_CACHE_SIZE", 2)
+    canonicalize(url + "?expired", ttl=0)
+    canonicalize(url + "?v=1")
+    assert url + "?expired" not in journal_utils._CANONICAL_URL_CACHE
+    assert list(journal_utils._CANONICAL_URL_CACHE) == [large_url, url + "?v=1"]
+
+
+def test_download_file(http_server, tmp_path):
+    body = b"%PDF-1.4 dummy" * 1000
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    base_url = http_server(Handler)
+    path = download_file(
+        f"{base_url}/paper.pdf",
+        dirname=str(tmp_path),
+        verbose=False,
+        cache_dir=str(tmp_path / "cache"),
+    )
+    with open(path, mode="rb") as f:
+        assert f.read() == body
+
+
+@pytest.mark.parametrize("validator", ["ETag", "Last-Modified"])
+def test_download_file_revalidate(http_server, tmp_path, validator: str):
+    body = b"%PDF-1.4 dummy"
+    value = {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}[validator]
+    condition = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}[validator]
+
+    class Handler(BaseHTTPRequestHandler):
+        num_downloads: int = 0
+
+        def do_GET(self):
+            if self.headers.get(condition) == value:
+                self.send_response(304)
+                self.end_headers()
+                return
+            Handler.num_downloads += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header(validator, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    base_url = http_server(Handler)
+    url = f"{base_url}/paper.pdf"
+    kwargs = dict(dirname=str(tmp_path), verbose=False, cache_dir=str(tmp_path / "cache"))
+    path = download_file(url, **kwargs)
+    # Revalidate, and reuse the downloaded file.
+    assert download_file(url, **kwargs) == path
+    assert Handler.num_downloads == 1
+    # Download again if the file is removed, or it is requested to be saved in another place.
+    os.remove(path)
+    assert download_file(url, **kwargs) == path
+    assert download_file(url, path=str(tmp_path / "other.pdf"), **kwargs) == str(tmp_path / "other.pdf")
+    assert Handler.num_downloads == 3
+    with open(path, mode="rb") as f:
+        assert f.read() == body
+
+
+@pytest.mark.parametrize("n_segments", [1, 4])
+def test_download_file_resume(http_server, tmp_path, monkeypatch, n_segments: int):
+    body = bytes(range(256)) * 256
+    monkeypatch.setattr(download_utils, "DOWNLOAD_SEGMENT_SIZE", 8 * 1024)
+    monkeypatch.setitem(http_utils.HTTP_CONFIG, "retries", 0)
+
+    class Handler(BaseHTTPRequestHandler):
+        ranges: List[str] = []
+
+        def do_GET(self):
+            Handler.ranges.append(self.headers.get("Range"))
+            start, end = 0, len(body)
+            if self.headers.get("Range") is not None and self.headers.get("If-Range") == '"v1"':
+                start, end = [int(e) for e in self.headers["Range"][len("bytes=") :].split("-")]
+                end += 1
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end-1}/{len(body)}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(end - start))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            # The first transfer is interrupted in the middle.
+            self.wfile.write(body[start : end if len(Handler.ranges) > 1 else len(body) // 8])
+
+        def log_message(self, *args):
+            pass
+
+    base_url = http_server(Handler)
+    url = f"{base_url}/paper.pdf"
+    kwargs = dict(dirname=str(tmp_path), verbose=False, cache_dir=str(tmp_path / "cache"), n_segments=n_segments)
+    # Retries are used up, so the interruption is raised (instead of falling back to the browser).
+    with pytest.raises(requests.RequestException):
+        download_file(url, **kwargs)
+    assert os.path.exists(tmp_path / "paper.pdf.part")
+    path = download_file(url, **kwargs)
+    with open(path, mode="rb") as f:
+        assert f.read() == body
+    assert not os.path.exists(path + ".part")
+    assert len(Handler.ranges) == n_segments + 1
+    # Only the rest of the interrupted segment is downloaded again.
+    assert Handler.ranges[-1] == f"bytes={len(body) // 8}-{len(body) // n_segments - 1}"
+
+
+def test_download_file_range_not_satisfiable(http_server, tmp_path, monkeypatch):
+    body = bytes(range(256)) * 64
+    monkeypatch.setitem(http_utils.HTTP_CONFIG, "retries", 0)
+
+    class Handler(BaseHTTPRequestHandler):
+        ranges: List[str] = []
+
+        def do_GET(self):
+            Handler.ranges.append(self.headers.get("Range"))
+            if self.headers.get("Range") is not None:
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            # The first transfer is interrupted in the middle.
+            self.wfile.write(body if len(Handler.ranges) > 1 else body[: len(body) // 2])
+
+        def log_message(self, *args):
+            pass
+
+    url = f"{http_server(Handler)}/paper.pdf"
+    kwargs = dict(dirname=str(tmp_path), verbose=False, cache_dir=str(tmp_path / "cache"))
+    with pytest.raises(requests.RequestException):
+        download_file(url, **kwargs)
+    # The recorded range is rejected, so the whole file is downloaded again without using up a retry.
+    path = download_file(url, **kwargs)
+    with open(path, mode="rb") as f:
+        assert f.read() == body
+    assert Handler.ranges == [None, f"bytes={len(body) // 2}-{len(body) - 1}", None]
+
+
+def test_fetch_image(http_server, tmp_path):
+    class Handler(BaseHTTPRequestHandler):
+        num_downloads: int = 0
+
+        def do_GET(self):
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            Handler.num_downloads += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            self.wfile.write(b"PNG")
+
+        def log_message(self, *args):
+            pass
+
+    base_url = http_server(Handler)
+    url = f"{base_url}/fig1.png"
+    assert fetch_image(url, cache_dir=str(tmp_path)) == b"PNG"
+    assert fetch_image(url, cache_dir=str(tmp_path)) == b"PNG"
+    # Revalidate with "If-None-Match", and reuse the cached image.
+    assert fetch_image(url, cache_dir=str(tmp_path), ttl=0) == b"PNG"
+    assert Handler.num_downloads == 1
+    # Threads updating the same cache entry do not clobber each other's temporary files.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert (
+            list(executor.map(lambda _: fetch_image(url, cache_dir=str(tmp_path), ttl=0), range(16))) == [b"PNG"] * 16
+        )
+    assert not [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith(".tmp")]
+
+
+@pytest.mark.parametrize("ext", [".zip", ".tar.gz"])
+def test_read_from_compressed(tmp_path, ext: str):
+    files = {"src/main.tex": b"\\section{Intro}", "src/fig.png": b"\x89PNG", "src/appendix.tex": b"\\appendix"}
+    path = str(tmp_path / f"src{ext}")
+    if ext == ".zip":
+        with zipfile.ZipFile(path, mode="w") as f:
+            for name, data in files.items():
+                f.writestr(name, data)
+    else:
+        with tarfile.open(path, mode="w:gz") as f:
+            info = tarfile.TarInfo("src")
+            info.type = tarfile.DIRTYPE
+            f.addfile(info)
+            for name, data in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                f.addfile(info, io.BytesIO(data))
+    assert [(name, f.read()) for name, f in iter_from_compressed(path)] == list(files.items())
+    assert read_from_compressed(path, ext=".tex") == [
+        ("src/main.tex", files["src/main.tex"]),
+        ("src/appendix.tex", files["src/appendix.tex"]),
+    ]
+    assert read_from_compressed(path, ext=".tex", max_files=1) == [("src/main.tex", files["src/main.tex"])]
+    assert read_from_compressed(path, ext=".pdf") == []
+    # Nothing is extracted to the disk.
+    assert os.listdir(tmp_path) == [f"src{ext}"]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_get_tex_source_sections(tmp_path, n_jobs: int):
+    files = {
+        "paper/macros.tex": b"\\newcommand{\\gummy}{Gummy}",
+        "paper/main.tex": (
+            b"\\documentclass{article}\n\\input{macros}\n\\begin{document}\nWe propose a method.\n"
+            b"\\input{sections/intro}\n% \\input{sections/draft}\n\\include{sections/method}\n\\end{document}"
+        ),
+        "paper/sections/intro.tex": b"\\section{Introduction}\nTranslation is \\textbf{hard}.",
+        "paper/sections/method.tex": b"\\section{Method}\nWe use 100\\% of it.\n\\subsection{Details}\nSee below.",
+        "paper/sections/draft.tex": b"\\section{Draft}\nNot yet.",
+    }
+    path = str(tmp_path / "2012.00001.tar.gz")
+    with tarfile.open(path, mode="w:gz") as f:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            f.addfile(info, io.BytesIO(data))
+    crawler = journals.get("arxiv", verbose=False)
+    crawler.tex_n_jobs = n_jobs
+    tex_source_sections = crawler.get_tex_source_sections(url=path)
+    assert len(tex_source_sections) == 3
+    assert tex_source_sections[0].strip() == "We propose a method."
+    assert "INTRODUCTION" in tex_source_sections[1] and "hard" in tex_source_sections[1]
+    assert "METHOD" in tex_source_sections[2] and "100% of it" in tex_source_sections[2]
+    assert "Draft" not in "".join(tex_source_sections)
+    assert crawler.get_tex_source(url=path) == "".join(tex_source_sections)
+    sections = crawler.get_sections_from_tex(tex_source_sections)
+    assert [section.strip() for section in sections] == [
+        section.strip() for section in crawler.get_sections_from_tex("".join(tex_source_sections))
+    ]
+    assert [section.split("\n")[0].strip() for section in sections[1:]] == ["INTRODUCTION", "METHOD", "Details"]
+
+
+def test_get_jinja_environment(tmp_path, monkeypatch):
+    monkeypatch.setattr(outfmt_utils, "JINJA_CACHE_DIR", str(tmp_path / "jinja2"))
+    monkeypatch.setattr(outfmt_utils, "_JINJA_ENVIRONMENTS", {})
+    searchpath = tmp_path / "templates"
+    searchpath.mkdir()
+    (searchpath / "paper.html").write_text("<h1>{{ title }}</h1>")
+    env = get_jinja_environment(searchpath=str(searchpath))
+    assert get_jinja_environment(searchpath=str(searchpath) + os.sep) is env
+
+    def render(title: str) -> str:
+        path = tohtml(path=str(tmp_path / "paper.html"), title=title, searchpath=str(searchpath), verbose=False)
+        with open(path, mode="r", encoding="utf-8") as f:
+            return f.read()
+
+    assert render("Gummy") == "<h1>Gummy</h1>"
+    template = env.get_template("paper.html")
+    assert render("Translation") == "<h1>Translation</h1>"
+    # The template is compiled once, and its bytecode is shared with other environments (e.g. in other processes.)
+    assert env.get_template("paper.html") is template
+    assert len(os.listdir(tmp_path / "jinja2")) == 1
+    # It is compiled again only when it is modified.
+    (searchpath / "paper.html").write_text("<h2>{{ title }}</h2>")
+    mtime = os.path.getmtime(searchpath / "paper.html") + 10
+    os.utime(searchpath / "paper.html", (mtime, mtime))
+    assert render("Gummy") == "<h2>Gummy</h2>"
+    assert env.get_template("paper.html") is not template
+
+
+def test_split_section():
+    section = BeautifulSoup(
+        '<section><div><h2>Title</h2><div><p>aaa</p><div><img src="a.png"/></div><p>bbb</p></div></div>'
+        '<p>ccc<img src="b.png"/></p></section>',
+        features="html5lib",
+    ).find(name="section")
+    elements = split_section(section, name="img")
+    assert [str(e) for e in elements] == [
+        "<section><div><h2>Title</h2><div><p>aaa</p><div></div></div></div></section>",
+        '<img src="a.png"/>',
+        "<p>bbb</p><p>ccc</p>",
+        '<img src="b.png"/>',
+        "",
+    ]
+
+
+def test_group_soup_with_head():
+    soup = BeautifulSoup(
+        "<div><p>intro</p><h2>AAA</h2><p>aaa</p><div><h2>BBB</h2><p>bbb</p></div><p>ccc</p></div>",
+        features="html5lib",
+    ).find(name="div")
+    sections = group_soup_with_head(soup, name="h2")
+    assert [str(e) for e in sections] == [
+        "<section><h2>AAA</h2><p>aaa</p><div></div></section>",
+        "<section><h2>BBB</h2><p>bbb</p><p>ccc</p></section>",
+    ]
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml", "html5lib"])
+def test_soup_utils_compatibility(parser: str):
+    # Same as the former implementations on validly nested trees, except for the empty <p></p> html5lib added for
+    # each "</p>" at the beginning of a slice.
+    for seed in range(50):
+        html = make_random_section(seed)
+        for legacy, current, kwargs in [
+            (legacy_split_section, split_section, dict(name="img")),
+            (legacy_group_soup_with_head, group_soup_with_head, dict(name="h2")),
+        ]:
+            expected = [str(e).replace("<p></p>", "") for e in legacy(BeautifulSoup(html, parser).div, **kwargs)]
+            actual = [str(e).replace("<p></p>", "") for e in current(BeautifulSoup(html, parser).div, **kwargs)]
+            assert actual == expected, html
+
+
+def test_decompose_soup_tags():
+    html = (
+        '<div><script>x</script><div id="ads"><script>y</script><button>Buy</button><div id="ads">ad</div></div>'
+        "<p>Main<sup><a>1</a></sup><button>Share</button></p></div>"
+    )
+    rules = [
+        {"name": "script"},
+        {"name": "div", "attrs": {"id": "ads"}},
+        {"name": lambda tag: tag.name == "sup" and tag.find(name="a") is not None},
+        {"name": "button"},
+        {"name": "style"},
+    ]
+    soup = BeautifulSoup(html, features="html.parser")
+    expected = []
+    for rule in rules:
+        tags = soup.find_all(**rule)
+        expected.append(len(tags))
+        for tag in tags:
+            tag.decompose()
+    compiled = BeautifulSoup(html, features="html.parser")
+    assert decompose_soup_tags(compiled, rules=rules) == expected == [2, 2, 1, 1, 0]
+    assert str(compiled) == str(soup) == "<div><p>Main</p></div>"
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml", "html5lib"])
+def test_html2soup(parser: str):
+    html = b"<html><body><div id='main'><p>aaa<p>bbb</div></body></html>"
+    assert html2soup(html, parser=parser).find(name="div", id="main").get_text() == "aaabbb"
+    set_soup_parser(parser)
+    try:
+        assert html2soup(html).builder.NAME == parser
+    finally:
+        set_soup_parser("html.parser")
+    with pytest.raises(KeyError):
+        html2soup(html, parser="unknown")
+
+
+def test_offline_session():
+    session = configure_session(offline=True)
+    try:
+        with pytest.raises(requests.ConnectionError):
+            session.get("http://127.0.0.1:1/")
+    finally:
+        configure_session(offline=False)
+
+
+@pytest.mark.parametrize("installed", [[], ["brotli"], ["brotlicffi"]])
+def test_get_accept_encoding(monkeypatch, installed: List[str]):
+    monkeypatch.setattr(http_utils.importlib.util, "find_spec", lambda name: object() if name in installed else None)
+    assert http_utils.get_accept_encoding() == "gzip, deflate" + (", br" if installed else "")
+
+
+def make_pdf(path: str, texts: List[str], logo: bool = False) -> str:
+    """Make a simple PDF whose i-th page shows ``texts[i]`` (and the same image on every page if ``logo``)"""
+    n = len(texts)
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{4+2*i} 0 R' for i in range(n))}] /Count {n} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(texts):
+        stream = f"BT /F1 24 Tf 72 720 Td ({text}) Tj ET" + (" q 10 0 0 10 500 700 cm /Im1 Do Q" if logo else "")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {5+2*i} 0 R "
+            f"/Resources << /Font << /F1 3 0 R >> /XObject << /Im1 {4+2*n} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append(
+        "<< /Type /XObject /Subtype /Image /Width 2 /Height 2 /ColorSpace /DeviceGray /BitsPerComponent 8 "
+        "/Length 4 >>\nstream\nlogo\nendstream"
+    )
+    pdf, offsets = "%PDF-1.4\n", []
+    for i, obj in enumerate(objects):
+        offsets.append(len(pdf))
+        pdf += f"{i+1} 0 obj\n{obj}\nendobj\n"
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects)+1}\n0000000000 65535 f \n" + "".join(f"{o:010d} 00000 n \n" for o in offsets)
+    pdf += f"trailer\n<< /Size {len(objects)+1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    with open(path, mode="w") as f:
+        f.write(pdf)
+    return path
+
+
+def test_get_pdf_contents(tmp_path):
+    texts = [f"Page {i}" for i in range(5)]
+    path = make_pdf(str(tmp_path / "sample.pdf"), texts=texts)
+    pdf_pages = get_pdf_contents(path)
+    assert [page[0][0].strip() for page in pdf_pages] == texts
+    assert get_pdf_contents(path, n_jobs=2) == pdf_pages
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_iter_pdf_contents(tmp_path, n_jobs: int):
+    texts = [f"Page {i}" for i in range(5)]
+    path = make_pdf(str(tmp_path / "sample.pdf"), texts=texts)
+    assert get_pdf_num_pages(path) == len(texts)
+    pdf_gen = iter_pdf_contents(path, n_jobs=n_jobs)
+    assert [page[0][0].strip() for page in pdf_gen] == texts
+    # Contents of each page are yielded in the same way as the list version.
+    crawler = journals.get("pdf", verbose=False)
+    chunks = list(crawler.iter_contents(url=path))
+    assert [chunk[0]["head"] for chunk in chunks] == [f"Page.{i+1}/{len(texts)}" for i in range(len(texts))]
+    assert crawler.crawling_logs["title"] == "sample"
+    assert sum(chunks, []) == crawler.get_contents(url=path)[1]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_PDFLayoutCache(tmp_path, n_jobs: int):
+    texts = [f"Page {i}" for i in range(4)]
+    path = make_pdf(str(tmp_path / "sample.pdf"), texts=texts)
+    expected = get_pdf_contents(path)
+    cache = PDFLayoutCache(path=str(tmp_path / "cache.sqlite3"), max_entries=1)
+    # Stop in the middle, and the analyzed pages are reused.
+    pdf_gen = iter_pdf_contents(path, cache=cache)
+    next(pdf_gen)
+    pdf_gen.close()
+    assert cache.stats == {"hits": 0, "misses": 1, "entries": 1}
+    assert get_pdf_contents(path, n_jobs=n_jobs, cache=cache) == expected
+    assert cache.stats == {"hits": 1, "misses": 4, "entries": 1}
+    assert get_pdf_contents(path, n_jobs=n_jobs, cache=cache) == expected
+    assert cache.stats == {"hits": 5, "misses": 4, "entries": 1}
+    # Another file content is another entry, and the least recently used one is evicted.
+    other = make_pdf(str(tmp_path / "other.pdf"), texts=texts[:2])
+    assert get_pdf_contents(other, cache=cache) == get_pdf_contents(other)
+    assert cache.evict() == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_pdf_image_mode(tmp_path, n_jobs: int):
+    path = make_pdf(str(tmp_path / "sample.pdf"), texts=["Page 0", "Page 1", "Page 2"], logo=True)
+    inline = get_pdf_contents(path, image_mode="inline")
+    assert [len(page) for page in inline] == [2, 2, 2]
+    assert len(set(page[1][0] for page in inline)) == 1
+    assert [len(page) for page in get_pdf_contents(path, image_mode="none")] == [1, 1, 1]
+    cache = PDFLayoutCache(path=str(tmp_path / "cache.sqlite3"))
+    for _ in range(2):
+        pdf_pages = get_pdf_contents(path, n_jobs=n_jobs, cache=cache, image_mode="ref")
+        refs = [page[1][0] for page in pdf_pages]
+        assert all(isinstance(ref, PDFImageRef) for ref in refs)
+        # The logo on every page is stored only once, and rendered to the same <img> tag as "inline" mode.
+        assert len(set(id(ref.store) for ref in refs)) == 1 and len(refs[0].store) == 1
+        assert [str(ref) for ref in refs] == [page[1][0] for page in inline]
+        assert [page[0] for page in pdf_pages] == [page[0] for page in inline]
+    assert cache.stats["hits"] == 3
+
+
+def test_addHighlightsToPage(tmp_path):
+    path = make_pdf(str(tmp_path / "sample.pdf"), texts=["Page 0"])
+    pdfOutput = PdfFileWriter()
+    with open(path, mode="rb") as inPdf:
+        page = PdfFileReader(inPdf).getPage(0)
+        highlights = [createHighlight(bbox=(0, 10 * i, 10, 10 * i + 5), contents=f"{i}") for i in range(3)]
+        addHighlightsToPage(highlights, page, pdfOutput)
+        addHighlightsToPage([], page, pdfOutput)
+        pdfOutput.addPage(page)
+        with open(tmp_path / "out.pdf", mode="wb") as outPdf:
+            pdfOutput.write(outPdf)
+    with open(tmp_path / "out.pdf", mode="rb") as f:
+        annots = PdfFileReader(f).getPage(0)["/Annots"]
+        assert [annot.getObject()["/Contents"] for annot in annots] == ["0", "1", "2"]
+
+
+def test_PdfIncrementalWriter(tmp_path):
+    path = make_pdf(str(tmp_path / "sample.pdf"), texts=["Page 0", "Page 1", "Page 2"])
+    with open(path, mode="rb") as f:
+        original = f.read()
+    out_path = str(tmp_path / "out.pdf")
+    with open(path, mode="rb") as inPdf:
+        pdfInput = PdfFileReader(inPdf)
+        pdfOutput = PdfIncrementalWriter(pdfInput)
+        page = pdfInput.getPage(1)
+        addHighlightsToPage([createHighlight(bbox=(0, 0, 10, 10), contents="COMMENT")], page, pdfOutput)
+        pdfOutput.addPage(page)
+        with open(out_path, mode="wb") as outPdf:
+            pdfOutput.write(outPdf)
+    with open(out_path, mode="rb") as f:
+        # The original bytes are kept as they are.
+        assert f.read(len(original)) == original
+        pdf = PdfFileReader(f)
+        assert pdf.getNumPages() == 3
+        assert "/Annots" not in pdf.getPage(0)
+        assert [annot.getObject()["/Contents"] for annot in pdf.getPage(1)["/Annots"]] == ["COMMENT"]